@@ -0,0 +1,82 @@
+"""Compares serial and thread-parallel compilation of a synthetic model.
+
+Run from the repository root:
+
+    python -m benchmarks.compile_threads --classes 5000 --workers 1 2 4 8
+
+Threads only compile in parallel on free-threaded builds (3.13t and later).
+With the GIL they measured about 0.8x the serial speed, so the compiler falls
+back to serial compilation and every run measures about the same. Pass
+--force-threads to measure the thread pool on a GIL build anyway:
+
+    python -m benchmarks.compile_threads --workers 4 --force-threads
+"""
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from benchmarks.synthetic_model import ModelSpec, build_model
+from py2ts_generator.model.model import Model
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    CaseFormat,
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+    is_gil_enabled,
+)
+
+
+def time_compile(
+    model: Model, max_workers: Optional[int], repeat: int, force_threads: bool
+) -> float:
+    settings = TypescriptModelCompilerSettings(field_case_format=CaseFormat.CAMEL_CASE)
+    best = float("inf")
+    for _ in range(repeat):
+        compiler = TypescriptModelCompiler(
+            settings, max_workers=max_workers, force_threads=force_threads
+        )
+        start = time.perf_counter()
+        compiler.compile(model)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=5000)
+    parser.add_argument("--fields", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument(
+        "--force-threads",
+        action="store_true",
+        help="compile on the thread pool even while the GIL is enabled",
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"{sys.version.split()[0]},"
+        f" GIL {'enabled' if is_gil_enabled() else 'disabled'}"
+    )
+    synthetic_model = build_model(
+        ModelSpec(class_count=args.classes, fields_per_class=args.fields)
+    )
+    model = ModelParser(
+        synthetic_model.roots, [DataclassParser()], ModelParserSettings()
+    ).parse()
+    serial = time_compile(model, None, args.repeat, False)
+    print(f"serial      {serial * 1000:8.1f} ms")
+    for workers in args.workers:
+        threaded = time_compile(model, workers, args.repeat, args.force_threads)
+        print(
+            f"{workers:2d} threads  {threaded * 1000:8.1f} ms"
+            f"  speedup {serial / threaded:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
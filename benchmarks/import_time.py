@@ -0,0 +1,130 @@
+"""Measures the import time of the generator package and of its submodules.
+
+Run from the repository root:
+
+    python -m benchmarks.import_time --repeat 5 --output import_time.json
+
+Every import runs in a fresh interpreter with -X importtime. Cold imports use
+an empty bytecode cache, so every module, including the standard library, is
+compiled again, while warm imports reuse the cache filled by the cold one.
+"""
+import argparse
+import json
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+import py2ts_generator
+from py2ts_generator import __version__
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    self_time: float
+    cumulative_time: float
+
+
+def parse_import_times(stderr: str) -> List[ImportTime]:
+    """Parses the -X importtime report, times are in seconds."""
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative_time, module = line.split(":", 1)[1].split("|")
+        times.append(
+            ImportTime(
+                module=module.strip(),
+                self_time=int(self_time) / 1e6,
+                cumulative_time=int(cumulative_time) / 1e6,
+            )
+        )
+    return times
+
+
+def import_in_subprocess(module: str, pycache_prefix: str) -> List[ImportTime]:
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": pycache_prefix}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_import_times(result.stderr)
+
+
+def total_time(module: str, times: List[ImportTime]) -> float:
+    # The module is reported last, once all of its imports are done.
+    return next(x.cumulative_time for x in reversed(times) if x.module == module)
+
+
+def measure_import(
+    module: str, repeat: int, pycache_prefix: Optional[str] = None
+) -> Dict[str, object]:
+    """Cold and best warm import time of a module, and its slowest imports.
+
+    :param pycache_prefix: Bytecode cache to start from, a new empty one by
+        default, so the first import is cold.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        prefix = pycache_prefix or directory
+        cold = import_in_subprocess(module, prefix)
+        warm_runs = [import_in_subprocess(module, prefix) for _ in range(repeat)]
+    warm = min(warm_runs, key=lambda x: total_time(module, x))
+    slowest = sorted(warm, key=lambda x: x.self_time, reverse=True)[:10]
+    return {
+        "cold": total_time(module, cold),
+        "warm": total_time(module, warm),
+        "imported_modules": len(warm),
+        "slowest_imports": [asdict(x) for x in slowest],
+    }
+
+
+def package_modules() -> List[str]:
+    modules = [py2ts_generator.__name__]
+    for module in pkgutil.walk_packages(
+        py2ts_generator.__path__, py2ts_generator.__name__ + "."
+    ):
+        if not module.name.endswith("__main__"):
+            modules.append(module.name)
+    return modules
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        help="Modules to import, the package and all of its submodules by default.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON file for the results.")
+    args = parser.parse_args(argv)
+
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "generator_version": __version__,
+        "repeat": args.repeat,
+        "modules": {
+            module: measure_import(module, args.repeat)
+            for module in args.modules or package_modules()
+        },
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
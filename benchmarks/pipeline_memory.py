@@ -0,0 +1,172 @@
+"""Measures the memory of every pipeline stage on a synthetic model.
+
+Run from the repository root:
+
+    python -m benchmarks.pipeline_memory --classes 5000 --fields 10 --output memory.json
+
+Stages run one after the other, on the output of the previous one, as in a
+pipeline run. Every stage reports the peak of the memory traced by
+tracemalloc while it runs, the memory kept alive by its result and the
+peak RSS of the process once it finished. Peak RSS only grows, and is
+measured in a pass without tracemalloc, which doubles the memory of traced
+allocations.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic_model import DATACLASS, SQLALCHEMY, ModelSpec, build_model
+from py2ts_generator import __version__
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.class_parsers.sqlalchemy_parser import (
+    SQLAlchemyParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.typescript_emitter.typescript_emitter import TypescriptEmitter
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover, e.g. on Windows
+    resource = None  # type: ignore
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of the process in bytes, if available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _stages(spec: ModelSpec) -> List[Callable[[Any], Any]]:
+    parsers = [DataclassParser(), SQLAlchemyParser()]
+    settings = TypescriptModelCompilerSettings()
+    return [
+        lambda _: build_model(spec),
+        lambda synthetic_model: ModelParser(
+            synthetic_model.roots, parsers, ModelParserSettings()
+        ).parse(),
+        lambda model: TypescriptModelCompiler(settings).compile(model),
+        lambda ts_model: TypescriptEmitter().emit(ts_model),
+    ]
+
+
+STAGE_NAMES = ["build", "parse", "compile", "emit"]
+
+
+def measure_rss(spec: ModelSpec) -> Dict[str, Optional[int]]:
+    results: Dict[str, Optional[int]] = {"start": peak_rss()}
+    value: Any = None
+    for name, stage in zip(STAGE_NAMES, _stages(spec)):
+        value = stage(value)
+        results[name] = peak_rss()
+    return results
+
+
+def measure_traced(spec: ModelSpec) -> Dict[str, Dict[str, int]]:
+    results = {}
+    values: List[Any] = [None]
+    tracemalloc.start()
+    try:
+        for name, stage in zip(STAGE_NAMES, _stages(spec)):
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            # Inputs stay alive, as in a pipeline run, so the retained memory
+            # is the one of the stage result alone.
+            values.append(stage(values[-1]))
+            peak = tracemalloc.get_traced_memory()[1]
+            gc.collect()
+            results[name] = {
+                "peak": peak - before,
+                "retained": tracemalloc.get_traced_memory()[0] - before,
+            }
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def benchmark_memory(spec: ModelSpec) -> Dict[str, Any]:
+    rss = measure_rss(spec)
+    gc.collect()
+    traced = measure_traced(spec)
+    classes = spec.class_count + spec.tagged_union_count * (
+        spec.tagged_union_fanout + 1
+    )
+    fields = spec.class_count * spec.fields_per_class
+    # Both ratios divide the whole retained memory, the split of a model into
+    # a size per class and per field is checked by the memory budget tests.
+    return {
+        "spec": asdict(spec),
+        "peak_rss": rss,
+        "stages": traced,
+        "retained_per_class": {
+            name: traced[name]["retained"] / classes for name in STAGE_NAMES
+        },
+        "retained_per_field": {
+            name: traced[name]["retained"] / fields if fields else None
+            for name in STAGE_NAMES
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    defaults = ModelSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--flavor", choices=[DATACLASS, SQLALCHEMY], default=defaults.flavor
+    )
+    parser.add_argument("--classes", type=int, default=defaults.class_count)
+    parser.add_argument("--fields", type=int, default=defaults.fields_per_class)
+    parser.add_argument("--depth", type=int, default=defaults.nesting_depth)
+    parser.add_argument(
+        "--generic-density", type=float, default=defaults.generic_density
+    )
+    parser.add_argument("--enums", type=int, default=defaults.enum_count)
+    parser.add_argument("--enum-size", type=int, default=defaults.enum_size)
+    parser.add_argument("--unions", type=int, default=defaults.tagged_union_count)
+    parser.add_argument(
+        "--union-fanout", type=int, default=defaults.tagged_union_fanout
+    )
+    parser.add_argument("--output", help="JSON file for the results.")
+    args = parser.parse_args(argv)
+
+    spec = ModelSpec(
+        flavor=args.flavor,
+        class_count=args.classes,
+        fields_per_class=args.fields,
+        nesting_depth=args.depth,
+        generic_density=args.generic_density,
+        enum_count=args.enums,
+        enum_size=args.enum_size,
+        tagged_union_count=args.unions,
+        tagged_union_fanout=args.union_fanout,
+    )
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "generator_version": __version__,
+        **benchmark_memory(spec),
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Times every pipeline stage and whole runs on a synthetic model.
+
+Run from the repository root:
+
+    python -m benchmarks.pipeline_stages --classes 2000 --fields 10 --output results.json
+
+Every stage runs on its own, on the output of the previous one, and the
+pipeline runs end to end into a temporary directory. Results are written as
+JSON, to stdout by default.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic_model import DATACLASS, SQLALCHEMY, ModelSpec, build_model
+from py2ts_generator import __version__
+from py2ts_generator.fingerprint.fingerprint import compute_model_fingerprint
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.class_parsers.sqlalchemy_parser import (
+    SQLAlchemyParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.typescript_emitter.typescript_emitter import TypescriptEmitter
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {
+        "best": min(timings),
+        "mean": statistics.mean(timings),
+        "max": max(timings),
+    }
+
+
+def benchmark_stages(spec: ModelSpec, repeat: int) -> Dict[str, Any]:
+    start = time.perf_counter()
+    synthetic_model = build_model(spec)
+    build_time = time.perf_counter() - start
+    parsers = [DataclassParser(), SQLAlchemyParser()]
+
+    def parse():
+        return ModelParser(
+            synthetic_model.roots, parsers, ModelParserSettings()
+        ).parse()
+
+    model = parse()
+    settings = TypescriptModelCompilerSettings()
+    ts_model = TypescriptModelCompiler(settings).compile(model)
+    output = TypescriptEmitter().emit(ts_model)
+    stages = {
+        "parse": measure(parse, repeat),
+        "fingerprint": measure(lambda: compute_model_fingerprint(model, {}), repeat),
+        "compile": measure(
+            lambda: TypescriptModelCompiler(settings).compile(model), repeat
+        ),
+        "emit": measure(lambda: TypescriptEmitter().emit(ts_model), repeat),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        output_file = os.path.join(directory, "synthetic.ts")
+        pipeline = (
+            TypeGenerationPipelineBuilder()
+            .for_types(synthetic_model.roots)
+            .to_file(output_file)
+            .build()
+        )
+        reports = []
+
+        def run():
+            # Without the output, every run generates it from scratch.
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            reports.append(pipeline.run())
+
+        end_to_end = measure(run, repeat)
+
+    return {
+        "spec": asdict(spec),
+        "model": {
+            "build_time": build_time,
+            "classes": len(model.classes),
+            "enums": len(model.enums),
+            "fields": sum(len(x.fields) for x in model.classes),
+            "output_size": len(output.encode("utf-8")),
+        },
+        "stages": stages,
+        "end_to_end": end_to_end,
+        "end_to_end_stages": {
+            stage: timing.wall_time for stage, timing in reports[-1].stages.items()
+        },
+        "counters": reports[-1].counters,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    defaults = ModelSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--flavor", choices=[DATACLASS, SQLALCHEMY], default=defaults.flavor
+    )
+    parser.add_argument("--classes", type=int, default=defaults.class_count)
+    parser.add_argument("--fields", type=int, default=defaults.fields_per_class)
+    parser.add_argument("--depth", type=int, default=defaults.nesting_depth)
+    parser.add_argument(
+        "--generic-density", type=float, default=defaults.generic_density
+    )
+    parser.add_argument("--enums", type=int, default=defaults.enum_count)
+    parser.add_argument("--enum-size", type=int, default=defaults.enum_size)
+    parser.add_argument("--unions", type=int, default=defaults.tagged_union_count)
+    parser.add_argument(
+        "--union-fanout", type=int, default=defaults.tagged_union_fanout
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON file for the results.")
+    args = parser.parse_args(argv)
+
+    spec = ModelSpec(
+        flavor=args.flavor,
+        class_count=args.classes,
+        fields_per_class=args.fields,
+        nesting_depth=args.depth,
+        generic_density=args.generic_density,
+        enum_count=args.enums,
+        enum_size=args.enum_size,
+        tagged_union_count=args.unions,
+        tagged_union_fanout=args.union_fanout,
+    )
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "generator_version": __version__,
+        "repeat": args.repeat,
+        **benchmark_stages(spec, args.repeat),
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measures how long binary snapshots of synthetic models take to load.
+
+Run from the repository root:
+
+    python -m benchmarks.snapshot_load --classes 10000 --fields 4 8 12
+
+Prints the best and the median of the runs for every number of fields per
+class, for the parsed model and the compiled model.
+"""
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from benchmarks.synthetic_model import ModelSpec, build_model
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.snapshot.snapshot import (
+    model_from_bytes,
+    model_to_bytes,
+    ts_model_from_bytes,
+    ts_model_to_bytes,
+)
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+
+def time_load(
+    load: Callable[[bytes], object], data: bytes, repeat: int
+) -> Tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(data)
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=10000)
+    parser.add_argument("--fields", type=int, nargs="+", default=[4, 8, 12])
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    print(sys.version.split()[0])
+    for fields in args.fields:
+        synthetic_model = build_model(
+            ModelSpec(class_count=args.classes, fields_per_class=fields)
+        )
+        model = ModelParser(
+            synthetic_model.roots, [DataclassParser()], ModelParserSettings()
+        ).parse()
+        ts_model = TypescriptModelCompiler(TypescriptModelCompilerSettings()).compile(
+            model
+        )
+        loads: List[Tuple[str, Callable[[bytes], object], bytes]] = [
+            ("model", model_from_bytes, model_to_bytes(model)),
+            ("ts_model", ts_model_from_bytes, ts_model_to_bytes(ts_model)),
+        ]
+        for kind, load, data in loads:
+            best, median = time_load(load, data, args.repeat)
+            print(
+                f"{len(model.classes)} classes, {fields:2d} fields per class"
+                f"  {kind:<8} {len(data) / 1e6:5.1f} MB"
+                f"  best {best * 1000:6.1f} ms  median {median * 1000:6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
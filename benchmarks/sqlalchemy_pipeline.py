@@ -0,0 +1,162 @@
+"""Times the generator on a realistic declarative SQLAlchemy schema.
+
+Run from the repository root:
+
+    python -m benchmarks.sqlalchemy_pipeline --domains 50 --entities 20 --output sqlalchemy.json
+
+The schema is built, its mappers are configured and its tables are created
+in a SQLite database in a temporary directory, as an application would on
+start. Then SQLAlchemyParser parses every mapped class on its own, the model
+parser parses the schema with the default parsers and the pipeline runs end
+to end. Results are written as JSON, to stdout by default.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import configure_mappers
+
+from benchmarks.pipeline_stages import measure
+from benchmarks.sqlalchemy_schema import SchemaSpec, build_schema
+from py2ts_generator import __version__
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.class_parsers.sqlalchemy_parser import (
+    SQLAlchemyParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+
+
+def benchmark_schema(spec: SchemaSpec, repeat: int) -> Dict[str, Any]:
+    start = time.perf_counter()
+    schema = build_schema(spec)
+    build_time = time.perf_counter() - start
+
+    # Parsing does not need configured mappers, so a schema is parsed once
+    # before configuring them, like a generator run without the application.
+    parser = SQLAlchemyParser()
+    start = time.perf_counter()
+    for cls in schema.classes:
+        parser.parse(cls)
+    unconfigured_parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    configure_mappers()
+    configure_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'schema.db')}")
+        start = time.perf_counter()
+        schema.base.metadata.create_all(engine)
+        create_time = time.perf_counter() - start
+        engine.dispose()
+
+        parse_classes = measure(
+            lambda: [parser.parse(cls) for cls in schema.classes], repeat
+        )
+        parsers = [DataclassParser(), SQLAlchemyParser()]
+        model = ModelParser(schema.classes, parsers, ModelParserSettings()).parse()
+        parse_model = measure(
+            lambda: ModelParser(schema.classes, parsers, ModelParserSettings()).parse(),
+            repeat,
+        )
+
+        output_file = os.path.join(directory, "schema.ts")
+        pipeline = (
+            TypeGenerationPipelineBuilder()
+            .for_types(schema.classes)
+            .to_file(output_file)
+            .build()
+        )
+        reports = []
+
+        def run():
+            # Without the output, every run generates it from scratch.
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            reports.append(pipeline.run())
+
+        end_to_end = measure(run, repeat)
+        output_size = os.path.getsize(output_file)
+
+    fields = sum(len(x.fields) for x in model.classes)
+    return {
+        "spec": asdict(spec),
+        "schema": {
+            "classes": len(schema.classes),
+            "tables": len(schema.base.metadata.tables),
+            "association_tables": len(schema.association_tables),
+            "enums": len(model.enums),
+            "fields": fields,
+            "output_size": output_size,
+        },
+        "build_time": build_time,
+        "unconfigured_parse_time": unconfigured_parse_time,
+        "configure_mappers_time": configure_time,
+        "create_all_time": create_time,
+        "parse_classes": parse_classes,
+        "parser_throughput": {
+            "classes_per_second": len(schema.classes) / parse_classes["best"],
+            "fields_per_second": fields / parse_classes["best"],
+        },
+        "parse_model": parse_model,
+        "end_to_end": end_to_end,
+        "end_to_end_stages": {
+            stage: timing.wall_time for stage, timing in reports[-1].stages.items()
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    defaults = SchemaSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--domains", type=int, default=defaults.domain_count)
+    parser.add_argument("--entities", type=int, default=defaults.entities_per_domain)
+    parser.add_argument("--columns", type=int, default=defaults.columns_per_entity)
+    parser.add_argument(
+        "--inheritance-share", type=float, default=defaults.inheritance_share
+    )
+    parser.add_argument("--subclasses", type=int, default=defaults.subclasses_per_base)
+    parser.add_argument("--enums", type=int, default=defaults.enums_per_domain)
+    parser.add_argument("--enum-size", type=int, default=defaults.enum_size)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON file for the results.")
+    args = parser.parse_args(argv)
+
+    spec = SchemaSpec(
+        domain_count=args.domains,
+        entities_per_domain=args.entities,
+        columns_per_entity=args.columns,
+        inheritance_share=args.inheritance_share,
+        subclasses_per_base=args.subclasses,
+        enums_per_domain=args.enums,
+        enum_size=args.enum_size,
+    )
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "generator_version": __version__,
+        "repeat": args.repeat,
+        **benchmark_schema(spec, args.repeat),
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Realistic declarative SQLAlchemy schema of any size, for benchmarks.
+
+Unlike the synthetic SQLAlchemy models, the schema is shaped like a
+production one: entities are grouped in domains, share columns through
+mixins, reference each other through foreign keys and relationships,
+including many-to-many ones through association tables, use Enum columns and
+form joined table and single table inheritance hierarchies.
+"""
+import enum
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Enum as SQLAlchemyEnum,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Table,
+    Text,
+    Uuid,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+_COLUMN_TYPES: List[Any] = [String(120), Integer, Text, Boolean, Float, LargeBinary]
+
+
+@dataclass(frozen=True)
+class SchemaSpec:
+    domain_count: int = 10
+    entities_per_domain: int = 20
+    columns_per_entity: int = 10
+    # Share of the entities which are the base of an inheritance hierarchy.
+    inheritance_share: float = 0.1
+    # Subclasses of every base, alternately mapped to their own table (joined
+    # table inheritance) and to the table of the base (single table
+    # inheritance).
+    subclasses_per_base: int = 3
+    enums_per_domain: int = 4
+    enum_size: int = 6
+
+
+@dataclass(frozen=True)
+class Schema:
+    spec: SchemaSpec
+    base: Type[DeclarativeBase]
+    # Every mapped class, bases of inheritance hierarchies before their
+    # subclasses.
+    classes: List[Type]
+    enums: List[Type]
+    association_tables: List[Table]
+
+
+def build_schema(spec: SchemaSpec) -> Schema:
+    # Every schema gets its own registry, so schemas never clash.
+    class Base(DeclarativeBase):
+        pass
+
+    classes: List[Type] = []
+    enums: List[Type] = []
+    association_tables: List[Table] = []
+    for domain in range(spec.domain_count):
+        domain_enums = _build_enums(spec, domain)
+        enums.extend(domain_enums)
+        _build_domain(spec, domain, Base, domain_enums, classes, association_tables)
+    return Schema(
+        spec=spec,
+        base=Base,
+        classes=classes,
+        enums=enums,
+        association_tables=association_tables,
+    )
+
+
+class _IdentifiedMixin:
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    public_id: Mapped[UUID] = mapped_column(Uuid, default=uuid4, unique=True)
+
+
+class _TimestampMixin:
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class _SoftDeleteMixin:
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
+
+
+def _build_enums(spec: SchemaSpec, domain: int) -> List[Type]:
+    return [
+        enum.Enum(  # type: ignore
+            f"Domain{domain}Status{i}",
+            {f"STATE_{j}": f"state_{j}" for j in range(spec.enum_size)},
+        )
+        for i in range(spec.enums_per_domain)
+    ]
+
+
+def _build_domain(
+    spec: SchemaSpec,
+    domain: int,
+    base: Type[DeclarativeBase],
+    enums: List[Type],
+    classes: List[Type],
+    association_tables: List[Table],
+) -> None:
+    names = [f"Domain{domain}Entity{i}" for i in range(spec.entities_per_domain)]
+    tables = [f"domain_{domain}_entity_{i}" for i in range(spec.entities_per_domain)]
+    base_count = round(spec.entities_per_domain * spec.inheritance_share)
+    for i, name in enumerate(names):
+        mixins = (_IdentifiedMixin, _TimestampMixin)
+        if i % 2:
+            mixins += (_SoftDeleteMixin,)
+        namespace: Dict[str, Any] = {"__tablename__": tables[i]}
+        for j in range(spec.columns_per_entity):
+            namespace[f"attribute_{j}"] = _column(j, enums)
+        # Entities belong to the previous entity of their domain, the first
+        # one to the first entity of the previous domain.
+        if i > 0 or domain > 0:
+            parent_table = tables[i - 1] if i > 0 else f"domain_{domain - 1}_entity_0"
+            parent_name = names[i - 1] if i > 0 else f"Domain{domain - 1}Entity0"
+            namespace["parent_id"] = mapped_column(
+                Integer, ForeignKey(f"{parent_table}.id"), index=True
+            )
+            namespace["parent"] = relationship(parent_name)
+        # Every fifth entity is tagged with the next one.
+        if i % 5 == 0 and i + 1 < len(names):
+            association = Table(
+                f"{tables[i]}_tags",
+                base.metadata,
+                Column("left_id", ForeignKey(f"{tables[i]}.id"), primary_key=True),
+                Column("right_id", ForeignKey(f"{tables[i + 1]}.id"), primary_key=True),
+            )
+            association_tables.append(association)
+            namespace["tags"] = relationship(names[i + 1], secondary=association)
+        is_inheritance_base = i < base_count
+        if is_inheritance_base:
+            namespace["kind"] = mapped_column(String(50))
+            namespace["__mapper_args__"] = {
+                "polymorphic_on": "kind",
+                "polymorphic_identity": tables[i],
+            }
+        cls = type(name, (*mixins, base), namespace)
+        classes.append(cls)
+        if is_inheritance_base:
+            classes.extend(_build_subclasses(spec, cls, tables[i], enums))
+
+
+def _build_subclasses(
+    spec: SchemaSpec, parent: Type, parent_table: str, enums: List[Type]
+) -> List[Type]:
+    subclasses = []
+    for k in range(spec.subclasses_per_base):
+        identity = f"{parent_table}_variant_{k}"
+        namespace: Dict[str, Any] = {
+            "__mapper_args__": {"polymorphic_identity": identity}
+        }
+        if k % 2 == 0:
+            namespace["__tablename__"] = identity
+            namespace["id"] = mapped_column(
+                Integer, ForeignKey(f"{parent_table}.id"), primary_key=True
+            )
+        # Columns of single table subclasses are added to the table of the
+        # base, so their names must be unique within it.
+        for j in range(max(1, spec.columns_per_entity // 3)):
+            namespace[f"variant_{k}_attribute_{j}"] = _column(j, enums, nullable=True)
+        subclasses.append(type(f"{parent.__name__}Variant{k}", (parent,), namespace))
+    return subclasses
+
+
+def _column(index: int, enums: List[Type], nullable: bool = False) -> Any:
+    if enums and index % 4 == 0:
+        column_type = SQLAlchemyEnum(enums[index // 4 % len(enums)])
+    else:
+        column_type = _COLUMN_TYPES[index % len(_COLUMN_TYPES)]
+    return mapped_column(column_type, nullable=nullable or index % 3 == 0)
@@ -0,0 +1,195 @@
+"""Factory of synthetic models of any size, for benchmarks and scaling tests.
+
+Models are made of dataclasses created with make_dataclass or of declarative
+SQLAlchemy models, shaped by a ModelSpec.
+"""
+import enum
+from dataclasses import dataclass, make_dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+
+from sqlalchemy import (
+    ARRAY,
+    Boolean,
+    Column,
+    DateTime,
+    Enum as SQLAlchemyEnum,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+)
+from sqlalchemy.orm import DeclarativeBase
+
+DATACLASS = "dataclass"
+SQLALCHEMY = "sqlalchemy"
+
+_SCALAR_TYPES: List[Type] = [int, str, float, bool, datetime, UUID]
+
+_SCALAR_COLUMN_TYPES = [Integer, String, Float, Boolean, DateTime]
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    flavor: str = DATACLASS
+    class_count: int = 100
+    fields_per_class: int = 8
+    # Classes are spread over this many levels, every class below the top
+    # level is referenced by a class of the level above.
+    nesting_depth: int = 3
+    # Share of the fields with a generic type, e.g. List[X] or Optional[X].
+    # SQLAlchemy models get ARRAY columns instead.
+    generic_density: float = 0.25
+    enum_count: int = 10
+    enum_size: int = 8
+    # Tagged unions with tagged_union_fanout children each, only supported by
+    # dataclass models.
+    tagged_union_count: int = 0
+    tagged_union_fanout: int = 4
+
+
+@dataclass(frozen=True)
+class SyntheticModel:
+    spec: ModelSpec
+    # The types to pass to a pipeline, every other type is discovered through
+    # them.
+    roots: List[Type]
+    classes: List[Type]
+    enums: List[Type]
+
+
+def build_model(spec: ModelSpec) -> SyntheticModel:
+    if spec.flavor == DATACLASS:
+        return _build_dataclass_model(spec)
+    if spec.flavor == SQLALCHEMY:
+        return _build_sqlalchemy_model(spec)
+    raise ValueError(f"Unknown model flavor {spec.flavor!r}.")
+
+
+def _build_enums(spec: ModelSpec) -> List[Type]:
+    return [
+        enum.Enum(  # type: ignore
+            f"SyntheticEnum{i}",
+            {f"VALUE_{j}": f"value_{j}" for j in range(spec.enum_size)},
+        )
+        for i in range(spec.enum_count)
+    ]
+
+
+def _levels(spec: ModelSpec) -> List[List[int]]:
+    depth = max(1, min(spec.nesting_depth, spec.class_count))
+    level_size = -(-spec.class_count // depth)
+    return [
+        list(range(i, min(i + level_size, spec.class_count)))
+        for i in range(0, spec.class_count, level_size)
+    ]
+
+
+def _is_generic(index: int, density: float) -> bool:
+    # Spreads the generic fields evenly over all fields of the model.
+    return int((index + 1) * density) > int(index * density)
+
+
+def _build_dataclass_model(spec: ModelSpec) -> SyntheticModel:
+    enums = _build_enums(spec)
+    classes: Dict[int, Type] = {}
+    levels = _levels(spec)
+    # Lower levels are built first, so upper levels can reference them.
+    for depth in reversed(range(len(levels))):
+        children = levels[depth + 1] if depth + 1 < len(levels) else []
+        for position, i in enumerate(levels[depth]):
+            fields: List[Any] = []
+            for j in range(spec.fields_per_class):
+                index = i * spec.fields_per_class + j
+                leaf_type = (
+                    enums[index % len(enums)]
+                    if enums and index % 3 == 0
+                    else _SCALAR_TYPES[index % len(_SCALAR_TYPES)]
+                )
+                if _is_generic(index, spec.generic_density):
+                    generic_types: List[Any] = [
+                        List[leaf_type],
+                        Optional[leaf_type],
+                        Dict[str, leaf_type],
+                    ]
+                    field_type = generic_types[index % len(generic_types)]
+                else:
+                    field_type = leaf_type
+                fields.append((f"field_{j}", field_type))
+            if children:
+                child = classes[children[position % len(children)]]
+                fields.append(("child", Optional[child]))
+            classes[i] = _make_dataclass(f"SyntheticClass{i}", fields)
+
+    roots = [classes[i] for i in levels[0]] if levels else []
+    all_classes = [classes[i] for i in sorted(classes)]
+    for i in range(spec.tagged_union_count):
+        union_root = _make_dataclass(
+            f"SyntheticUnion{i}",
+            [("value", int)],
+            namespace={"__json_type_info_attribute__": "kind"},
+        )
+        for k in range(spec.tagged_union_fanout):
+            union_child = _make_dataclass(
+                f"SyntheticUnion{i}Child{k}",
+                [(f"value_{k}", str)],
+                bases=(union_root,),
+                namespace={"kind": f"child_{k}"},
+            )
+            all_classes.append(union_child)
+        roots.append(union_root)
+        all_classes.append(union_root)
+    return SyntheticModel(spec=spec, roots=roots, classes=all_classes, enums=enums)
+
+
+def _make_dataclass(name: str, fields: List[Any], **kwargs: Any) -> Type:
+    # The generator only reads the fields, leaving out the generated methods
+    # makes building large models several times faster.
+    return make_dataclass(name, fields, init=False, repr=False, eq=False, **kwargs)
+
+
+def _build_sqlalchemy_model(spec: ModelSpec) -> SyntheticModel:
+    if spec.tagged_union_count:
+        raise ValueError("Tagged unions are only supported by dataclass models.")
+
+    # Every model gets its own registry, so models never clash.
+    class Base(DeclarativeBase):
+        pass
+
+    enums = _build_enums(spec)
+    classes: Dict[int, Type] = {}
+    levels = _levels(spec)
+    for depth in reversed(range(len(levels))):
+        children = levels[depth + 1] if depth + 1 < len(levels) else []
+        for position, i in enumerate(levels[depth]):
+            namespace: Dict[str, Any] = {
+                "__tablename__": f"synthetic_table_{i}",
+                "id": Column(Integer, primary_key=True),
+            }
+            for j in range(spec.fields_per_class):
+                index = i * spec.fields_per_class + j
+                column_type: Any
+                if _is_generic(index, spec.generic_density):
+                    column_type = ARRAY(Integer)
+                elif enums and index % 3 == 0:
+                    column_type = SQLAlchemyEnum(enums[index % len(enums)])
+                else:
+                    column_type = _SCALAR_COLUMN_TYPES[
+                        index % len(_SCALAR_COLUMN_TYPES)
+                    ]
+                namespace[f"field_{j}"] = Column(column_type)
+            if children:
+                child = children[position % len(children)]
+                namespace["child_id"] = Column(
+                    Integer, ForeignKey(f"synthetic_table_{child}.id")
+                )
+            classes[i] = type(f"SyntheticModel{i}", (Base,), namespace)
+
+    return SyntheticModel(
+        spec=spec,
+        # SQLAlchemy models are not discovered through foreign keys.
+        roots=[classes[i] for i in sorted(classes)],
+        classes=[classes[i] for i in sorted(classes)],
+        enums=enums,
+    )
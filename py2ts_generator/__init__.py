@@ -1,5 +1,20 @@
-from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (  # noqa: F401
-    TypeGenerationPipelineBuilder,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (  # noqa: F401
+        TypeGenerationPipelineBuilder,
+    )
 
 __version__ = "0.3.1"
+
+
+def __getattr__(name: str) -> Any:
+    # Imported lazily, so lightweight entry points like the staleness check do
+    # not pay for importing the whole pipeline and its dependencies.
+    if name == "TypeGenerationPipelineBuilder":
+        from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (  # noqa: F811
+            TypeGenerationPipelineBuilder,
+        )
+
+        return TypeGenerationPipelineBuilder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
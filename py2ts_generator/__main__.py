@@ -0,0 +1,5 @@
+import sys
+
+from py2ts_generator.cli.cli import main
+
+sys.exit(main())
@@ -0,0 +1,72 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional, Tuple, Union
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Temporary files are only readable by their owner, so replaced files get the
+# permissions a plain open() would have given them. Read once, since reading
+# the umask changes it for a moment.
+_FILE_MODE = 0o666 & ~_read_umask()
+
+
+@contextmanager
+def atomic_write(
+    path: Union[str, Path], encoding: Optional[str] = None
+) -> Iterator[IO[str]]:
+    """Opens a temporary file next to path, which replaces path once the block
+    completes.
+
+    Every call writes to a file of its own, so concurrent writers of one path
+    never clobber each other's temporary file, and the last one to finish wins.
+    If the block raises, path is left untouched.
+    """
+    directory, prefix = _split(path)
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding=encoding,
+        dir=directory,
+        prefix=prefix,
+        suffix=".tmp",
+        delete=False,
+    ) as f:
+        try:
+            yield f
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    _replace(f.name, path)
+
+
+def temporary_path(path: Union[str, Path]) -> str:
+    """Returns a unique path next to path, which no file exists at yet.
+
+    For files created by other means than writing, e.g. hard links.
+    """
+    directory, prefix = _split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    os.close(fd)
+    os.remove(tmp_path)
+    return tmp_path
+
+
+def _split(path: Union[str, Path]) -> Tuple[str, str]:
+    directory, name = os.path.split(os.path.abspath(path))
+    return directory, f"{name}."
+
+
+def _replace(tmp_path: str, path: Union[str, Path]) -> None:
+    try:
+        os.chmod(tmp_path, _FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
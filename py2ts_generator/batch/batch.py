@@ -0,0 +1,178 @@
+import importlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Union
+
+from py2ts_generator.generation_pipeline.pipeline_caches import PipelineCaches
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline import (
+    TypeGenerationPipeline,
+)
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.profiling.profiling import ProfileOptions, ProfilingObserver
+
+PipelineSpec = Union[str, TypeGenerationPipeline, TypeGenerationPipelineBuilder]
+
+
+class InvalidPipelineReference(RuntimeError):
+    def __init__(self, reference: str, reason: str) -> None:
+        super().__init__(f"Invalid pipeline reference {reference!r}: {reason}.")
+
+
+@dataclass(frozen=True)
+class PipelineResult:
+    name: str
+    output_file: Optional[str]
+    written: bool
+    duration: float
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return "failed"
+        return "generated" if self.written else "unchanged"
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    results: List[PipelineResult]
+    duration: float
+
+    @property
+    def failed(self) -> List[PipelineResult]:
+        return [x for x in self.results if x.error is not None]
+
+    def summary(self) -> str:
+        lines = [
+            f"{x.status:<9} {x.duration:8.3f}s  {x.name}"
+            + (f" ({x.error})" if x.error is not None else "")
+            for x in self.results
+        ]
+        lines.append(
+            f"{len(self.results)} pipelines, {len(self.failed)} failed,"
+            f" {self.duration:.3f}s"
+        )
+        return "\n".join(lines)
+
+
+def run_batch(
+    pipelines: Sequence[PipelineSpec],
+    max_workers: Optional[int] = None,
+    profile: Optional[ProfileOptions] = None,
+) -> BatchResult:
+    """Runs many independent pipelines in this process or in a worker pool.
+
+    Pipelines running in the same process share imported modules, parser
+    decisions, parsed classes and compiled types. A failing pipeline does not
+    stop the others, its error is reported in its result.
+
+    :param pipelines: Pipelines, pipeline builders or references of the form
+        ``package.module:attribute``, where the attribute is a pipeline, a
+        builder or a function returning one of them. Pipelines passed to a
+        worker pool must be picklable, references always are.
+    :param max_workers: When set, the pipelines are split into this many
+        contiguous groups, each of which runs in its own worker process.
+    :param profile: When set, every pipeline writes a cProfile trace of every
+        stage next to its output file, see TypeGenerationPipelineBuilder.profile.
+    """
+    start = time.perf_counter()
+    if not max_workers or max_workers <= 1 or len(pipelines) <= 1:
+        results = _run_group(list(pipelines), profile)
+    else:
+        group_count = min(max_workers, len(pipelines))
+        group_size = -(-len(pipelines) // group_count)
+        groups = [
+            list(pipelines[i : i + group_size])  # noqa: E203
+            for i in range(0, len(pipelines), group_size)
+        ]
+        with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+            results = [
+                x
+                for group in executor.map(_run_group, groups, [profile] * len(groups))
+                for x in group
+            ]
+    return BatchResult(results=results, duration=time.perf_counter() - start)
+
+
+def resolve_pipeline(spec: PipelineSpec) -> TypeGenerationPipeline:
+    if isinstance(spec, str):
+        return resolve_pipeline(_import_reference(spec))
+    if isinstance(spec, TypeGenerationPipelineBuilder):
+        return spec.build()
+    if isinstance(spec, TypeGenerationPipeline):
+        return spec
+    if callable(spec):
+        return resolve_pipeline(spec())
+    raise TypeError(f"{spec!r} is neither a pipeline nor a pipeline builder.")
+
+
+def _run_group(
+    specs: List[PipelineSpec], profile: Optional[ProfileOptions] = None
+) -> List[PipelineResult]:
+    caches = PipelineCaches()
+    return [_run_pipeline(x, caches, profile) for x in specs]
+
+
+def _run_pipeline(
+    spec: PipelineSpec, caches: PipelineCaches, profile: Optional[ProfileOptions]
+) -> PipelineResult:
+    name = spec if isinstance(spec, str) else None
+    output_file = None
+    start = time.perf_counter()
+    try:
+        pipeline = resolve_pipeline(spec)
+        output_file = str(pipeline.output_file)
+        written = _run_with(pipeline, caches, profile)
+    except Exception as e:
+        return PipelineResult(
+            name=name or output_file or repr(spec),
+            output_file=output_file,
+            written=False,
+            duration=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+    return PipelineResult(
+        name=name or output_file or repr(spec),
+        output_file=output_file,
+        written=written,
+        duration=time.perf_counter() - start,
+    )
+
+
+def _run_with(
+    pipeline: TypeGenerationPipeline,
+    caches: PipelineCaches,
+    profile: Optional[ProfileOptions],
+) -> bool:
+    # Pipelines may be batched again or run on their own, so they are left as
+    # they were: caches of their own are kept, and the batch caches and the
+    # profiling observer only apply to this run.
+    original_caches, original_observers = pipeline.caches, pipeline.observers
+    if original_caches is None:
+        pipeline.caches = caches
+    if profile is not None:
+        pipeline.observers = [
+            *original_observers,
+            ProfilingObserver(str(pipeline.output_file), profile),
+        ]
+    try:
+        return pipeline.run().written
+    finally:
+        pipeline.caches = original_caches
+        pipeline.observers = original_observers
+
+
+def _import_reference(reference: str) -> Any:
+    module_name, _, attribute = reference.partition(":")
+    if not module_name or not attribute:
+        raise InvalidPipelineReference(reference, "expected package.module:attribute")
+    value: Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        try:
+            value = getattr(value, part)
+        except AttributeError:
+            raise InvalidPipelineReference(reference, f"{part} not found")
+    return value
@@ -0,0 +1,108 @@
+import argparse
+import sys
+from typing import List, Optional
+
+# Note: keep imports in this module lazy, subcommands like `check` have to stay
+# fast and must not import the pipeline or the user's model code.
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="py2ts-generator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    check_parser = subparsers.add_parser(
+        "check",
+        help="Check if generated output is stale, using the manifests written next to it.",
+    )
+    check_parser.add_argument("manifests", nargs="+", metavar="MANIFEST")
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run many pipelines in one process or a bounded worker pool.",
+    )
+    batch_parser.add_argument(
+        "pipelines",
+        nargs="+",
+        metavar="MODULE:ATTRIBUTE",
+        help="A pipeline, a pipeline builder or a function returning one of them.",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes, pipelines run in this process by default.",
+    )
+
+    batch_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a cProfile trace of every stage next to every output file.",
+    )
+    batch_parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also trace allocations and write the top allocation sites of every stage.",
+    )
+    batch_parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of allocation sites per stage, 10 by default.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "check":
+        return _check(args.manifests)
+    if args.command == "batch":
+        return _batch(
+            args.pipelines,
+            args.workers,
+            args.profile or args.profile_memory,
+            args.profile_memory,
+            args.profile_top,
+        )
+    return 2
+
+
+def _check(manifests: List[str]) -> int:
+    from py2ts_generator.source_manifest.source_manifest import check_manifest
+
+    exit_code = 0
+    for manifest in manifests:
+        reason = check_manifest(manifest)
+        if reason:
+            print(f"stale: {manifest} ({reason})")
+            exit_code = 1
+        else:
+            print(f"fresh: {manifest}")
+    return exit_code
+
+
+def _batch(
+    pipelines: List[str],
+    workers: Optional[int],
+    profile: bool,
+    profile_memory: bool,
+    profile_top: int,
+) -> int:
+    from py2ts_generator.batch.batch import run_batch
+    from py2ts_generator.profiling.profiling import ProfileOptions
+
+    # The pipeline references are resolved relative to the working directory,
+    # like with `python -m`.
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+    result = run_batch(
+        pipelines,
+        max_workers=workers,
+        profile=ProfileOptions(memory=profile_memory, top=profile_top)
+        if profile
+        else None,
+    )
+    print(result.summary())
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from py2ts_generator.snapshot.snapshot import ts_model_from_bytes, ts_model_to_bytes
+from py2ts_generator.typescript_model_compiler.ts_enum import TsEnum
+from py2ts_generator.typescript_model_compiler.ts_model import TsModel
+from py2ts_generator.typescript_model_compiler.ts_object_type import TsBaseType
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# Concurrent writers wait for each other at most this many seconds.
+_BUSY_TIMEOUT = 60.0
+
+# SQLite limits the number of parameters of a statement.
+_KEYS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS declarations (
+    key TEXT PRIMARY KEY,
+    compiled BLOB NOT NULL,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS declarations_last_used ON declarations (last_used);
+"""
+
+Declaration = Union[TsBaseType, TsEnum]
+
+
+@dataclass(frozen=True)
+class CachedDeclaration:
+    key: str
+    declaration: Declaration
+    text: str
+
+
+class DeclarationCache:
+    """On-disk cache of compiled and rendered declarations.
+
+    Entries are keyed by the fingerprint of a single class or enum, which also
+    covers the pipeline settings, so they are reused by every run, branch and
+    project producing the same declaration. The cache is a SQLite database in
+    WAL mode, which parallel processes can read and write concurrently. Once
+    the entries exceed max_size bytes, the least recently used ones are
+    evicted.
+    """
+
+    def __init__(self, path: Union[str, Path], max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+
+    def get_texts(self, keys: Sequence[str]) -> Dict[str, str]:
+        """Looks up the rendered declarations of many keys at once.
+
+        :returns: The texts of the keys found in the cache.
+        """
+        texts: Dict[str, str] = {}
+        with self._transaction() as connection:
+            for chunk in _chunks(list(dict.fromkeys(keys))):
+                placeholders = ",".join("?" * len(chunk))
+                texts.update(
+                    connection.execute(
+                        f"SELECT key, text FROM declarations"
+                        f" WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+                connection.execute(
+                    f"UPDATE declarations SET last_used = ?"
+                    f" WHERE key IN ({placeholders})",
+                    [time.time(), *chunk],
+                )
+        return texts
+
+    def get(self, key: str) -> Optional[CachedDeclaration]:
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT compiled, text FROM declarations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE declarations SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        ts_model = ts_model_from_bytes(row[0])
+        declaration: Declaration = (
+            ts_model.enums[0] if ts_model.enums else ts_model.types[0]
+        )
+        return CachedDeclaration(key=key, declaration=declaration, text=row[1])
+
+    def put_many(self, entries: Iterable[CachedDeclaration]) -> None:
+        """Stores declarations and evicts the least recently used entries."""
+        rows = []
+        now = time.time()
+        for entry in entries:
+            compiled = ts_model_to_bytes(
+                TsModel.of_enums([entry.declaration])
+                if isinstance(entry.declaration, TsEnum)
+                else TsModel.of_types([entry.declaration])
+            )
+            size = len(compiled) + len(entry.text.encode("utf-8"))
+            rows.append((entry.key, compiled, entry.text, size, now))
+        if not rows:
+            return
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO declarations"
+                " (key, compiled, text, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict(connection)
+
+    def size(self) -> int:
+        with self._transaction() as connection:
+            return self._size(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        if self._size(connection) <= self.max_size:
+            return
+        kept_size = 0
+        evicted: List[str] = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM declarations ORDER BY last_used DESC"
+        ):
+            kept_size += size
+            if kept_size > self.max_size:
+                evicted.append(key)
+        for chunk in _chunks(evicted):
+            connection.execute(
+                f"DELETE FROM declarations WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+
+    @staticmethod
+    def _size(connection: sqlite3.Connection) -> int:
+        return int(
+            connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM declarations"
+            ).fetchone()[0]
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # A connection per transaction keeps the cache usable from any thread.
+        # Transactions take the write lock right away, so concurrent processes
+        # queue up instead of failing to upgrade a read lock.
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT, isolation_level=None
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+
+def _chunks(keys: List[str]) -> Iterator[List[str]]:
+    for i in range(0, len(keys), _KEYS_PER_QUERY):
+        yield keys[i : i + _KEYS_PER_QUERY]  # noqa: E203
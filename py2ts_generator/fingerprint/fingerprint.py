@@ -0,0 +1,128 @@
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from py2ts_generator.model.model import Model
+from py2ts_generator.model.py_class import PyClass, RootTaggedUnionInformation
+from py2ts_generator.model.py_enum import PyEnum
+
+FINGERPRINT_HEADER_PREFIX = "// py2ts-generator fingerprint: "
+
+# Bump this whenever the content covered by the fingerprint changes, so files
+# written by an older generator are never considered up-to-date.
+FINGERPRINT_FORMAT_VERSION = "1"
+
+
+def describe_type(cls: Type) -> str:
+    # Generics are described structurally, so typing.List[X], list[X] and
+    # snapshot types loaded without importing X all share one description.
+    origin = getattr(cls, "__origin__", None)
+    args = getattr(cls, "__args__", None)
+    if origin is not None and args:
+        return f"{describe_type(origin)}[{', '.join(describe_type(x) for x in args)}]"
+    module = getattr(cls, "__module__", None)
+    qualname = getattr(cls, "__qualname__", None)
+    if isinstance(module, str) and isinstance(qualname, str):
+        return f"{module}.{qualname}"
+    return repr(cls)
+
+
+class ModelFingerprint:
+    """Incrementally computes a cheap fingerprint of a parsed model.
+
+    The fingerprint covers everything that influences the generated output:
+    qualified class names, field names and annotations, tagged union
+    information, enum values and the pipeline settings.
+    """
+
+    def __init__(self, settings: Dict[str, str]) -> None:
+        self._hash = hashlib.blake2b(digest_size=16)
+        # Models share few distinct annotations, so each is only described once.
+        # Annotations are looked up by identity, since equal annotations may
+        # have different descriptions, e.g. Union[int, str] and Union[str, int].
+        # The annotations are kept alive, so their ids are never reused.
+        self._descriptions: Dict[int, Tuple[Any, str]] = {}
+        self._update("version", FINGERPRINT_FORMAT_VERSION)
+        for key in sorted(settings):
+            self._update("setting", key, settings[key])
+
+    def add_class(self, py_class: PyClass) -> None:
+        self._update("class", py_class.name, self._describe_type(py_class.type))
+        for py_field in py_class.fields:
+            if py_field.alias is None:
+                self._update("field", py_field.name, self._describe_type(py_field.type))
+            else:
+                self._update(
+                    "aliased_field",
+                    py_field.name,
+                    self._describe_type(py_field.type),
+                    py_field.alias,
+                )
+        tagged_union_information = py_class.tagged_union_information
+        if tagged_union_information:
+            self._update(
+                "tagged_union",
+                tagged_union_information.discriminant_attribute,
+                tagged_union_information.discriminant_literal,
+            )
+        if isinstance(tagged_union_information, RootTaggedUnionInformation):
+            self._update(
+                "discriminant_literals",
+                *tagged_union_information.discriminant_literals,
+            )
+            self._update(
+                "child_types",
+                *(self._describe_type(x) for x in tagged_union_information.child_types),
+            )
+
+    def add_enum(self, py_enum: PyEnum) -> None:
+        self._update("enum", py_enum.name, self._describe_type(py_enum.type))
+        for value in py_enum.values:
+            self._update("value", value.name, repr(value.value))
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def copy(self) -> "ModelFingerprint":
+        """Copies the fingerprint, e.g. to fingerprint single declarations
+        together with the settings without hashing the settings again."""
+        fingerprint = ModelFingerprint.__new__(ModelFingerprint)
+        fingerprint._hash = self._hash.copy()
+        fingerprint._descriptions = self._descriptions
+        return fingerprint
+
+    def _describe_type(self, cls: Type) -> str:
+        entry = self._descriptions.get(id(cls))
+        if entry is None:
+            entry = self._descriptions[id(cls)] = (cls, describe_type(cls))
+        return entry[1]
+
+    def _update(self, *parts: str) -> None:
+        for part in parts:
+            self._hash.update(part.encode("utf-8"))
+            self._hash.update(b"\x00")
+        self._hash.update(b"\x01")
+
+
+def compute_model_fingerprint(model: Model, settings: Dict[str, str]) -> str:
+    fingerprint = ModelFingerprint(settings)
+    for py_class in model.classes:
+        fingerprint.add_class(py_class)
+    for py_enum in model.enums:
+        fingerprint.add_enum(py_enum)
+    return fingerprint.hexdigest()
+
+
+def format_fingerprint_header(fingerprint: str) -> str:
+    return f"{FINGERPRINT_HEADER_PREFIX}{fingerprint}\n"
+
+
+def read_fingerprint_header(path: Union[str, Path]) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            first_line = f.readline()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if not first_line.startswith(FINGERPRINT_HEADER_PREFIX):
+        return None
+    return first_line.removeprefix(FINGERPRINT_HEADER_PREFIX).rstrip("\n")
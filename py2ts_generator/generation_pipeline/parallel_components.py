@@ -0,0 +1,105 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from py2ts_generator.model.model import Model
+from py2ts_generator.model.type_graph import connected_components
+from py2ts_generator.snapshot.snapshot import model_from_bytes, model_to_bytes
+from py2ts_generator.typescript_emitter.typescript_emitter import (
+    TypescriptEmitter,
+)
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    CaseFormat,
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+# Every worker gets a few batches, so one large component does not leave the
+# other workers idle for the rest of the run.
+_BATCHES_PER_WORKER = 4
+
+
+def compile_and_emit_components(
+    model: Model,
+    compiler_settings: TypescriptModelCompilerSettings,
+    max_workers: Optional[int] = None,
+    compile_and_emit: Optional[Callable[[Model], str]] = None,
+) -> str:
+    """Compiles and emits the independent parts of a model in worker processes.
+
+    The model is split into its connected components, which are shipped to the
+    workers as binary snapshots. The rendered declarations are put back into
+    the declaration order of the model, so the output is identical to the one
+    of the serial pipeline.
+
+    :param compile_and_emit: Compiles and emits models which are not worth
+        splitting in the current process, e.g. with the caches of a pipeline.
+    """
+    components = connected_components(model)
+    max_workers = max_workers or os.cpu_count() or 1
+    if len(components) <= 1 or max_workers <= 1:
+        if compile_and_emit is not None:
+            return compile_and_emit(model)
+        return _compile_and_emit(model, compiler_settings)
+
+    batches = _pack_components(components, max_workers * _BATCHES_PER_WORKER)
+    payloads = [
+        model_to_bytes(batch, compiler_settings.type_mapping_overrides)
+        for batch in batches
+    ]
+    case_formats = [compiler_settings.field_case_format.value] * len(payloads)
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        results = list(executor.map(_compile_and_emit_batch, payloads, case_formats))
+
+    class_indices = {x: i for i, x in enumerate(model.classes)}
+    enum_indices = {x: i for i, x in enumerate(model.enums)}
+    type_texts: List[Optional[str]] = [None] * len(model.classes)
+    enum_texts: List[Optional[str]] = [None] * len(model.enums)
+    for batch, (batch_type_texts, batch_enum_texts) in zip(batches, results):
+        for py_class, text in zip(batch.classes, batch_type_texts):
+            type_texts[class_indices[py_class]] = text
+        for py_enum, text in zip(batch.enums, batch_enum_texts):
+            enum_texts[enum_indices[py_enum]] = text
+    # The serial pipeline drops duplicate declarations, keeping the first one.
+    return "".join(dict.fromkeys([*enum_texts, *type_texts]))  # type: ignore
+
+
+def _compile_and_emit(
+    model: Model, compiler_settings: TypescriptModelCompilerSettings
+) -> str:
+    ts_model = TypescriptModelCompiler(compiler_settings).compile(model)
+    return TypescriptEmitter().emit(ts_model)
+
+
+def _pack_components(components: List[Model], batch_count: int) -> List[Model]:
+    # Greedy bin packing, largest components first, into the lightest batch.
+    batches = [Model() for _ in range(min(batch_count, len(components)))]
+    sizes = [0] * len(batches)
+    for component in sorted(components, key=_component_size, reverse=True):
+        lightest = sizes.index(min(sizes))
+        batches[lightest].classes.update(component.classes)
+        batches[lightest].enums.update(component.enums)
+        sizes[lightest] += _component_size(component)
+    return batches
+
+
+def _component_size(component: Model) -> int:
+    return sum(1 + len(x.fields) for x in component.classes) + len(component.enums)
+
+
+def _compile_and_emit_batch(
+    payload: bytes, case_format: str
+) -> Tuple[List[str], List[str]]:
+    # Types are not resolved, so workers never import the user's model modules.
+    snapshot = model_from_bytes(payload)
+    compiler = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(
+            field_case_format=CaseFormat(case_format),
+            type_mapping_overrides=snapshot.type_overrides,
+        )
+    )
+    emitter = TypescriptEmitter()
+    return (
+        [emitter.emit_type(compiler.compile_class(x)) for x in snapshot.model.classes],
+        [emitter.emit_enum(compiler.compile_enum(x)) for x in snapshot.model.enums],
+    )
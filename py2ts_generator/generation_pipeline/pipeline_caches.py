@@ -0,0 +1,36 @@
+import weakref
+from typing import Dict, MutableMapping
+
+from py2ts_generator.model_parser.model_parser import ModelParserCache
+from py2ts_generator.typescript_model_compiler.ts_object_type import TsBaseType
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompilerCache,
+)
+
+
+class PipelineCaches:
+    """Caches shared by pipelines running in the same process.
+
+    Parser decisions and parsed classes are shared by all pipelines, compiled
+    classes and types only by pipelines with equal compiler settings. Rendered
+    types are kept as long as their compiled types are.
+    """
+
+    def __init__(self) -> None:
+        self.model_parser = self._create_model_parser_cache()
+        self.rendered: MutableMapping[TsBaseType, str] = weakref.WeakKeyDictionary()
+        self._compilers: Dict[str, TypescriptModelCompilerCache] = {}
+
+    def compiler_cache(self, settings_key: str) -> TypescriptModelCompilerCache:
+        cache = self._compilers.get(settings_key)
+        if cache is None:
+            cache = self._compilers.setdefault(
+                settings_key, self._create_compiler_cache()
+            )
+        return cache
+
+    def _create_model_parser_cache(self) -> ModelParserCache:
+        return ModelParserCache()
+
+    def _create_compiler_cache(self) -> TypescriptModelCompilerCache:
+        return TypescriptModelCompilerCache()
@@ -0,0 +1,50 @@
+import shutil
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Type, Union
+
+from py2ts_generator.atomic_write.atomic_write import atomic_write
+
+
+class TwoSegmentWriter:
+    """Writes a file consisting of a header and two segments.
+
+    The segments can be written interleaved, for example enums and types as
+    they are parsed, although all enums have to come first in the file. Both
+    segments are spilled to temporary files, so only the text currently being
+    written is held in memory.
+    """
+
+    def __init__(self) -> None:
+        self._first = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._second = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def write_first(self, text: str) -> None:
+        self._first.write(text)
+
+    def write_second(self, text: str) -> None:
+        self._second.write(text)
+
+    def commit(self, header: str, output_file: Union[str, Path]) -> None:
+        """Atomically replaces the output file with the header and both segments."""
+        with atomic_write(output_file, encoding="utf-8") as f:
+            f.write(header)
+            for segment in (self._first, self._second):
+                segment.seek(0)
+                shutil.copyfileobj(segment, f)
+
+    def close(self) -> None:
+        self._first.close()
+        self._second.close()
+
+    def __enter__(self) -> "TwoSegmentWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
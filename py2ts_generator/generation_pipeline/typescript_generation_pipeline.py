@@ -1,8 +1,44 @@
+import hashlib
+import inspect
 import os
+import sys
+import weakref
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Type, Dict, Union
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Type,
+    Dict,
+    Union,
+    Set,
+)
 
+from py2ts_generator.atomic_write.atomic_write import atomic_write
+from py2ts_generator.declaration_cache.declaration_cache import (
+    CachedDeclaration,
+    Declaration,
+    DeclarationCache,
+)
+from py2ts_generator.fingerprint.fingerprint import (
+    ModelFingerprint,
+    compute_model_fingerprint,
+    describe_type,
+    format_fingerprint_header,
+    read_fingerprint_header,
+)
+from py2ts_generator.generation_pipeline.parallel_components import (
+    compile_and_emit_components,
+)
+from py2ts_generator.generation_pipeline.pipeline_caches import PipelineCaches
+from py2ts_generator.generation_pipeline.segment_writer import TwoSegmentWriter
 from py2ts_generator.model.model import Model
+from py2ts_generator.model.py_class import PyClass
+from py2ts_generator.model.py_enum import PyEnum
 from py2ts_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
@@ -16,16 +52,104 @@ from py2ts_generator.model_parser.model_parser import (
     ModelParser,
     ModelParserSettings,
 )
+from py2ts_generator.observer.observer import (
+    ObserverGroup,
+    PipelineObserver,
+    ReportCollector,
+    RunReport,
+)
+from py2ts_generator.output_size.output_size import (
+    OutputSizeBudget,
+    OutputSizeReport,
+)
+from py2ts_generator.output_store.output_store import OutputStore
+from py2ts_generator.source_manifest.source_manifest import (
+    SourceManifest,
+    check_manifest,
+    manifest_path_for,
+)
+from py2ts_generator.tracing.tracing import SpanRecorder
+from py2ts_generator.type_costs.type_costs import TypeCostRecorder
 from py2ts_generator.typescript_emitter.typescript_emitter import (
     TypescriptEmitter,
 )
 from py2ts_generator.typescript_model_compiler.ts_model import TsModel
+from py2ts_generator.typescript_model_compiler.ts_object_type import TsBaseType
 from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
     CaseFormat,
     TypescriptModelCompiler,
+    TypescriptModelCompilerCache,
     TypescriptModelCompilerSettings,
 )
 
+if TYPE_CHECKING:
+    # Only awaiting a run needs asyncio, which is imported by then anyway.
+    import asyncio
+
+
+class NoOutputFileDefined(Exception):
+    def __init__(self):
+        super(NoOutputFileDefined, self).__init__(
+            "No output file was defined, please use to_file() to provide an output file."
+        )
+
+
+class IncompatiblePipelineOptions(ValueError):
+    def __init__(self, option: str, other_option: str):
+        super(IncompatiblePipelineOptions, self).__init__(
+            f"{option} cannot be combined with {other_option}."
+        )
+
+
+@dataclass(frozen=True)
+class GeneratedOutput:
+    """The generated output, exactly as it would be written to the output file."""
+
+    text: str
+    data: bytes
+    content_hash: str
+    fingerprint: str
+
+    @staticmethod
+    def of_text(text: str, fingerprint: str) -> "GeneratedOutput":
+        data = text.encode("utf-8")
+        return GeneratedOutput(
+            text=text,
+            data=data,
+            content_hash=hashlib.sha256(data).hexdigest(),
+            fingerprint=fingerprint,
+        )
+
+
+@dataclass
+class _InFlightRun:
+    task: "asyncio.Task[RunReport]"
+    waiters: int = 0
+
+
+# Runs started by run_async, per event loop and absolute output file.
+_IN_FLIGHT_RUNS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _InFlightRun]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# The declaration cache, streaming and parallel components each compile and
+# emit in their own way, so options of the others would be silently ignored.
+# Worker processes cannot report to the recorders of this process.
+_INCOMPATIBLE_OPTIONS = [
+    ("declaration_cache", "streaming"),
+    ("declaration_cache", "parallel_components"),
+    ("declaration_cache", "compile_threads"),
+    ("declaration_cache", "emit_workers"),
+    ("streaming", "parallel_components"),
+    ("streaming", "compile_threads"),
+    ("streaming", "emit_workers"),
+    ("parallel_components", "compile_threads"),
+    ("parallel_components", "emit_workers"),
+    ("parallel_components", "span_recorder"),
+    ("parallel_components", "type_costs"),
+]
+
 
 class TypeGenerationPipeline:
     def __init__(
@@ -33,49 +157,500 @@ class TypeGenerationPipeline:
         types: List[Type],
         type_overrides: Dict[Type, Type],
         case_format: CaseFormat,
-        output_file: Union[str, Path],
+        output_file: Optional[Union[str, Path]],
         class_parsers: Optional[List[AbstractClassParser]] = None,
+        parallel_components: bool = False,
+        max_workers: Optional[int] = None,
+        compile_threads: Optional[int] = None,
+        emit_workers: Optional[int] = None,
+        caches: Optional[PipelineCaches] = None,
+        streaming: bool = False,
+        declaration_cache: Optional[DeclarationCache] = None,
+        output_store: Optional[OutputStore] = None,
+        observers: Optional[List[PipelineObserver]] = None,
+        span_recorder: Optional[SpanRecorder] = None,
+        type_costs: Optional[TypeCostRecorder] = None,
+        size_budget: Optional[OutputSizeBudget] = None,
     ):
         self.types = types
         self.type_overrides = type_overrides
         self.case_format = case_format
         self.output_file = output_file
         self.class_parsers = class_parsers or [DataclassParser(), SQLAlchemyParser()]
+        self.parallel_components = parallel_components
+        self.max_workers = max_workers
+        self.compile_threads = compile_threads
+        self.emit_workers = emit_workers
+        self.caches = caches
+        self.streaming = streaming
+        self.declaration_cache = declaration_cache
+        self.output_store = output_store
+        self.observers = observers or []
+        self.span_recorder = span_recorder
+        self.type_costs = type_costs
+        self.size_budget = size_budget
+        self._last_output: Optional[GeneratedOutput] = None
+        self._check_options()
+
+    def _check_options(self) -> None:
+        for option, other_option in _INCOMPATIBLE_OPTIONS:
+            if getattr(self, option) and getattr(self, other_option):
+                raise IncompatiblePipelineOptions(option, other_option)
+
+    def run(self) -> RunReport:
+        """Generates the output file.
+
+        :returns: The stages and counters of the run. The report is falsy if
+            the output was up-to-date and left untouched.
+        :raises OutputSizeBudgetExceeded: If the output exceeds a size budget
+            which fails runs.
+        """
+        collector = ReportCollector()
+        observer = ObserverGroup([collector, *self.observers])
+        if self.streaming:
+            written = self._run_streaming(observer)
+        else:
+            written = self._run(observer)
+        return collector.report(written, self._check_output_size(observer))
+
+    def _run(self, observer: ObserverGroup) -> bool:
+        model = self._parse_model(observer)
+        fingerprint = self._fingerprint_model(observer, model)
+        is_up_to_date = self._is_output_up_to_date(fingerprint)
+        if not is_up_to_date and not self._restore_output(observer, fingerprint):
+            emitted_model = self._compile_and_emit_model(observer, model)
+            self._write_model(
+                observer, format_fingerprint_header(fingerprint) + emitted_model
+            )
+            self._store_output(observer, fingerprint)
+        self._write_manifest(observer, model)
+        return not is_up_to_date
+
+    def check_output(self) -> Optional[str]:
+        """Checks if the output is stale without parsing the model.
+
+        Compares the manifest written next to the output against the source
+        files, the generator version and the settings of this pipeline.
+
+        :returns: The reason why the output is stale, or None if it is fresh.
+        """
+        return check_manifest(
+            manifest_path_for(self._output_path), self._settings_fingerprint()
+        )
+
+    def generate(self) -> GeneratedOutput:
+        """Generates the output in memory, without touching the output file.
+
+        The last output is kept, so it is only compiled and emitted again when
+        the fingerprint of the model changes.
+        """
+        observer = ObserverGroup(self.observers)
+        model = self._parse_model(observer)
+        fingerprint = self._fingerprint_model(observer, model)
+        last_output = self._last_output
+        if last_output is None or last_output.fingerprint != fingerprint:
+            emitted_model = self._compile_and_emit_model(observer, model)
+            last_output = GeneratedOutput.of_text(
+                format_fingerprint_header(fingerprint) + emitted_model, fingerprint
+            )
+            if self.size_budget:
+                self.size_budget.check(
+                    OutputSizeReport.of_text(last_output.text), "generated in memory"
+                )
+            self._last_output = last_output
+        return last_output
+
+    async def run_async(self, executor: Optional[Executor] = None) -> RunReport:
+        """Generates the output file without blocking the event loop.
+
+        Parsing, compiling, emitting and writing run in the executor, by default
+        the thread pool of the event loop. Concurrent calls for the same output
+        file share a single run. Cancelling a call cancels the shared run once
+        no other call is waiting for it, at the latest between two stages.
+
+        :returns: The stages and counters of the run, like run(). Calls sharing
+            a run share its report. The report is falsy if the output was
+            up-to-date and left untouched.
+        :raises OutputSizeBudgetExceeded: If the output exceeds a size budget
+            which fails runs.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        runs = _IN_FLIGHT_RUNS.setdefault(loop, {})
+        key = os.path.abspath(self._output_path)
+        in_flight = runs.get(key)
+        if in_flight is None or in_flight.task.done():
+            in_flight = _InFlightRun(loop.create_task(self._run_in_executor(executor)))
+            runs[key] = in_flight
+            in_flight.task.add_done_callback(
+                lambda task: runs.pop(key) if runs.get(key, None) is in_flight else None
+            )
+        in_flight.waiters += 1
+        try:
+            return await asyncio.shield(in_flight.task)
+        except asyncio.CancelledError:
+            if in_flight.waiters == 1:
+                in_flight.task.cancel()
+            raise
+        finally:
+            in_flight.waiters -= 1
+
+    async def _run_in_executor(self, executor: Optional[Executor]) -> RunReport:
+        # Every run observes through a group of its own, so runs of one
+        # pipeline on different event loops never share a collector.
+        collector = ReportCollector()
+        observer = ObserverGroup([collector, *self.observers])
+        written = await self._run_stages_in_executor(executor, observer)
+        output_size = await self._check_output_size_in_executor(executor, observer)
+        return collector.report(written, output_size)
+
+    async def _check_output_size_in_executor(
+        self, executor: Optional[Executor], observer: ObserverGroup
+    ) -> Optional[OutputSizeReport]:
+        import asyncio
 
-    def run(self) -> None:
-        model = self._parse_model()
-        ts_model = self._compile_model(model)
-        emitted_model = self._emit_model(ts_model)
-        self._write_model(emitted_model)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._check_output_size, observer)
 
-    def _parse_model(self) -> Model:
-        model_parser = ModelParser(
+    async def _run_stages_in_executor(
+        self, executor: Optional[Executor], observer: ObserverGroup
+    ) -> bool:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        model = await loop.run_in_executor(executor, self._parse_model, observer)
+        fingerprint = await loop.run_in_executor(
+            executor, self._fingerprint_model, observer, model
+        )
+        is_up_to_date = await loop.run_in_executor(
+            executor, self._is_output_up_to_date, fingerprint
+        )
+        if not is_up_to_date and not await loop.run_in_executor(
+            executor, self._restore_output, observer, fingerprint
+        ):
+            emitted_model = await loop.run_in_executor(
+                executor, self._compile_and_emit_model, observer, model
+            )
+            await loop.run_in_executor(
+                executor,
+                self._write_model,
+                observer,
+                format_fingerprint_header(fingerprint) + emitted_model,
+            )
+            await loop.run_in_executor(
+                executor, self._store_output, observer, fingerprint
+            )
+        await loop.run_in_executor(executor, self._write_manifest, observer, model)
+        return not is_up_to_date
+
+    @property
+    def _output_path(self) -> Union[str, Path]:
+        if self.output_file is None:
+            raise NoOutputFileDefined()
+        return self.output_file
+
+    def _run_streaming(self, observer: ObserverGroup) -> bool:
+        # The model is parsed twice: first to fingerprint it, and only if the
+        # output is stale a second time to compile and emit it. No declaration
+        # is kept between the passes, so the parsed model is never held.
+        types: Set[Type] = set()
+        fingerprint = self._fingerprint_streamed_model(observer, types)
+        is_up_to_date = self._is_output_up_to_date(fingerprint)
+        if not is_up_to_date and not self._restore_output(observer, fingerprint):
+            self._stream_declarations(observer, fingerprint)
+            self._store_output(observer, fingerprint)
+        with observer.stage("manifest"):
+            self._write_manifest_for_types(types)
+        return not is_up_to_date
+
+    def _fingerprint_streamed_model(
+        self, observer: ObserverGroup, types: Set[Type]
+    ) -> str:
+        model_parser = self._model_parser()
+        with observer.stage("parse"):
+            fingerprint = ModelFingerprint(self._fingerprint_settings())
+            # Enums are few, the fingerprint covers them after all classes.
+            py_enums: List[PyEnum] = []
+            for declaration in model_parser.iter_parse():
+                types.add(declaration.type)
+                if isinstance(declaration, PyEnum):
+                    py_enums.append(declaration)
+                    observer.count("enums")
+                else:
+                    fingerprint.add_class(declaration)
+                    observer.count("classes")
+                    observer.count("fields", len(declaration.fields))
+            for py_enum in py_enums:
+                fingerprint.add_enum(py_enum)
+            self._count_parser(observer, model_parser)
+        return fingerprint.hexdigest()
+
+    def _stream_declarations(self, observer: ObserverGroup, fingerprint: str) -> None:
+        # Every declaration is compiled, emitted and spilled to disk on its
+        # own, so neither the compiled model nor the output are held in memory.
+        # The parse costs were recorded by the first pass.
+        model_parser = self._model_parser(record_type_costs=False)
+        compiler = TypescriptModelCompiler(
+            self._compiler_settings(),
+            cache=self._compiler_cache(),
+            span_recorder=self.span_recorder,
+            type_costs=self.type_costs,
+        )
+        emitter = TypescriptEmitter(
+            cache=self._emitter_cache(),
+            span_recorder=self.span_recorder,
+            type_costs=self.type_costs,
+        )
+        emitted_digests: Set[bytes] = set()
+        with TwoSegmentWriter() as writer, observer.stage("stream"):
+            for declaration in model_parser.iter_parse():
+                if isinstance(declaration, PyEnum):
+                    text = emitter.emit_enum(compiler.compile_enum(declaration))
+                    write = writer.write_first
+                else:
+                    text = emitter.emit_type(compiler.compile_class(declaration))
+                    write = writer.write_second
+                # Like the serial pipeline, duplicate declarations are dropped.
+                digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+                if digest not in emitted_digests:
+                    emitted_digests.add(digest)
+                    write(text)
+            self._create_target_folder_if_not_exists()
+            writer.commit(format_fingerprint_header(fingerprint), self._output_path)
+            observer.count("bytes_written", os.path.getsize(self._output_path))
+            observer.count("compiler_cache_hits", compiler.cache_hits)
+
+    def _parse_model(self, observer: ObserverGroup) -> Model:
+        model_parser = self._model_parser()
+        with observer.stage("parse"):
+            model = model_parser.parse()
+        observer.count("classes", len(model.classes))
+        observer.count("enums", len(model.enums))
+        observer.count("fields", sum(len(x.fields) for x in model.classes))
+        self._count_parser(observer, model_parser)
+        return model
+
+    def _count_parser(self, observer: ObserverGroup, model_parser: ModelParser) -> None:
+        observer.count("parser_dispatches", model_parser.parser_dispatches)
+        observer.count("parser_cache_hits", model_parser.cache_hits)
+
+    def _model_parser(self, record_type_costs: bool = True) -> ModelParser:
+        return ModelParser(
             self.types,
             self.class_parsers,
             ModelParserSettings(type_mapping_overrides=self.type_overrides),
+            cache=self.caches.model_parser if self.caches else None,
+            span_recorder=self.span_recorder,
+            type_costs=self.type_costs if record_type_costs else None,
         )
-        model = model_parser.parse()
-        return model
 
-    def _compile_model(self, model: Model) -> TsModel:
-        ts_model = TypescriptModelCompiler(
-            TypescriptModelCompilerSettings(
-                field_case_format=self.case_format,
-                type_mapping_overrides=self.type_overrides,
+    def _fingerprint_model(self, observer: ObserverGroup, model: Model) -> str:
+        with observer.stage("fingerprint"):
+            return compute_model_fingerprint(model, self._fingerprint_settings())
+
+    def _fingerprint_settings(self) -> Dict[str, str]:
+        from py2ts_generator import __version__
+
+        return {
+            "generator_version": __version__,
+            "case_format": self.case_format.value,
+            "type_overrides": self._describe_type_overrides(),
+            "class_parsers": ",".join(
+                describe_type(type(parser)) for parser in self.class_parsers
+            ),
+        }
+
+    def _settings_fingerprint(self) -> str:
+        return ModelFingerprint(self._fingerprint_settings()).hexdigest()
+
+    def _describe_type_overrides(self) -> str:
+        return ",".join(
+            sorted(
+                f"{describe_type(source)}={describe_type(target)}"
+                for source, target in self.type_overrides.items()
             )
-        ).compile(model)
+        )
+
+    def _is_output_up_to_date(self, fingerprint: str) -> bool:
+        return read_fingerprint_header(self._output_path) == fingerprint
+
+    def _compile_and_emit_model(self, observer: ObserverGroup, model: Model) -> str:
+        if self.declaration_cache:
+            with observer.stage("compile_and_emit"):
+                return self._compile_and_emit_cached_declarations(
+                    observer, model, self.declaration_cache
+                )
+        if self.parallel_components:
+            with observer.stage("compile_and_emit"):
+                return compile_and_emit_components(
+                    model,
+                    self._compiler_settings(),
+                    self.max_workers,
+                    # Called within the compile_and_emit stage, so without
+                    # nested stages.
+                    lambda x: self._emit(self._compile(observer, x)),
+                )
+        ts_model = self._compile_model(observer, model)
+        return self._emit_model(observer, ts_model)
+
+    def _compile_and_emit_cached_declarations(
+        self, observer: ObserverGroup, model: Model, declaration_cache: DeclarationCache
+    ) -> str:
+        # Only declarations missing from the cache are compiled and emitted,
+        # the others are taken from the cache as they are.
+        settings_fingerprint = ModelFingerprint(self._fingerprint_settings())
+        declarations: List[Union[PyEnum, PyClass]] = [*model.enums, *model.classes]
+        keys = []
+        for declaration in declarations:
+            fingerprint = settings_fingerprint.copy()
+            if isinstance(declaration, PyEnum):
+                fingerprint.add_enum(declaration)
+            else:
+                fingerprint.add_class(declaration)
+            keys.append(fingerprint.hexdigest())
+        texts = declaration_cache.get_texts(keys)
+        observer.count("declaration_cache_hits", sum(1 for x in keys if x in texts))
+
+        compiler = TypescriptModelCompiler(
+            self._compiler_settings(),
+            cache=self._compiler_cache(),
+            span_recorder=self.span_recorder,
+            type_costs=self.type_costs,
+        )
+        emitter = TypescriptEmitter(
+            cache=self._emitter_cache(),
+            span_recorder=self.span_recorder,
+            type_costs=self.type_costs,
+        )
+        new_entries = []
+        for key, declaration in zip(keys, declarations):
+            if key in texts:
+                continue
+            compiled: Declaration
+            if isinstance(declaration, PyEnum):
+                ts_enum = compiler.compile_enum(declaration)
+                compiled, text = ts_enum, emitter.emit_enum(ts_enum)
+            else:
+                ts_type = compiler.compile_class(declaration)
+                compiled, text = ts_type, emitter.emit_type(ts_type)
+            texts[key] = text
+            new_entries.append(CachedDeclaration(key, compiled, text))
+        declaration_cache.put_many(new_entries)
+        observer.count("compiler_cache_hits", compiler.cache_hits)
+        # Like the other pipelines, duplicate declarations are dropped.
+        return "".join(dict.fromkeys(texts[x] for x in keys))
+
+    def _compile_model(self, observer: ObserverGroup, model: Model) -> TsModel:
+        with observer.stage("compile"):
+            return self._compile(observer, model)
+
+    def _compile(self, observer: ObserverGroup, model: Model) -> TsModel:
+        compiler = TypescriptModelCompiler(
+            self._compiler_settings(),
+            max_workers=self.compile_threads,
+            cache=self._compiler_cache(),
+            span_recorder=self.span_recorder,
+            type_costs=self.type_costs,
+        )
+        ts_model = compiler.compile(model)
+        observer.count("compiler_cache_hits", compiler.cache_hits)
         return ts_model
 
-    def _emit_model(self, ts_model: TsModel) -> str:
-        emitted_model = TypescriptEmitter().emit(ts_model)
-        return emitted_model
+    def _compiler_cache(self) -> Optional[TypescriptModelCompilerCache]:
+        if not self.caches:
+            return None
+        return self.caches.compiler_cache(
+            f"{self.case_format.value};{self._describe_type_overrides()}"
+        )
+
+    def _compiler_settings(self) -> TypescriptModelCompilerSettings:
+        return TypescriptModelCompilerSettings(
+            field_case_format=self.case_format,
+            type_mapping_overrides=self.type_overrides,
+        )
+
+    def _emit_model(self, observer: ObserverGroup, ts_model: TsModel) -> str:
+        with observer.stage("emit"):
+            return self._emit(ts_model)
+
+    def _emit(self, ts_model: TsModel) -> str:
+        return TypescriptEmitter(
+            max_workers=self.emit_workers,
+            cache=self._emitter_cache(),
+            span_recorder=self.span_recorder,
+            type_costs=self.type_costs,
+        ).emit(ts_model)
+
+    def _emitter_cache(self) -> Optional[MutableMapping[TsBaseType, str]]:
+        return self.caches.rendered if self.caches else None
+
+    def _write_model(self, observer: ObserverGroup, emitted_model: str) -> None:
+        with observer.stage("write"):
+            self._create_target_folder_if_not_exists()
+            # Written to a temporary file first, so an interrupted or cancelled
+            # run never leaves a truncated output file behind.
+            with atomic_write(self._output_path) as f:
+                f.write(emitted_model)
+                f.flush()
+                observer.count("bytes_written", os.fstat(f.fileno()).st_size)
+
+    def _restore_output(self, observer: ObserverGroup, fingerprint: str) -> bool:
+        if not self.output_store:
+            return False
+        with observer.stage("restore"):
+            self._create_target_folder_if_not_exists()
+            return self.output_store.restore(fingerprint, self._output_path)
+
+    def _store_output(self, observer: ObserverGroup, fingerprint: str) -> None:
+        if self.output_store:
+            with observer.stage("store"):
+                self.output_store.store(fingerprint, self._output_path)
+
+    def _check_output_size(self, observer: ObserverGroup) -> Optional[OutputSizeReport]:
+        # Up-to-date outputs are checked as well, so budgets also hold for
+        # outputs generated before they were set.
+        if not self.size_budget:
+            return None
+        with observer.stage("size"):
+            output_size = OutputSizeReport.of_file(self._output_path)
+            self.size_budget.check(output_size, str(self._output_path))
+        return output_size
+
+    def _write_manifest(self, observer: ObserverGroup, model: Model) -> None:
+        with observer.stage("manifest"):
+            self._write_manifest_for_types(
+                [*(x.type for x in model.classes), *(x.type for x in model.enums)]
+            )
+
+    def _write_manifest_for_types(self, types: Iterable[Type]) -> None:
+        manifest_path = manifest_path_for(self._output_path)
+        SourceManifest.of_files(
+            self._output_path,
+            self._collect_source_files(types),
+            manifest_path,
+            self._settings_fingerprint(),
+        ).write(manifest_path)
 
-    def _write_model(self, emitted_model: str) -> None:
-        self._create_target_folder_if_not_exists()
-        with open(self.output_file, "w") as f:
-            f.write(emitted_model)
+    def _collect_source_files(self, types: Iterable[Type]) -> Set[str]:
+        # Fields and tagged union information are inherited, so the modules of
+        # base classes contribute to the output as well.
+        modules = {
+            base.__module__
+            for typ in types
+            for base in (inspect.getmro(typ) if isinstance(typ, type) else (typ,))
+        }
+        source_files = set()
+        for module_name in modules:
+            if module_name.partition(".")[0] in sys.stdlib_module_names:
+                continue
+            module = sys.modules.get(module_name)
+            source_file = getattr(module, "__file__", None)
+            if source_file and os.path.isfile(source_file):
+                source_files.add(source_file)
+        return source_files
 
     def _create_target_folder_if_not_exists(self):
-        folder = os.path.dirname(self.output_file)
-        if not os.path.exists(folder):
+        folder = os.path.dirname(self._output_path)
+        if folder and not os.path.exists(folder):
             os.makedirs(folder)
@@ -1,24 +1,34 @@
+import os
 from pathlib import Path
 from typing import List, Type, Dict, Optional
 
-from py2ts_generator.generation_pipeline.typescript_generation_pipeline import (
+from py2ts_generator.declaration_cache.declaration_cache import (
+    DEFAULT_MAX_SIZE as DEFAULT_DECLARATION_CACHE_SIZE,
+    DeclarationCache,
+)
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline import (  # noqa: F401
+    IncompatiblePipelineOptions,
+    NoOutputFileDefined,
     TypeGenerationPipeline,
 )
 from py2ts_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
+from py2ts_generator.observer.observer import PipelineObserver
+from py2ts_generator.output_size.output_size import OutputSizeBudget
+from py2ts_generator.output_store.output_store import (
+    DEFAULT_MAX_SIZE as DEFAULT_OUTPUT_STORE_SIZE,
+    OutputStore,
+)
+from py2ts_generator.profiling.profiling import ProfileOptions, ProfilingObserver
+from py2ts_generator.session.session import GenerationSession
+from py2ts_generator.tracing.tracing import SpanRecorder
+from py2ts_generator.type_costs.type_costs import TypeCostRecorder
 from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
     CaseFormat,
 )
 
 
-class NoOutputFileDefined(Exception):
-    def __init__(self):
-        super(NoOutputFileDefined, self).__init__(
-            "No output file was defined, please use to_file() to provide an output file."
-        )
-
-
 class TypeGenerationPipelineBuilder:
     def __init__(self) -> None:
         self._types: List[Type] = []
@@ -26,6 +36,19 @@ class TypeGenerationPipelineBuilder:
         self._case_format: CaseFormat = CaseFormat.KEEP_CASING
         self._output_file: Optional[str | Path] = None
         self._class_parsers: Optional[List[AbstractClassParser]] = None
+        self._parallel_components: bool = False
+        self._max_workers: Optional[int] = None
+        self._compile_threads: Optional[int] = None
+        self._emit_workers: Optional[int] = None
+        self._streaming: bool = False
+        self._session: Optional[GenerationSession] = None
+        self._declaration_cache: Optional[DeclarationCache] = None
+        self._output_store: Optional[OutputStore] = None
+        self._observers: List[PipelineObserver] = []
+        self._profile: Optional[ProfileOptions] = None
+        self._span_recorder: Optional[SpanRecorder] = None
+        self._type_costs: Optional[TypeCostRecorder] = None
+        self._size_budget: Optional[OutputSizeBudget] = None
 
     def for_types(self, types: List[Type]) -> "TypeGenerationPipelineBuilder":
         self._types = types
@@ -41,6 +64,12 @@ class TypeGenerationPipelineBuilder:
         self._case_format = CaseFormat.CAMEL_CASE
         return self
 
+    def convert_field_names(
+        self, case_format: CaseFormat
+    ) -> "TypeGenerationPipelineBuilder":
+        self._case_format = case_format
+        return self
+
     def to_file(self, path: str | Path) -> "TypeGenerationPipelineBuilder":
         self._output_file = path
         return self
@@ -51,13 +80,143 @@ class TypeGenerationPipelineBuilder:
         self._class_parsers = parsers
         return self
 
+    def compile_components_in_parallel(
+        self, max_workers: Optional[int] = None
+    ) -> "TypeGenerationPipelineBuilder":
+        self._parallel_components = True
+        self._max_workers = max_workers
+        return self
+
+    def compile_with_threads(
+        self, max_workers: Optional[int] = None
+    ) -> "TypeGenerationPipelineBuilder":
+        self._compile_threads = max_workers or os.cpu_count() or 1
+        return self
+
+    def emit_in_parallel(
+        self, max_workers: Optional[int] = None
+    ) -> "TypeGenerationPipelineBuilder":
+        self._emit_workers = max_workers or os.cpu_count() or 1
+        return self
+
+    def stream_output(self) -> "TypeGenerationPipelineBuilder":
+        self._streaming = True
+        return self
+
+    def with_session(
+        self, session: GenerationSession
+    ) -> "TypeGenerationPipelineBuilder":
+        self._session = session
+        return self
+
+    def cache_declarations(
+        self, path: str | Path, max_size: int = DEFAULT_DECLARATION_CACHE_SIZE
+    ) -> "TypeGenerationPipelineBuilder":
+        self._declaration_cache = DeclarationCache(path, max_size)
+        return self
+
+    def store_outputs(
+        self,
+        directory: str | Path,
+        max_size: int = DEFAULT_OUTPUT_STORE_SIZE,
+        max_entries: Optional[int] = None,
+        link: bool = True,
+    ) -> "TypeGenerationPipelineBuilder":
+        """Keeps every output in a store and restores it when it matches again.
+
+        Set link to False to restore outputs by a copy instead of a hardlink,
+        e.g. if other tools change the output file in place.
+        """
+        self._output_store = OutputStore(
+            directory, max_size=max_size, max_entries=max_entries, link=link
+        )
+        return self
+
+    def with_observer(
+        self, observer: PipelineObserver
+    ) -> "TypeGenerationPipelineBuilder":
+        self._observers.append(observer)
+        return self
+
+    def profile(
+        self, memory: bool = False, top: int = 10
+    ) -> "TypeGenerationPipelineBuilder":
+        """Writes a cProfile trace of every stage next to the output file.
+
+        With memory, also traces allocations and writes the top allocation
+        sites of every stage. Pipelines without an output file write them to
+        the working directory.
+        """
+        self._profile = ProfileOptions(memory=memory, top=top)
+        return self
+
+    def record_spans(
+        self, span_recorder: SpanRecorder
+    ) -> "TypeGenerationPipelineBuilder":
+        """Records spans of every stage, parsed, compiled and rendered type."""
+        self._span_recorder = span_recorder
+        return self
+
+    def record_type_costs(
+        self, type_costs: TypeCostRecorder
+    ) -> "TypeGenerationPipelineBuilder":
+        """Records why every type is part of the model and what it costs."""
+        self._type_costs = type_costs
+        return self
+
+    def limit_output_size(
+        self,
+        max_total_size: Optional[int] = None,
+        max_declaration_size: Optional[int] = None,
+        max_fields: Optional[int] = None,
+        fail: bool = False,
+    ) -> "TypeGenerationPipelineBuilder":
+        """Measures the output of every run and checks it against the limits.
+
+        Exceeded limits are logged as warnings, or fail the run if fail is set.
+        Without limits, the output is only measured and reported.
+        """
+        self._size_budget = OutputSizeBudget(
+            max_total_size=max_total_size,
+            max_declaration_size=max_declaration_size,
+            max_fields=max_fields,
+            fail=fail,
+        )
+        return self
+
     def build(self) -> TypeGenerationPipeline:
         if not self._output_file:
             raise NoOutputFileDefined()
+        return self.build_in_memory()
+
+    def build_in_memory(self) -> TypeGenerationPipeline:
+        """Builds a pipeline which does not need an output file.
+
+        Such a pipeline can only generate its output in memory with generate().
+        """
+        observers = list(self._observers)
+        if self._span_recorder is not None:
+            observers.append(self._span_recorder)
+        if self._profile is not None:
+            observers.append(
+                ProfilingObserver(self._output_file or "py2ts", self._profile)
+            )
         return TypeGenerationPipeline(
             self._types,
             self._type_overrides,
             self._case_format,
             self._output_file,
             self._class_parsers,
+            parallel_components=self._parallel_components,
+            max_workers=self._max_workers,
+            compile_threads=self._compile_threads,
+            emit_workers=self._emit_workers,
+            caches=self._session,
+            streaming=self._streaming,
+            declaration_cache=self._declaration_cache,
+            output_store=self._output_store,
+            observers=observers,
+            span_recorder=self._span_recorder,
+            type_costs=self._type_costs,
+            size_budget=self._size_budget,
         )
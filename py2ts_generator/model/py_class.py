@@ -1,28 +1,35 @@
 from dataclasses import dataclass
-from typing import Type, Tuple, Optional, FrozenSet
+from typing import Type, Tuple, Optional
 
 from py2ts_generator.model.py_field import PyField
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaggedUnionInformation:
     discriminant_attribute: str
     discriminant_literal: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RootTaggedUnionInformation(TaggedUnionInformation):
-    discriminant_literals: FrozenSet[str]
-    child_types: FrozenSet[Type]
+    # Tuples rather than sets, so the order of union members in the output is
+    # the definition order and does not depend on hashing or object ids.
+    discriminant_literals: Tuple[str, ...]
+    child_types: Tuple[Type, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PyClass:
     name: str
     type: Type
     fields: Tuple[PyField, ...]
     tagged_union_information: Optional[TaggedUnionInformation] = None
 
+    def __hash__(self) -> int:
+        # Equal classes always share name and type, hashing just these keeps
+        # adding classes to sets O(1) instead of hashing every field.
+        return hash((self.name, self.type))
+
     def with_tagged_union_information(self, tagged_union_information):
         # type: (TaggedUnionInformation)->PyClass
         return PyClass(
@@ -2,14 +2,17 @@ from dataclasses import dataclass
 from typing import Type, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PyEnumValue:
     name: str
     value: object
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PyEnum:
     name: str
     type: Type
     values: Tuple[PyEnumValue, ...]
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.type))
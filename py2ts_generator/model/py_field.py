@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from typing import Type
+from typing import Optional, Type
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PyField:
     name: str
     type: Type
+    # Explicit TypeScript name, which is not converted to the case format.
+    alias: Optional[str] = None
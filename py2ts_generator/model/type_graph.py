@@ -0,0 +1,53 @@
+from typing import Any, Dict, Iterator, List, Type
+
+from py2ts_generator.model.model import Model
+from py2ts_generator.model.py_class import PyClass, RootTaggedUnionInformation
+
+
+def connected_components(model: Model) -> List[Model]:
+    """Splits a model into independent parts.
+
+    Classes and enums are connected if one references the other through a
+    field type, including generic arguments, or through a tagged union. The
+    components keep the declaration order of the model and are ordered by
+    their first declaration.
+    """
+    nodes: List[Any] = [*model.classes, *model.enums]
+    index_by_type: Dict[Type, int] = {x.type: i for i, x in enumerate(nodes)}
+    parents = list(range(len(nodes)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    for index, py_class in enumerate(model.classes):
+        for referenced_type in _referenced_types(py_class):
+            other_index = index_by_type.get(referenced_type)
+            if other_index is not None:
+                root, other_root = find(index), find(other_index)
+                if root != other_root:
+                    parents[max(root, other_root)] = min(root, other_root)
+
+    components: Dict[int, Model] = {}
+    for index, node in enumerate(nodes):
+        component = components.setdefault(find(index), Model())
+        if index < len(model.classes):
+            component.classes.add(node)
+        else:
+            component.enums.add(node)
+    return [components[x] for x in sorted(components)]
+
+
+def _referenced_types(py_class: PyClass) -> Iterator[Type]:
+    for py_field in py_class.fields:
+        yield from _flatten_type(py_field.type)
+    if isinstance(py_class.tagged_union_information, RootTaggedUnionInformation):
+        yield from py_class.tagged_union_information.child_types
+
+
+def _flatten_type(cls: Any) -> Iterator[Type]:
+    yield cls
+    for arg in getattr(cls, "__args__", None) or ():
+        yield from _flatten_type(arg)
@@ -6,6 +6,7 @@ from py2ts_generator.model.py_field import PyField
 from py2ts_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
+from py2ts_generator.naming.naming import ALIAS_METADATA_KEY
 from py2ts_generator.typing_utils.typing_utils import UnknownTypeError, get_type
 
 
@@ -39,6 +40,12 @@ class DataclassParser(AbstractClassParser):
             else:
                 typ = field_type
 
-            py_fields.append(PyField(name=field.name, type=typ))
+            py_fields.append(
+                PyField(
+                    name=field.name,
+                    type=typ,
+                    alias=field.metadata.get(ALIAS_METADATA_KEY),
+                )
+            )
 
         return PyClass(name=cls.__name__, type=cls, fields=tuple(py_fields))
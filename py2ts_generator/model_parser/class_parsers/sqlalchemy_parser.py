@@ -1,14 +1,12 @@
-from typing import List, Type
-
-from sqlalchemy import Column
-import sqlalchemy.inspection
-from sqlalchemy.sql.type_api import TypeEngine
+import sys
+from typing import List, Set, Type
 
 from py2ts_generator.model.py_class import PyClass
 from py2ts_generator.model.py_field import PyField
 from py2ts_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
+from py2ts_generator.naming.naming import ALIAS_METADATA_KEY
 from py2ts_generator.typing_utils.typing_utils import UnknownTypeError
 
 
@@ -21,6 +19,12 @@ class NotASQLAlchemyModelException(RuntimeError):
 
 class SQLAlchemyParser(AbstractClassParser):
     def accepts_class(self, cls: Type) -> bool:
+        # Classes can only be SQLAlchemy models once SQLAlchemy is imported, so
+        # generating other models never pays for importing it.
+        if "sqlalchemy" not in sys.modules:
+            return False
+        import sqlalchemy.inspection
+
         try:
             sqlalchemy.inspection.inspect(cls)
             return True
@@ -30,13 +34,24 @@ class SQLAlchemyParser(AbstractClassParser):
     def parse(self, cls: Type) -> PyClass:
         if not self.accepts_class(cls):
             raise NotASQLAlchemyModelException(cls)
+        import sqlalchemy.inspection
+        from sqlalchemy import Column
+        from sqlalchemy.sql.type_api import TypeEngine
 
         fields: List[PyField] = []
+        keys: Set[str] = set()
         inspector = sqlalchemy.inspection.inspect(cls)
 
-        for col in inspector.columns:
+        # Columns are keyed by the attribute they are mapped to, which may
+        # differ from the key of the column itself.
+        for key, col in inspector.columns.items():
             if not isinstance(col, Column):
                 raise UnknownTypeError(type(col).__name__)
+            # With joined table inheritance, the primary key of a subclass is
+            # mapped to the columns of both tables under the same attribute.
+            if key in keys:
+                continue
+            keys.add(key)
 
             typ: Type
             if isinstance(col.type, TypeEngine):
@@ -44,6 +59,11 @@ class SQLAlchemyParser(AbstractClassParser):
             else:
                 typ = col.type
 
-            fields.append(PyField(name=col.name, type=typ))
+            # Fields are named after the column key, or else the attribute, like
+            # the attributes of the model instances. Both follow the case
+            # format, only a name from the info of the column is used as it is.
+            name = col.key if col.key != col.name else key
+            alias = col.info.get(ALIAS_METADATA_KEY)
+            fields.append(PyField(name=name, type=typ, alias=alias))
 
         return PyClass(name=cls.__name__, type=cls, fields=tuple(fields))
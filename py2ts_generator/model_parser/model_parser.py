@@ -1,20 +1,26 @@
 import inspect
 import logging
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field as dataclasses_field
 from datetime import datetime
 from enum import Enum
 from typing import (
+    Callable,
+    Generator,
+    Iterator,
     List,
+    Set,
     Type,
     TypeVar,
     Any,
     Generic,
     Union,
     Dict,
+    MutableMapping,
     Optional,
+    Tuple,
     cast,
-    Set,
 )
 from typing import _GenericAlias  # type: ignore
 from uuid import UUID
@@ -34,6 +40,8 @@ from py2ts_generator.model.py_enum import PyEnum, PyEnumValue
 from py2ts_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
+from py2ts_generator.tracing.tracing import SpanRecorder, span_name
+from py2ts_generator.type_costs.type_costs import EdgeKind, TypeCostRecorder
 from py2ts_generator.typing_utils.typing_utils import (
     get_wrapped_type_from_optional,
     safe_unwrap,
@@ -82,84 +90,221 @@ class ModelParserSettings:
     type_mapping_overrides: Dict[Type, Type] = dataclasses_field(default_factory=dict)
 
 
+@dataclass
+class ModelParserCache:
+    """Parser decisions and parsed classes, which can be shared between parsers.
+
+    Entries are keyed by the class of the parser, so parsers sharing a cache must
+    not be configured differently per instance.
+    """
+
+    parser_indices: MutableMapping[
+        Tuple[Type, Tuple[Type, ...]], Optional[int]
+    ] = dataclasses_field(default_factory=dict)
+    parsed_classes: MutableMapping[Tuple[Type, Type], PyClass] = dataclasses_field(
+        default_factory=dict
+    )
+
+
+@dataclass
+class _ParseState:
+    streaming: bool
+    class_types: Set[Type] = dataclasses_field(default_factory=set)
+    enum_types: Set[Type] = dataclasses_field(default_factory=set)
+    # Parsed classes and enums in model order. When streaming, they are
+    # removed again once they have been yielded.
+    classes: "OrderedDict[Type, PyClass]" = dataclasses_field(
+        default_factory=OrderedDict
+    )
+    enums: "OrderedDict[Type, PyEnum]" = dataclasses_field(default_factory=OrderedDict)
+    # Tagged union classes, which are moved to the end of the model once their
+    # parents or children have been parsed.
+    pending_types: Set[Type] = dataclasses_field(default_factory=set)
+
+
+_Declarations = Generator[Union[PyClass, PyEnum], None, None]
+
+
 class ModelParser:
     def __init__(
         self,
         classes_to_parse: List[Type],
         parsers: List[P],
         settings: ModelParserSettings,
+        cache: Optional[ModelParserCache] = None,
+        span_recorder: Optional[SpanRecorder] = None,
+        type_costs: Optional[TypeCostRecorder] = None,
     ):
         self._classes_to_parse = classes_to_parse
         self._parsers = parsers
         self._settings = settings
+        # Within one parse every class is only parsed once, so without a shared
+        # cache nothing is cached.
+        self._cache = cache
+        self._parser_types = tuple(type(x) for x in parsers)
+        self._span_recorder = span_recorder
+        self._type_costs = type_costs
+        # Chosen once, so parses without a recorder do not pay for spans.
+        self._parse_class: Callable[[Type, _ParseState], _Declarations] = (
+            self._parse_untraced_class
+            if span_recorder is None
+            else self._parse_traced_class
+        )
+        # Counters of the parses of this parser.
+        self.parser_dispatches = 0
+        self.cache_hits = 0
 
     def parse(self) -> Model:
-        visited_classes: OrderedSet[PyClass] = OrderedSet()
-        visited_enums: OrderedSet[PyEnum] = OrderedSet()
+        state = _ParseState(streaming=False)
         for cls in self._classes_to_parse:
-            self._parse_class(cls, visited_classes, visited_enums)
+            self._discover(cls, None, EdgeKind.ROOT)
+            for _ in self._parse_class(cls, state):
+                pass
 
-        return Model(classes=visited_classes, enums=visited_enums)
+        return Model(
+            classes=OrderedSet(state.classes.values()),
+            enums=OrderedSet(state.enums.values()),
+        )
 
-    def _parse_class(
-        self,
-        cls: Type,
-        visited_classes: OrderedSet[PyClass],
-        visited_enums: OrderedSet[PyEnum],
-    ) -> None:
-        if cls in {x.type for x in visited_classes}:
+    def iter_parse(self) -> Iterator[Union[PyClass, PyEnum]]:
+        """Parses the model, yielding every class and enum once it is final.
+
+        Classes are yielded in the order of parse(), enums in the order of
+        parse() as well, but classes and enums are interleaved. Yielded
+        declarations are not kept, so the memory needed does not grow with the
+        size of the model.
+        """
+        state = _ParseState(streaming=True)
+        for cls in self._classes_to_parse:
+            self._discover(cls, None, EdgeKind.ROOT)
+            yield from self._parse_class(cls, state)
+
+    def _parse_traced_class(self, cls: Type, state: _ParseState) -> _Declarations:
+        if cls in state.class_types:
+            return
+        # The span includes the classes discovered through this one.
+        with safe_unwrap(self._span_recorder).span(span_name(cls), "parse"):
+            yield from self._parse_untraced_class(cls, state)
+
+    def _parse_untraced_class(self, cls: Type, state: _ParseState) -> _Declarations:
+        if cls in state.class_types:
             return
         if not self._is_class(cls):
             raise IsNotAClassException(cls)
 
         type_override = self._settings.type_mapping_overrides.get(cls)
         if type_override:
-            return self._parse_class(type_override, visited_classes, visited_enums)
+            self._discover(type_override, cls, EdgeKind.OVERRIDE)
+            yield from self._parse_class(type_override, state)
+            return
 
         is_enum = self._is_enum(cls)
         if is_enum:
-            self._parse_enum(cls, visited_enums)
+            self._parse_enum(cls, state)
+            yield from self._yield_final_declarations(state)
             return
 
         if is_optional_type(cls):
-            self._parse_class(
-                get_wrapped_type_from_optional(cls), visited_classes, visited_enums
-            )
+            wrapped_type = get_wrapped_type_from_optional(cls)
+            self._discover(wrapped_type, cls, EdgeKind.OPTIONAL)
+            yield from self._parse_class(wrapped_type, state)
             return
 
         has_generic_args = len(get_args(cls)) > 0
         if has_generic_args:
             for arg in get_args(cls):
-                self._parse_class(arg, visited_classes, visited_enums)
+                self._discover(arg, cls, EdgeKind.GENERIC)
+                yield from self._parse_class(arg, state)
 
         if self._is_terminating_class(cls):
             return
 
-        for parser in self._parsers:
-            if parser.accepts_class(cls):
-                py_class = parser.parse(cls)
-                visited_classes.add(py_class)
-                if self._is_tagged_union_class(cls):
-                    new_py_cls = self._parse_as_tagged_union_class(
-                        py_class, visited_classes, visited_enums
-                    )
-                    visited_classes.remove(py_class)
-                    visited_classes.add(new_py_cls)
-                    py_class = new_py_cls
-                self._parse_fields(py_class, visited_classes, visited_enums)
+        parser = self._find_parser(cls)
+        if parser is None:
+            raise NoParserForClassFoundException(cls)
+        py_class = self._parse_with(parser, cls)
+        state.class_types.add(py_class.type)
+        state.classes[py_class.type] = py_class
+        if self._is_tagged_union_class(cls):
+            state.pending_types.add(py_class.type)
+            py_class = yield from self._parse_as_tagged_union_class(py_class, state)
+            state.pending_types.discard(py_class.type)
+            # Tagged union classes come after their parents or children.
+            del state.classes[py_class.type]
+            state.classes[py_class.type] = py_class
+        yield from self._yield_final_declarations(state)
+        yield from self._parse_fields(py_class, state)
+
+    def _yield_final_declarations(self, state: _ParseState) -> _Declarations:
+        if not state.streaming:
+            return
+        while state.enums:
+            yield state.enums.popitem(last=False)[1]
+        while state.classes:
+            cls = next(iter(state.classes))
+            if cls in state.pending_types:
                 return
+            yield state.classes.popitem(last=False)[1]
 
-        raise NoParserForClassFoundException(cls)
+    def _find_parser(self, cls: Type) -> Optional[AbstractClassParser]:
+        if self._cache is None:
+            return next((x for x in self._parsers if x.accepts_class(cls)), None)
+        key = (cls, self._parser_types)
+        try:
+            index = self._cache.parser_indices[key]
+        except KeyError:
+            index = next(
+                (i for i, x in enumerate(self._parsers) if x.accepts_class(cls)),
+                None,
+            )
+            self._cache.parser_indices[key] = index
+        return None if index is None else self._parsers[index]
 
-    def _parse_fields(
+    def _discover(
         self,
-        py_class: PyClass,
-        visited_classes: OrderedSet[PyClass],
-        visited_enums: OrderedSet[PyEnum],
+        cls: Type,
+        source: Optional[Type],
+        edge: EdgeKind,
+        field_name: Optional[str] = None,
     ) -> None:
+        if self._type_costs is not None:
+            self._type_costs.discovered(cls, source, edge, field_name)
+
+    def _parse_with(self, parser: AbstractClassParser, cls: Type) -> PyClass:
+        if self._type_costs is None:
+            return self._parse_uncosted_with(parser, cls)
+        start = time.perf_counter()
+        py_class = self._parse_uncosted_with(parser, cls)
+        self._type_costs.parsed(cls, time.perf_counter() - start)
+        return py_class
+
+    def _parse_uncosted_with(self, parser: AbstractClassParser, cls: Type) -> PyClass:
+        if self._cache is None:
+            self.parser_dispatches += 1
+            return self._dispatch(parser, cls)
+        key = (cls, type(parser))
+        py_class = self._cache.parsed_classes.get(key)
+        if py_class is None:
+            self.parser_dispatches += 1
+            py_class = self._dispatch(parser, cls)
+            self._cache.parsed_classes[key] = py_class
+        else:
+            self.cache_hits += 1
+        return py_class
+
+    def _dispatch(self, parser: AbstractClassParser, cls: Type) -> PyClass:
+        if self._span_recorder is None:
+            return parser.parse(cls)
+        with self._span_recorder.span(
+            f"{type(parser).__name__}.parse", "parse", {"class": span_name(cls)}
+        ):
+            return parser.parse(cls)
+
+    def _parse_fields(self, py_class: PyClass, state: _ParseState) -> _Declarations:
         for field in py_class.fields:
-            if field.type not in {x.type for x in visited_classes}:
-                self._parse_class(field.type, visited_classes, visited_enums)
+            self._discover(field.type, py_class.type, EdgeKind.FIELD, field.name)
+            if field.type not in state.class_types:
+                yield from self._parse_class(field.type, state)
 
     def _is_class(self, cls: Type) -> bool:
         if (
@@ -178,15 +323,17 @@ class ModelParser:
             return True
         return cls in TERMINATING_CLASSES
 
-    def _parse_enum(self, cls: Type, visited_enums: OrderedSet[PyEnum]) -> None:
-        if cls not in {x.type for x in visited_enums}:
-            visited_enums.add(
-                PyEnum(
-                    name=cls.__name__,
-                    type=cls,
-                    values=tuple([PyEnumValue(e.name, e.value) for e in cls]),
-                )
+    def _parse_enum(self, cls: Type, state: _ParseState) -> None:
+        if cls not in state.enum_types:
+            start = time.perf_counter()
+            state.enum_types.add(cls)
+            state.enums[cls] = PyEnum(
+                name=cls.__name__,
+                type=cls,
+                values=tuple([PyEnumValue(e.name, e.value) for e in cls]),
             )
+            if self._type_costs is not None:
+                self._type_costs.parsed(cls, time.perf_counter() - start)
 
     def _is_enum(self, cls: Type) -> bool:
         try:
@@ -198,15 +345,12 @@ class ModelParser:
         return self._read_discriminant_union_attribute_name(cls) is not None
 
     def _parse_as_tagged_union_class(
-        self,
-        py_class: PyClass,
-        visited_classes: OrderedSet[PyClass],
-        visited_enums: OrderedSet[PyEnum],
-    ) -> PyClass:
+        self, py_class: PyClass, state: _ParseState
+    ) -> Generator[Union[PyClass, PyEnum], None, PyClass]:
         if self._is_tagged_union_root(py_class):
             child_classes = self._get_child_classes(py_class.type)
 
-            discriminant_literals = set()
+            discriminant_literals: OrderedSet[str] = OrderedSet()
 
             parent_discriminator = self._read_discriminant_union_attribute(
                 py_class.type
@@ -215,10 +359,11 @@ class ModelParser:
                 discriminant_literals.add(parent_discriminator)
 
             for child in child_classes:
+                self._discover(child, py_class.type, EdgeKind.CHILD)
                 discriminant_literals.add(
                     self._read_discriminant_union_attribute(child)
                 )
-                self._parse_class(child, visited_classes, visited_enums)
+                yield from self._parse_class(child, state)
 
             tagged_union_information: TaggedUnionInformation = (
                 RootTaggedUnionInformation(
@@ -228,15 +373,16 @@ class ModelParser:
                     discriminant_literal=safe_unwrap(
                         self._read_discriminant_union_attribute(py_class.type)
                     ),
-                    discriminant_literals=frozenset(discriminant_literals),
-                    child_types=frozenset(child_classes),
+                    discriminant_literals=tuple(discriminant_literals),
+                    child_types=tuple(child_classes),
                 )
             )
             return py_class.with_tagged_union_information(tagged_union_information)
         else:
             parent_classes = self._get_parent_classes(py_class.type)
             for parent_class in parent_classes:
-                self._parse_class(parent_class, visited_classes, visited_enums)
+                self._discover(parent_class, py_class.type, EdgeKind.PARENT)
+                yield from self._parse_class(parent_class, state)
             tagged_union_information = TaggedUnionInformation(
                 discriminant_attribute=safe_unwrap(
                     self._read_discriminant_union_attribute_name(py_class.type)
@@ -253,18 +399,20 @@ class ModelParser:
             return True
         return not any(filter(lambda x: self._is_tagged_union_class(x), parents))
 
-    def _get_parent_classes(self, cls: Type) -> Set[Type]:
-        parents = {*inspect.getmro(cls)}
-        parents.remove(cls)
-        parents.remove(object)
-        return parents
+    def _get_parent_classes(self, cls: Type) -> List[Type]:
+        return [x for x in inspect.getmro(cls) if x is not cls and x is not object]
 
     def _get_child_classes(self, cls: Type) -> OrderedSet[Type]:
         classes: OrderedSet[Type] = OrderedSet()
+        self._collect_child_classes(cls, classes)
+        return classes
+
+    def _collect_child_classes(self, cls: Type, classes: OrderedSet[Type]) -> None:
+        # Children are collected into a single set, merging the sets of every
+        # level is quadratic in the depth of the hierarchy.
         for cl in cls.__subclasses__():
             classes.add(cl)
-            classes.update(self._get_child_classes(cl))
-        return classes
+            self._collect_child_classes(cl, classes)
 
     def _read_discriminant_union_attribute_name(self, cls: Type) -> Optional[str]:
         try:
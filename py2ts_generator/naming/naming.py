@@ -0,0 +1,39 @@
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Dict, cast
+
+from caseconverter import camelcase, kebabcase, pascalcase  # type: ignore
+
+# Field names like id or created_at recur in many classes, so every distinct
+# name is only converted once. The bound keeps long-lived processes generating
+# many models from growing the memo without limit.
+NAME_CACHE_SIZE = 65536
+
+# Key of an explicit TypeScript name in dataclasses.field(metadata=...) or in
+# the info of a SQLAlchemy column, which is used as it is.
+ALIAS_METADATA_KEY = "py2ts_name"
+
+
+class CaseFormat(Enum):
+    KEEP_CASING = "KEEP_CASING"
+    CAMEL_CASE = "CAMEL_CASE"
+    PASCAL_CASE = "PASCAL_CASE"
+    KEBAB_CASE = "KEBAB_CASE"
+
+
+_CONVERTERS: Dict[CaseFormat, Callable[[str], str]] = {
+    CaseFormat.CAMEL_CASE: camelcase,
+    CaseFormat.PASCAL_CASE: pascalcase,
+    CaseFormat.KEBAB_CASE: kebabcase,
+}
+
+
+def convert_name(name: str, case_format: CaseFormat) -> str:
+    if case_format == CaseFormat.KEEP_CASING:
+        return name
+    return _convert_name(name, case_format)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _convert_name(name: str, case_format: CaseFormat) -> str:
+    return cast(str, _CONVERTERS[case_format](name))
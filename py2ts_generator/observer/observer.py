@@ -0,0 +1,131 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from py2ts_generator.output_size.output_size import OutputSizeReport
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    # CPU time is the one of the whole process, so it includes other threads,
+    # e.g. of a thread-pool compile.
+    wall_time: float
+    cpu_time: float
+
+    def __add__(self, other: "StageTiming") -> "StageTiming":
+        return StageTiming(
+            wall_time=self.wall_time + other.wall_time,
+            cpu_time=self.cpu_time + other.cpu_time,
+        )
+
+
+class PipelineObserver:
+    """Receives the events of pipeline runs.
+
+    Stages are parse, fingerprint, compile, emit, write and manifest. Pipelines
+    which compile and emit in one go, with a declaration cache or in parallel
+    components, report compile_and_emit instead of compile and emit, streaming
+    pipelines report stream instead of all of them but manifest. Pipelines with
+    an output store also report restore and store, pipelines with a size budget
+    size.
+
+    Counters are classes, enums, fields, parser_dispatches, parser_cache_hits,
+    compiler_cache_hits, declaration_cache_hits and bytes_written.
+
+    All methods do nothing by default, so observers only override the events
+    they are interested in.
+    """
+
+    def stage_started(self, stage: str) -> None:
+        pass
+
+    def stage_finished(self, stage: str, timing: StageTiming) -> None:
+        pass
+
+    def counted(self, counter: str, value: int) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class RunReport:
+    """The stages and counters of a pipeline run.
+
+    A report is truthy if the output file was written, like the return value
+    of run() before it returned reports. The output size is only measured for
+    pipelines with a size budget.
+    """
+
+    written: bool
+    stages: Dict[str, StageTiming]
+    counters: Dict[str, int]
+    output_size: Optional[OutputSizeReport] = None
+
+    def __bool__(self) -> bool:
+        return self.written
+
+    @property
+    def wall_time(self) -> float:
+        return sum(x.wall_time for x in self.stages.values())
+
+    def summary(self) -> str:
+        lines = [
+            f"{stage:<16} {timing.wall_time:8.3f}s wall {timing.cpu_time:8.3f}s cpu"
+            for stage, timing in self.stages.items()
+        ]
+        lines.extend(
+            f"{counter:<24} {value}" for counter, value in self.counters.items()
+        )
+        return "\n".join(lines)
+
+
+class ReportCollector(PipelineObserver):
+    """Collects the events of a run into a RunReport."""
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, StageTiming] = {}
+        self.counters: Dict[str, int] = {}
+
+    def stage_finished(self, stage: str, timing: StageTiming) -> None:
+        previous = self.stages.get(stage)
+        self.stages[stage] = timing if previous is None else previous + timing
+
+    def counted(self, counter: str, value: int) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def report(
+        self, written: bool, output_size: Optional[OutputSizeReport] = None
+    ) -> RunReport:
+        return RunReport(
+            written=written,
+            stages=dict(self.stages),
+            counters=dict(self.counters),
+            output_size=output_size,
+        )
+
+
+class ObserverGroup:
+    """Notifies many observers of the events of a run."""
+
+    def __init__(self, observers: Iterable[PipelineObserver]) -> None:
+        self.observers: List[PipelineObserver] = list(observers)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        for observer in self.observers:
+            observer.stage_started(stage)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            timing = StageTiming(
+                wall_time=time.perf_counter() - wall_start,
+                cpu_time=time.process_time() - cpu_start,
+            )
+            for observer in self.observers:
+                observer.stage_finished(stage, timing)
+
+    def count(self, counter: str, value: int = 1) -> None:
+        for observer in self.observers:
+            observer.counted(counter, value)
@@ -0,0 +1,156 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+INTERFACE = "interface"
+ENUM = "enum"
+UNION = "union"
+
+_DECLARATION_PREFIXES = (
+    ("export interface ", INTERFACE),
+    ("export enum ", ENUM),
+    ("export type ", UNION),
+)
+
+
+class OutputSizeBudgetExceeded(RuntimeError):
+    def __init__(self, output: str, violations: List[str]) -> None:
+        super().__init__(
+            f"The output {output} exceeds its size budget: {'; '.join(violations)}."
+        )
+        self.violations = violations
+
+
+@dataclass(frozen=True)
+class DeclarationSize:
+    name: str
+    kind: str
+    # Bytes of the rendered declaration.
+    size: int
+    # Fields of interfaces, values of enums and members of unions.
+    field_count: int
+
+
+@dataclass(frozen=True)
+class OutputSizeReport:
+    total_size: int
+    declarations: Tuple[DeclarationSize, ...]
+
+    @staticmethod
+    def of_text(text: str) -> "OutputSizeReport":
+        """Measures the declarations of generated output."""
+        declarations: List[DeclarationSize] = []
+        current: Optional[Tuple[str, str]] = None
+        size = 0
+        field_count = 0
+        for line in text.splitlines(keepends=True):
+            line_size = len(line.encode("utf-8"))
+            if current is None:
+                declaration = _start_declaration(line)
+                if declaration is None:
+                    continue
+                name, kind = declaration
+                if kind == UNION:
+                    # Unions are rendered on a single line.
+                    members = line.split(" = ", 1)[1].rstrip(";\n")
+                    member_count = 0 if members == "{}" else members.count(" | ") + 1
+                    declarations.append(
+                        DeclarationSize(name, kind, line_size, member_count)
+                    )
+                    continue
+                current, size, field_count = (name, kind), line_size, 0
+                continue
+            size += line_size
+            if line.startswith("}"):
+                declarations.append(DeclarationSize(*current, size, field_count))
+                current = None
+            else:
+                field_count += 1
+        return OutputSizeReport(
+            total_size=len(text.encode("utf-8")), declarations=tuple(declarations)
+        )
+
+    @staticmethod
+    def of_file(path: Union[str, Path]) -> "OutputSizeReport":
+        with open(path, encoding="utf-8") as f:
+            return OutputSizeReport.of_text(f.read())
+
+    def largest(
+        self, top: Optional[int] = None, kind: Optional[str] = None
+    ) -> List[DeclarationSize]:
+        declarations = [x for x in self.declarations if kind is None or x.kind == kind]
+        return sorted(declarations, key=lambda x: x.size, reverse=True)[:top]
+
+    def summary(self, top: int = 10) -> str:
+        lines = [
+            f"{self.total_size} bytes, {len(self.declarations)} declarations,"
+            f" {sum(x.field_count for x in self.declarations)} fields"
+        ]
+        for kind in (INTERFACE, ENUM, UNION):
+            largest = self.largest(top, kind)
+            if largest:
+                lines.append(f"largest {kind}s:")
+                lines.extend(
+                    f"  {x.size:10}B {x.field_count:6} fields  {x.name}"
+                    for x in largest
+                )
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class OutputSizeBudget:
+    """Limits of the generated output, None means unlimited.
+
+    Exceeding a limit logs a warning, or fails the run if fail is set.
+    """
+
+    max_total_size: Optional[int] = None
+    max_declaration_size: Optional[int] = None
+    max_fields: Optional[int] = None
+    fail: bool = False
+
+    def violations(self, report: OutputSizeReport) -> List[str]:
+        violations = []
+        if self.max_total_size is not None and report.total_size > self.max_total_size:
+            violations.append(
+                f"{report.total_size} bytes exceed {self.max_total_size} bytes"
+            )
+        for declaration in report.declarations:
+            if (
+                self.max_declaration_size is not None
+                and declaration.size > self.max_declaration_size
+            ):
+                violations.append(
+                    f"{declaration.name} has {declaration.size} bytes,"
+                    f" more than {self.max_declaration_size} bytes"
+                )
+            if (
+                self.max_fields is not None
+                and declaration.field_count > self.max_fields
+            ):
+                violations.append(
+                    f"{declaration.name} has {declaration.field_count} fields,"
+                    f" more than {self.max_fields} fields"
+                )
+        return violations
+
+    def check(self, report: OutputSizeReport, output: str) -> None:
+        violations = self.violations(report)
+        if not violations:
+            return
+        if self.fail:
+            raise OutputSizeBudgetExceeded(output, violations)
+        for violation in violations:
+            logger.warning(
+                "The output %s exceeds its size budget: %s.", output, violation
+            )
+
+
+def _start_declaration(line: str) -> Optional[Tuple[str, str]]:
+    for prefix, kind in _DECLARATION_PREFIXES:
+        if line.startswith(prefix):
+            return line[len(prefix) :].split(" ", 1)[0], kind  # noqa: E203
+    return None
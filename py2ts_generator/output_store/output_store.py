@@ -0,0 +1,141 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from py2ts_generator.atomic_write.atomic_write import temporary_path
+from py2ts_generator.fingerprint.fingerprint import read_fingerprint_header
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+_OBJECT_SUFFIX = ".ts"
+# Restored outputs may be hardlinks of their object, so the last use of an
+# object is recorded by the modification time of an empty file next to it.
+# Touching the object itself would change the output files too.
+_USED_SUFFIX = ".used"
+
+
+class OutputStore:
+    """Local content-addressed store of generated output files.
+
+    Outputs are stored under their fingerprint, which covers the model and the
+    pipeline settings. An output generated before, e.g. on another branch, is
+    restored without compiling or emitting anything: by a hardlink when
+    possible, by a copy otherwise. Once the store exceeds max_size bytes or
+    max_entries outputs, the least recently used outputs are evicted.
+
+    Outputs restored by a hardlink share their content with the store, the
+    pipeline only ever replaces output files and never changes them in place.
+    Set link to False if other tools do.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_entries: Optional[int] = None,
+        link: bool = True,
+    ):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.link = link
+
+    def restore(self, fingerprint: str, output_file: Union[str, Path]) -> bool:
+        """Restores a stored output.
+
+        :returns: False if there is no output with the fingerprint.
+        """
+        object_path = self._object_path(fingerprint)
+        if read_fingerprint_header(object_path) != fingerprint:
+            return False
+        tmp_path = temporary_path(output_file)
+        try:
+            if not self._link(object_path, tmp_path):
+                shutil.copyfile(object_path, tmp_path)
+            self._mark_used(object_path)
+        except FileNotFoundError:
+            # Evicted by a concurrent process in the meantime.
+            return False
+        os.replace(tmp_path, output_file)
+        return True
+
+    def store(self, fingerprint: str, output_file: Union[str, Path]) -> None:
+        """Stores a copy of an output file and evicts the least recently used
+        outputs."""
+        object_path = self._object_path(fingerprint)
+        if os.path.exists(object_path):
+            self._mark_used(object_path)
+            return
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        # Outputs are copied in under a unique name and then renamed, so
+        # concurrent processes never see a partially written output.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(object_path), suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(output_file, tmp_path)
+            os.replace(tmp_path, object_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._mark_used(object_path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = self._entries()
+        entries.sort(reverse=True)
+        kept_size = 0
+        for index, (_, size, path) in enumerate(entries):
+            kept_size += size
+            if kept_size > self.max_size or (
+                self.max_entries is not None and index >= self.max_entries
+            ):
+                for evicted_path in (path, _used_path(path)):
+                    try:
+                        os.remove(evicted_path)
+                    except FileNotFoundError:
+                        pass
+
+    def _entries(self) -> List[Tuple[int, int, str]]:
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(_OBJECT_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                try:
+                    used_at = os.stat(_used_path(path)).st_mtime_ns
+                except FileNotFoundError:
+                    used_at = stat.st_mtime_ns
+                entries.append((used_at, stat.st_size, path))
+        return entries
+
+    def _object_path(self, fingerprint: str) -> str:
+        # Outputs are spread over subdirectories, like git objects.
+        return os.path.join(
+            self.directory, fingerprint[:2], f"{fingerprint[2:]}{_OBJECT_SUFFIX}"
+        )
+
+    def _mark_used(self, object_path: str) -> None:
+        Path(_used_path(object_path)).touch()
+
+    def _link(self, object_path: str, tmp_path: str) -> bool:
+        if not self.link:
+            return False
+        try:
+            os.link(object_path, tmp_path)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            # E.g. the store is on another file system.
+            return False
+        return True
+
+
+def _used_path(object_path: str) -> str:
+    return object_path[: -len(_OBJECT_SUFFIX)] + _USED_SUFFIX
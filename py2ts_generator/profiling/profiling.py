@@ -0,0 +1,95 @@
+import cProfile
+import os
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from py2ts_generator.observer.observer import PipelineObserver, StageTiming
+
+
+@dataclass(frozen=True)
+class ProfileOptions:
+    # Also trace the allocations of every stage, which slows the run down a lot.
+    memory: bool = False
+    # Number of allocation sites in the allocation summaries.
+    top: int = 10
+
+
+class ProfilingObserver(PipelineObserver):
+    """Profiles every stage of a pipeline run.
+
+    Writes <prefix>.<stage>.pstats, to be loaded with pstats or snakeviz, and
+    with memory tracing <prefix>.<stage>.allocations.txt, listing the sites
+    which allocated the most memory still alive at the end of the stage.
+
+    Only one profiler can be active at a time, so a stage is not profiled
+    while a stage nested in it runs. Its calls are in the trace of the nested
+    stage instead.
+    """
+
+    def __init__(
+        self, prefix: Union[str, Path], options: ProfileOptions = ProfileOptions()
+    ) -> None:
+        self.prefix = prefix
+        self.options = options
+        # The profiles of the running stages, innermost last.
+        self._profiles: List[Tuple[str, cProfile.Profile]] = []
+        self._snapshots: Dict[str, Tuple[bool, Optional[tracemalloc.Snapshot]]] = {}
+
+    def stage_started(self, stage: str) -> None:
+        if self.options.memory:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            # Allocations before the stage only need to be subtracted if they
+            # were traced at all.
+            self._snapshots[stage] = (
+                started_tracing,
+                None if started_tracing else tracemalloc.take_snapshot(),
+            )
+        if self._profiles:
+            self._profiles[-1][1].disable()
+        profile = cProfile.Profile()
+        self._profiles.append((stage, profile))
+        profile.enable()
+
+    def stage_finished(self, stage: str, timing: StageTiming) -> None:
+        if not self._profiles or self._profiles[-1][0] != stage:
+            return
+        _, profile = self._profiles.pop()
+        profile.disable()
+        directory = os.path.dirname(self.prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        profile.dump_stats(f"{self.prefix}.{stage}.pstats")
+        if stage in self._snapshots:
+            self._write_allocations(stage, timing, *self._snapshots.pop(stage))
+        if self._profiles:
+            self._profiles[-1][1].enable()
+
+    def _write_allocations(
+        self,
+        stage: str,
+        timing: StageTiming,
+        started_tracing: bool,
+        before: Optional[tracemalloc.Snapshot],
+    ) -> None:
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if started_tracing:
+            tracemalloc.stop()
+        statistics = (
+            after.statistics("lineno")
+            if before is None
+            else after.compare_to(before, "lineno")
+        )
+        lines = [
+            f"stage {stage}: {timing.wall_time:.3f}s wall, {timing.cpu_time:.3f}s cpu,"
+            f" {peak / 1024:.1f} KiB peak traced memory",
+            f"top {self.options.top} allocation sites:",
+            *(str(x) for x in statistics[: self.options.top]),
+        ]
+        with open(f"{self.prefix}.{stage}.allocations.txt", "w") as f:
+            f.write("\n".join(lines) + "\n")
@@ -0,0 +1,185 @@
+import asyncio
+import gzip
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline import (
+    GeneratedOutput,
+    TypeGenerationPipeline,
+)
+
+CONTENT_TYPE = "application/typescript; charset=utf-8"
+
+_Headers = List[Tuple[str, str]]
+
+
+@dataclass(frozen=True)
+class _Representations:
+    content_hash: str
+    identity: bytes
+    gzip: bytes
+
+    @property
+    def identity_etag(self) -> str:
+        return f'"{self.content_hash}"'
+
+    @property
+    def gzip_etag(self) -> str:
+        return f'"{self.content_hash}-gzip"'
+
+    @staticmethod
+    def of_output(output: GeneratedOutput) -> "_Representations":
+        return _Representations(
+            content_hash=output.content_hash,
+            identity=output.data,
+            gzip=gzip.compress(output.data, mtime=0),
+        )
+
+
+class GeneratedTypesResource:
+    """Serves the output of a pipeline over HTTP.
+
+    Every request parses the model to compute its fingerprint, the output is
+    only compiled, emitted and compressed again when the fingerprint changes.
+    Responses carry a strong ETag, so clients revalidate with If-None-Match and
+    get a 304 while the types are unchanged.
+    """
+
+    def __init__(self, pipeline: TypeGenerationPipeline) -> None:
+        self._pipeline = pipeline
+        self._lock = threading.Lock()
+        self._representations: Optional[_Representations] = None
+
+    def respond(
+        self, method: str, headers: Dict[str, str]
+    ) -> Tuple[int, _Headers, bytes]:
+        """Computes the response to a request.
+
+        :param method: The HTTP method of the request.
+        :param headers: The request headers, with lower case names.
+
+        :returns: The status code, the response headers and the body.
+        """
+        if method not in ("GET", "HEAD"):
+            return 405, [("Allow", "GET, HEAD")], b""
+        representations = self._current_representations()
+        use_gzip = _accepts_gzip(headers.get("accept-encoding", ""))
+        etag = representations.gzip_etag if use_gzip else representations.identity_etag
+        response_headers = [
+            ("ETag", etag),
+            ("Cache-Control", "no-cache"),
+            ("Vary", "Accept-Encoding"),
+        ]
+        if _matches(headers.get("if-none-match", ""), etag):
+            return 304, response_headers, b""
+
+        body = representations.gzip if use_gzip else representations.identity
+        response_headers.append(("Content-Type", CONTENT_TYPE))
+        response_headers.append(("Content-Length", str(len(body))))
+        if use_gzip:
+            response_headers.append(("Content-Encoding", "gzip"))
+        return 200, response_headers, b"" if method == "HEAD" else body
+
+    def _current_representations(self) -> _Representations:
+        # Requests are serialized here, so concurrent requests never generate
+        # the output more than once.
+        with self._lock:
+            output = self._pipeline.generate()
+            representations = self._representations
+            if (
+                representations is None
+                or representations.content_hash != output.content_hash
+            ):
+                representations = _Representations.of_output(output)
+                self._representations = representations
+            return representations
+
+
+class WsgiTypesHandler:
+    """WSGI application serving the output of a pipeline."""
+
+    def __init__(self, pipeline: TypeGenerationPipeline) -> None:
+        self._resource = GeneratedTypesResource(pipeline)
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        headers = {
+            key[5:].replace("_", "-").lower(): value
+            for key, value in environ.items()
+            if key.startswith("HTTP_")
+        }
+        status, response_headers, body = self._resource.respond(
+            environ.get("REQUEST_METHOD", "GET"), headers
+        )
+        start_response(f"{status} {_REASONS[status]}", response_headers)
+        return [body]
+
+
+class AsgiTypesHandler:
+    """ASGI application serving the output of a pipeline.
+
+    Generating the output blocks, so it runs in the default executor of the
+    event loop.
+    """
+
+    def __init__(self, pipeline: TypeGenerationPipeline) -> None:
+        self._resource = GeneratedTypesResource(pipeline)
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] != "http":
+            return
+        headers = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+        loop = asyncio.get_running_loop()
+        status, response_headers, body = await loop.run_in_executor(
+            None, self._resource.respond, scope.get("method", "GET"), headers
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (key.lower().encode("latin-1"), value.encode("latin-1"))
+                    for key, value in response_headers
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+_REASONS = {200: "OK", 304: "Not Modified", 405: "Method Not Allowed"}
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for coding in accept_encoding.split(","):
+        name, _, parameters = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = parameters.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
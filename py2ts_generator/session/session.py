@@ -0,0 +1,256 @@
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from py2ts_generator.generation_pipeline.pipeline_caches import PipelineCaches
+from py2ts_generator.model.py_class import (
+    PyClass,
+    RootTaggedUnionInformation,
+    TaggedUnionInformation,
+)
+from py2ts_generator.model.py_field import PyField
+from py2ts_generator.model_parser.model_parser import ModelParserCache
+from py2ts_generator.typescript_model_compiler.ts_object_type import TsBaseType
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompilerCache,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# A weakly encoded value, see _encode_py_class.
+_Encoded = Any
+
+
+class _DeadReference(Exception):
+    pass
+
+
+class GenerationSession(PipelineCaches):
+    """Parse, compile and render caches reused by all pipelines of a process.
+
+    Entries are keyed weakly by the Python types they were computed from and
+    never hold a strong reference to a user type, so classes of reloaded or
+    deleted modules are garbage collected together with their entries. Types
+    which cannot be referenced weakly are not cached.
+    """
+
+    def __init__(self) -> None:
+        self._parser_indices: _WeakTypeKeyedMapping[
+            Tuple[Type, Any], Any
+        ] = _WeakTypeKeyedMapping()
+        self._parsed_classes: _WeakTypeKeyedMapping[
+            Tuple[Type, Any], PyClass
+        ] = _WeakTypeKeyedMapping(_encode_py_class, _decode_py_class)
+        self._mappings: List[_WeakTypeKeyedMapping] = [
+            self._parser_indices,
+            self._parsed_classes,
+        ]
+        super().__init__()
+
+    def _create_model_parser_cache(self) -> ModelParserCache:
+        return ModelParserCache(
+            parser_indices=self._parser_indices,
+            parsed_classes=self._parsed_classes,
+        )
+
+    def _create_compiler_cache(self) -> TypescriptModelCompilerCache:
+        classes = _WeakCompiledClasses()
+        types: _WeakTypeKeyedMapping[Tuple[Type, bool], Any] = _WeakTypeKeyedMapping()
+        self._mappings.extend((classes.mapping, types))
+        return TypescriptModelCompilerCache(classes=classes, types=types)
+
+    def invalidate_module(self, module_name: str) -> None:
+        """Drops all entries computed from types defined in a module.
+
+        Reloading a module creates new types, which never hit the entries of
+        the old ones, so this is only needed when types are changed in place.
+        """
+        self._invalidate(lambda x: getattr(x, "__module__", None) == module_name)
+
+    def invalidate_type(self, cls: Type) -> None:
+        """Drops all entries computed from a type."""
+        self._invalidate(lambda x: x is cls)
+
+    def clear(self) -> None:
+        self._invalidate(lambda x: True)
+
+    def _invalidate(self, predicate: Callable[[Type], bool]) -> None:
+        for mapping in self._mappings:
+            mapping.invalidate(predicate)
+        # Rendered declarations are keyed by compiled declarations, which die
+        # with the dropped compile cache entries.
+
+
+class _WeakTypeKeyedMapping(MutableMapping[K, V], Generic[K, V]):
+    """Mapping of (type, sub key) to values, holding the type weakly.
+
+    Values are stored encoded, so they do not keep the type alive either. A
+    value whose types died in the meantime is a miss.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[V], _Encoded] = lambda x: x,
+        decode: Callable[[_Encoded], V] = lambda x: x,
+    ) -> None:
+        self._entries: "weakref.WeakKeyDictionary[Any, Dict[Hashable, _Encoded]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._encode = encode
+        self._decode = decode
+
+    def __getitem__(self, key: K) -> V:
+        cls, sub_key = cast(Tuple[Any, Hashable], key)
+        try:
+            entries = self._entries[cls]
+        except TypeError:
+            # Types which are not weakly referenceable are never stored.
+            raise KeyError(key)
+        try:
+            return self._decode(entries[sub_key])
+        except _DeadReference:
+            raise KeyError(key)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        cls, sub_key = cast(Tuple[Any, Hashable], key)
+        try:
+            encoded = self._encode(value)
+            entries = self._entries.get(cls)
+            if entries is None:
+                entries = self._entries.setdefault(cls, {})
+        except TypeError:
+            return
+        entries[sub_key] = encoded
+
+    def __delitem__(self, key: K) -> None:
+        cls, sub_key = cast(Tuple[Any, Hashable], key)
+        del self._entries[cls][sub_key]
+
+    def __iter__(self) -> Iterator[K]:
+        for cls, entries in list(self._entries.items()):
+            for sub_key in list(entries):
+                yield (cls, sub_key)  # type: ignore
+
+    def __len__(self) -> int:
+        return sum(len(x) for x in list(self._entries.values()))
+
+    def invalidate(self, predicate: Callable[[Type], bool]) -> None:
+        for cls in [x for x in list(self._entries.keys()) if predicate(x)]:
+            self._entries.pop(cls, None)
+
+
+class _WeakCompiledClasses(MutableMapping[PyClass, TsBaseType]):
+    """Compiled classes keyed weakly by the type of the parsed class.
+
+    An entry is only a hit for a parsed class equal to the one it was compiled
+    from, so a class parsed differently, e.g. after being changed in place or
+    becoming part of a tagged union, is compiled again.
+    """
+
+    def __init__(self) -> None:
+        self.mapping: _WeakTypeKeyedMapping[
+            Tuple[Type, None], Tuple[PyClass, TsBaseType]
+        ] = _WeakTypeKeyedMapping(_encode_compiled_class, _decode_compiled_class)
+
+    def __getitem__(self, py_class: PyClass) -> TsBaseType:
+        source, ts_type = self.mapping[(py_class.type, None)]
+        if source != py_class:
+            raise KeyError(py_class)
+        return ts_type
+
+    def __setitem__(self, py_class: PyClass, ts_type: TsBaseType) -> None:
+        self.mapping[(py_class.type, None)] = (py_class, ts_type)
+
+    def __delitem__(self, py_class: PyClass) -> None:
+        del self.mapping[(py_class.type, None)]
+
+    def __iter__(self) -> Iterator[PyClass]:
+        for key in self.mapping:
+            try:
+                yield self.mapping[key][0]
+            except KeyError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self.mapping)
+
+
+def _encode_compiled_class(value: Tuple[PyClass, TsBaseType]) -> _Encoded:
+    # Compiled declarations only hold names, never types.
+    return _encode_py_class(value[0]), value[1]
+
+
+def _decode_compiled_class(encoded: _Encoded) -> Tuple[PyClass, TsBaseType]:
+    return _decode_py_class(encoded[0]), encoded[1]
+
+
+def _encode_py_class(py_class: PyClass) -> _Encoded:
+    tagged_union_information = py_class.tagged_union_information
+    encoded_tagged_union_information: Optional[Tuple[Any, ...]] = None
+    if isinstance(tagged_union_information, RootTaggedUnionInformation):
+        encoded_tagged_union_information = (
+            tagged_union_information.discriminant_attribute,
+            tagged_union_information.discriminant_literal,
+            tagged_union_information.discriminant_literals,
+            tuple(weakref.ref(x) for x in tagged_union_information.child_types),
+        )
+    elif tagged_union_information:
+        encoded_tagged_union_information = (
+            tagged_union_information.discriminant_attribute,
+            tagged_union_information.discriminant_literal,
+        )
+    return (
+        py_class.name,
+        weakref.ref(py_class.type),
+        tuple((x.name, weakref.ref(x.type), x.alias) for x in py_class.fields),
+        encoded_tagged_union_information,
+    )
+
+
+def _decode_py_class(encoded: _Encoded) -> PyClass:
+    name, type_ref, field_refs, encoded_tagged_union_information = encoded
+    tagged_union_information: Optional[TaggedUnionInformation] = None
+    if encoded_tagged_union_information is None:
+        pass
+    elif len(encoded_tagged_union_information) == 4:
+        attribute, literal, literals, child_refs = encoded_tagged_union_information
+        tagged_union_information = RootTaggedUnionInformation(
+            discriminant_attribute=attribute,
+            discriminant_literal=literal,
+            discriminant_literals=literals,
+            child_types=tuple(_dereference(x) for x in child_refs),
+        )
+    else:
+        tagged_union_information = TaggedUnionInformation(
+            *encoded_tagged_union_information
+        )
+    return PyClass(
+        name=name,
+        type=_dereference(type_ref),
+        fields=tuple(
+            PyField(name=field_name, type=_dereference(field_ref), alias=alias)
+            for field_name, field_ref, alias in field_refs
+        ),
+        tagged_union_information=tagged_union_information,
+    )
+
+
+def _dereference(ref: "weakref.ref[Any]") -> Any:
+    value = ref()
+    if value is None:
+        raise _DeadReference()
+    return value
@@ -0,0 +1,557 @@
+import gc
+import importlib
+import json
+import marshal
+import types
+import typing
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, cast
+
+from ordered_set import OrderedSet
+
+from py2ts_generator.model.model import Model
+from py2ts_generator.model.py_class import (
+    PyClass,
+    RootTaggedUnionInformation,
+    TaggedUnionInformation,
+)
+from py2ts_generator.model.py_enum import PyEnum, PyEnumValue
+from py2ts_generator.model.py_field import PyField
+from py2ts_generator.typescript_model_compiler.ts_array import TsArray
+from py2ts_generator.typescript_model_compiler.ts_enum import TsEnum, TsEnumValue
+from py2ts_generator.typescript_model_compiler.ts_field import TsField
+from py2ts_generator.typescript_model_compiler.ts_interface import TsInterface
+from py2ts_generator.typescript_model_compiler.ts_mapped_type import (
+    TsMappedType,
+)
+from py2ts_generator.typescript_model_compiler.ts_model import TsModel
+from py2ts_generator.typescript_model_compiler.ts_object_type import (
+    TsBaseType,
+    TsDiscriminator,
+    TsObjectType,
+    TsUnionType,
+)
+from py2ts_generator.typescript_model_compiler.ts_type import TsType
+
+SNAPSHOT_FORMAT = "py2ts-snapshot"
+SNAPSHOT_VERSION = 4
+# Version 2 added field aliases, versions 3 and 4 moved the fields of model and
+# TypeScript model snapshots into a shared table. Older snapshots are still
+# readable.
+_READABLE_SNAPSHOT_VERSIONS = (1, 2, 3, 4)
+
+_BINARY_MAGIC = b"PY2TSNAP"
+
+# Classes from these modules never contain user code, so they are imported
+# when loading a snapshot. Classes from any other module are loaded as
+# SymbolicType, unless the caller explicitly asks to resolve them.
+_IMPORTABLE_MODULES = frozenset(
+    {
+        "builtins",
+        "collections",
+        "datetime",
+        "decimal",
+        "enum",
+        "ordered_set",
+        "typing",
+        "uuid",
+    }
+)
+
+
+class UnsupportedSnapshot(RuntimeError):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+class UnsupportedSnapshotType(RuntimeError):
+    def __init__(self, cls: Any) -> None:
+        super().__init__(f"The type {cls} can not be stored in a snapshot.")
+
+
+class SymbolicType:
+    """Stands in for a class which was not imported when loading a snapshot.
+
+    It carries the same ``__module__``, ``__qualname__`` and ``__name__`` as the
+    original class, which is all the compiler and emitter need.
+    """
+
+    def __init__(self, module: str, qualname: str) -> None:
+        self.__module__ = module
+        self.__qualname__ = qualname
+        self.__name__ = qualname.rsplit(".", 1)[-1]
+        self._hash = hash((module, qualname))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, SymbolicType)
+            and self.__module__ == other.__module__
+            and self.__qualname__ == other.__qualname__
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{self.__module__}.{self.__qualname__}"
+
+
+@dataclass(frozen=True)
+class SnapshotValue:
+    """Stands in for an enum value which is not a JSON scalar."""
+
+    repr: str
+
+
+@dataclass
+class ModelSnapshot:
+    model: Model
+    type_overrides: Dict[Type, Type] = field(default_factory=dict)
+
+
+def model_to_json(
+    model: Model, type_overrides: Optional[Dict[Type, Type]] = None
+) -> str:
+    with _gc_paused():
+        encoded = _encode_model(model, type_overrides or {})
+    return json.dumps(encoded, separators=(",", ":"))
+
+
+def model_from_json(text: str, resolve_types: bool = False) -> ModelSnapshot:
+    with _gc_paused():
+        return _decode_model(json.loads(text), resolve_types)
+
+
+def model_to_bytes(
+    model: Model, type_overrides: Optional[Dict[Type, Type]] = None
+) -> bytes:
+    with _gc_paused():
+        encoded = _encode_model(model, type_overrides or {})
+    return _BINARY_MAGIC + marshal.dumps(encoded)
+
+
+def model_from_bytes(data: bytes, resolve_types: bool = False) -> ModelSnapshot:
+    with _gc_paused():
+        return _decode_model(_unmarshal(data), resolve_types)
+
+
+def ts_model_to_json(ts_model: TsModel) -> str:
+    with _gc_paused():
+        encoded = _encode_ts_model(ts_model)
+    return json.dumps(encoded, separators=(",", ":"))
+
+
+def ts_model_from_json(text: str) -> TsModel:
+    with _gc_paused():
+        return _decode_ts_model(json.loads(text))
+
+
+def ts_model_to_bytes(ts_model: TsModel) -> bytes:
+    with _gc_paused():
+        encoded = _encode_ts_model(ts_model)
+    return _BINARY_MAGIC + marshal.dumps(encoded)
+
+
+def ts_model_from_bytes(data: bytes) -> TsModel:
+    with _gc_paused():
+        return _decode_ts_model(_unmarshal(data))
+
+
+def _unmarshal(data: bytes) -> dict:
+    if not data.startswith(_BINARY_MAGIC):
+        raise UnsupportedSnapshot("The data is not a binary py2ts snapshot.")
+    try:
+        return cast(dict, marshal.loads(data[len(_BINARY_MAGIC) :]))  # noqa: E203
+    except (EOFError, ValueError, TypeError) as e:
+        raise UnsupportedSnapshot(f"The binary snapshot is corrupt: {e}")
+
+
+def _header(kind: str) -> Dict[str, Any]:
+    return {"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION, "kind": kind}
+
+
+def _check_header(data: dict, kind: str) -> None:
+    if not isinstance(data, dict) or data.get("format") != SNAPSHOT_FORMAT:
+        raise UnsupportedSnapshot("The data is not a py2ts snapshot.")
+    if data.get("version") not in _READABLE_SNAPSHOT_VERSIONS:
+        raise UnsupportedSnapshot(
+            f"Unsupported snapshot version {data.get('version')}, expected {SNAPSHOT_VERSION}."
+        )
+    if data.get("kind") != kind:
+        raise UnsupportedSnapshot(
+            f"Expected a snapshot of a {kind}, got {data.get('kind')}."
+        )
+
+
+class _TypeEncoder:
+    def __init__(self) -> None:
+        self.table: List[list] = []
+        self._indices: Dict[Any, int] = {}
+
+    def encode(self, cls: Any) -> int:
+        try:
+            return self._indices[cls]
+        except KeyError:
+            pass
+        except TypeError:
+            raise UnsupportedSnapshotType(cls)
+        entry = self._encode_entry(cls)
+        index = len(self.table)
+        self.table.append(entry)
+        self._indices[cls] = index
+        return index
+
+    def _encode_entry(self, cls: Any) -> list:
+        if cls is type(None):
+            return ["n"]
+        if isinstance(cls, TypeVar):
+            return ["v", cls.__name__]
+        origin = getattr(cls, "__origin__", None)
+        args = getattr(cls, "__args__", None)
+        if origin is not None and args:
+            return ["g", self.encode(origin), [self.encode(x) for x in args]]
+        special_name = getattr(cls, "_name", None)
+        if special_name and getattr(typing, special_name, None) is cls:
+            return ["s", special_name]
+        module = getattr(cls, "__module__", None)
+        qualname = getattr(cls, "__qualname__", None)
+        if isinstance(module, str) and isinstance(qualname, str):
+            return ["c", module, qualname]
+        raise UnsupportedSnapshotType(cls)
+
+
+class _TypeDecoder:
+    def __init__(self, table: List[list], resolve_types: bool) -> None:
+        self._resolve_types = resolve_types
+        self.types: List[Any] = []
+        append = self.types.append
+        for entry in table:
+            # Most entries are classes of user modules, decoded inline.
+            if entry[0] == "c" and not resolve_types:
+                if entry[1] not in _IMPORTABLE_MODULES:
+                    append(SymbolicType(entry[1], entry[2]))
+                    continue
+            append(self._decode_entry(entry))
+
+    def _decode_entry(self, entry: list) -> Any:
+        kind = entry[0]
+        if kind == "c":
+            return self._decode_class(entry[1], entry[2])
+        if kind == "g":
+            # types.GenericAlias is orders of magnitude cheaper to create than
+            # the typing equivalents and is handled the same by the compiler.
+            return types.GenericAlias(
+                self.types[entry[1]], tuple([self.types[x] for x in entry[2]])
+            )
+        if kind == "s":
+            return getattr(typing, entry[1])
+        if kind == "n":
+            return type(None)
+        if kind == "v":
+            return TypeVar(entry[1])  # type: ignore
+        raise UnsupportedSnapshot(f"Unknown type entry {entry}.")
+
+    def _decode_class(self, module: str, qualname: str) -> Any:
+        if not self._resolve_types and module not in _IMPORTABLE_MODULES:
+            return SymbolicType(module, qualname)
+        obj: Any = importlib.import_module(module)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+
+def _encode_value(value: object) -> object:
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    return {"repr": repr(value)}
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return SnapshotValue(repr=value["repr"])
+    return value
+
+
+class _FieldTable:
+    """Interns encoded fields, which recur in many classes, e.g. ("id", int)."""
+
+    def __init__(self) -> None:
+        self.table: List[list] = []
+        self._indices: Dict[Tuple[Any, ...], int] = {}
+
+    def add(self, entry: list) -> int:
+        key = tuple(entry)
+        index = self._indices.get(key)
+        if index is None:
+            index = len(self.table)
+            self.table.append(entry)
+            self._indices[key] = index
+        return index
+
+
+def _encode_model(model: Model, type_overrides: Dict[Type, Type]) -> Dict[str, Any]:
+    encoder = _TypeEncoder()
+    field_table = _FieldTable()
+    classes = [
+        [
+            py_class.name,
+            encoder.encode(py_class.type),
+            [field_table.add(_encode_field(x, encoder)) for x in py_class.fields],
+            _encode_tagged_union_information(
+                py_class.tagged_union_information, encoder
+            ),
+        ]
+        for py_class in model.classes
+    ]
+    enums = [
+        [
+            py_enum.name,
+            encoder.encode(py_enum.type),
+            [[x.name, _encode_value(x.value)] for x in py_enum.values],
+        ]
+        for py_enum in model.enums
+    ]
+    overrides = [
+        [encoder.encode(source), encoder.encode(target)]
+        for source, target in type_overrides.items()
+    ]
+    return {
+        **_header("model"),
+        "types": encoder.table,
+        "fields": field_table.table,
+        "classes": classes,
+        "enums": enums,
+        "type_overrides": overrides,
+    }
+
+
+def _encode_field(py_field: PyField, encoder: _TypeEncoder) -> list:
+    if py_field.alias is None:
+        return [py_field.name, encoder.encode(py_field.type)]
+    return [py_field.name, encoder.encode(py_field.type), py_field.alias]
+
+
+def _encode_tagged_union_information(
+    tagged_union_information: Optional[TaggedUnionInformation], encoder: _TypeEncoder
+) -> Optional[list]:
+    if tagged_union_information is None:
+        return None
+    encoded: List[Any] = [
+        tagged_union_information.discriminant_attribute,
+        tagged_union_information.discriminant_literal,
+    ]
+    if isinstance(tagged_union_information, RootTaggedUnionInformation):
+        encoded.append(list(tagged_union_information.discriminant_literals))
+        encoded.append(
+            [encoder.encode(x) for x in tagged_union_information.child_types]
+        )
+    return encoded
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Encoding and decoding, including unmarshalling and parsing JSON, allocate
+    # many objects that all stay alive, so the cyclic garbage collector would
+    # repeatedly scan them without freeing anything.
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _decode_model(data: dict, resolve_types: bool) -> ModelSnapshot:
+    _check_header(data, "model")
+    typs = _TypeDecoder(data["types"], resolve_types).types
+    if data["version"] >= 3:
+        field_table, class_entries = data["fields"], data["classes"]
+    else:
+        # Older snapshots store the fields inline in every class.
+        field_table, class_entries = _intern_fields(data["classes"], 2)
+    # Equal fields are decoded once and shared between classes.
+    py_fields = [
+        PyField(x[0], typs[x[1]], x[2] if len(x) > 2 else None) for x in field_table
+    ]
+
+    classes = [
+        PyClass(
+            name=name,
+            type=typs[type_index],
+            fields=tuple(map(py_fields.__getitem__, fields)),
+            tagged_union_information=_decode_tagged_union_information(tagged, typs),
+        )
+        for name, type_index, fields, tagged in class_entries
+    ]
+    enums = [
+        PyEnum(
+            name=name,
+            type=typs[type_index],
+            values=tuple([PyEnumValue(x[0], _decode_value(x[1])) for x in values]),
+        )
+        for name, type_index, values in data["enums"]
+    ]
+    return ModelSnapshot(
+        model=Model(classes=OrderedSet(classes), enums=OrderedSet(enums)),
+        type_overrides={typs[s]: typs[t] for s, t in data["type_overrides"]},
+    )
+
+
+def _intern_fields(
+    entries: List[list], position: int, kind: Optional[str] = None
+) -> Tuple[List[list], List[list]]:
+    # Replaces the inline fields at the position of every entry, or only of the
+    # entries of a kind, by indices into a field table.
+    field_table = _FieldTable()
+    interned = []
+    for entry in entries:
+        if kind is None or entry[0] == kind:
+            entry = list(entry)
+            entry[position] = [field_table.add(x) for x in entry[position]]
+        interned.append(entry)
+    return field_table.table, interned
+
+
+def _decode_tagged_union_information(
+    tagged: Optional[list], typs: List[Any]
+) -> Optional[TaggedUnionInformation]:
+    if tagged is None:
+        return None
+    if len(tagged) == 2:
+        return TaggedUnionInformation(
+            discriminant_attribute=tagged[0], discriminant_literal=tagged[1]
+        )
+    return RootTaggedUnionInformation(
+        discriminant_attribute=tagged[0],
+        discriminant_literal=tagged[1],
+        discriminant_literals=tuple(tagged[2]),
+        child_types=tuple([typs[x] for x in tagged[3]]),
+    )
+
+
+class _TsTypeEncoder:
+    def __init__(self) -> None:
+        self.table: List[list] = []
+        self._indices: Dict[Any, int] = {}
+        # Compiled models share TsType instances between fields, so most
+        # lookups are answered by identity without comparing types. The
+        # instances are kept alive, so their ids cannot be reused.
+        self._indices_by_id: Dict[int, int] = {}
+        self._encoded: List[TsType] = []
+
+    def encode(self, ts_type: TsType) -> int:
+        index = self._indices_by_id.get(id(ts_type))
+        if index is not None:
+            return index
+        key = (type(ts_type), ts_type)
+        index = self._indices.get(key)
+        if index is None:
+            entry = self._encode_entry(ts_type)
+            index = len(self.table)
+            self.table.append(entry)
+            self._indices[key] = index
+        self._indices_by_id[id(ts_type)] = index
+        self._encoded.append(ts_type)
+        return index
+
+    def _encode_entry(self, ts_type: TsType) -> list:
+        if isinstance(ts_type, TsArray):
+            return ["a", self.encode(ts_type.wrapped_type), ts_type.is_optional]
+        if isinstance(ts_type, TsMappedType):
+            return ["m", self.encode(ts_type.wrapped_type), ts_type.is_optional]
+        if isinstance(ts_type, TsInterface):
+            return ["i", ts_type.name, ts_type.is_optional]
+        if type(ts_type) is TsType:
+            return ["t", ts_type.name, ts_type.is_optional]
+        raise UnsupportedSnapshotType(ts_type)
+
+
+def _decode_ts_types(table: List[list]) -> List[TsType]:
+    ts_types: List[TsType] = []
+    for entry in table:
+        kind = entry[0]
+        if kind == "t":
+            ts_types.append(TsType(entry[1], entry[2]))
+        elif kind == "a":
+            ts_types.append(TsArray(ts_types[entry[1]], entry[2]))
+        elif kind == "m":
+            ts_types.append(TsMappedType(ts_types[entry[1]], entry[2]))
+        elif kind == "i":
+            ts_types.append(TsInterface(entry[1], entry[2]))
+        else:
+            raise UnsupportedSnapshot(f"Unknown TypeScript type entry {entry}.")
+    return ts_types
+
+
+def _encode_ts_model(ts_model: TsModel) -> Dict[str, Any]:
+    encoder = _TsTypeEncoder()
+    field_table = _FieldTable()
+    declarations = []
+    for ts_type in ts_model.types:
+        if isinstance(ts_type, TsObjectType):
+            discriminator = ts_type.discriminator
+            declarations.append(
+                [
+                    "o",
+                    ts_type.name,
+                    [
+                        field_table.add([x.name, encoder.encode(x.type)])
+                        for x in ts_type.fields
+                    ],
+                    (
+                        [discriminator.name, discriminator.value]
+                        if discriminator
+                        else None
+                    ),
+                ]
+            )
+        elif isinstance(ts_type, TsUnionType):
+            declarations.append(["u", ts_type.name, list(ts_type.union_members)])
+        else:
+            raise UnsupportedSnapshotType(ts_type)
+    enums = [
+        [ts_enum.name, [[x.name, x.value] for x in ts_enum.values]]
+        for ts_enum in ts_model.enums
+    ]
+    return {
+        **_header("ts_model"),
+        "types": encoder.table,
+        "fields": field_table.table,
+        "declarations": declarations,
+        "enums": enums,
+    }
+
+
+def _decode_ts_model(data: dict) -> TsModel:
+    _check_header(data, "ts_model")
+    ts_types = _decode_ts_types(data["types"])
+    if data["version"] >= 4:
+        field_table, entries = data["fields"], data["declarations"]
+    else:
+        # Older snapshots store the fields inline in every object type.
+        field_table, entries = _intern_fields(data["declarations"], 2, kind="o")
+    ts_fields = [
+        TsField(name, ts_types[type_index]) for name, type_index in field_table
+    ]
+
+    declarations: List[TsBaseType] = []
+    for entry in entries:
+        if entry[0] == "o":
+            declarations.append(
+                TsObjectType(
+                    name=entry[1],
+                    fields=tuple(map(ts_fields.__getitem__, entry[2])),
+                    discriminator=TsDiscriminator(*entry[3]) if entry[3] else None,
+                )
+            )
+        else:
+            declarations.append(
+                TsUnionType(name=entry[1], union_members=tuple(entry[2]))
+            )
+    enums = [
+        TsEnum(name=name, values=tuple([TsEnumValue(x[0], x[1]) for x in values]))
+        for name, values in data["enums"]
+    ]
+    return TsModel(types=OrderedSet(declarations), enums=OrderedSet(enums))
@@ -0,0 +1,158 @@
+# Note: this module must only depend on the standard library and the package
+# version, so the staleness check can run without importing the pipeline or any
+# of the user's model code.
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+from py2ts_generator import __version__
+from py2ts_generator.atomic_write.atomic_write import atomic_write
+
+# Version 2 added the generator version and the settings fingerprint.
+MANIFEST_VERSION = 2
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+class UnsupportedManifestVersion(RuntimeError):
+    def __init__(self, version: object) -> None:
+        super().__init__(
+            f"Unsupported manifest version {version}, expected {MANIFEST_VERSION}."
+        )
+
+
+@dataclass(frozen=True)
+class SourceFileEntry:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    @staticmethod
+    def of_file(path: str, relative_to: str) -> "SourceFileEntry":
+        stat = os.stat(path)
+        return SourceFileEntry(
+            path=_relative_path(path, relative_to),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=_hash_file(path),
+        )
+
+    def check(self, relative_to: str) -> Optional[str]:
+        """Returns the reason why the file is stale, or None if it is fresh."""
+        path = os.path.join(relative_to, self.path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return f"{path} does not exist"
+        if stat.st_size != self.size:
+            return f"{path} changed in size"
+        if stat.st_mtime_ns == self.mtime_ns:
+            return None
+        if _hash_file(path) != self.sha256:
+            return f"{path} changed in content"
+        return None
+
+
+@dataclass(frozen=True)
+class SourceManifest:
+    output: SourceFileEntry
+    sources: Tuple[SourceFileEntry, ...]
+    # Besides the sources, the output depends on the generator and on the
+    # pipeline settings, e.g. type overrides and the case format.
+    generator_version: str
+    settings_fingerprint: str
+
+    @staticmethod
+    def of_files(
+        output_file: Union[str, Path],
+        source_files: Iterable[str],
+        manifest_path: Union[str, Path],
+        settings_fingerprint: str,
+    ) -> "SourceManifest":
+        base_dir = os.path.dirname(os.path.abspath(manifest_path))
+        return SourceManifest(
+            output=SourceFileEntry.of_file(str(output_file), base_dir),
+            sources=tuple(
+                SourceFileEntry.of_file(x, base_dir) for x in sorted(set(source_files))
+            ),
+            generator_version=__version__,
+            settings_fingerprint=settings_fingerprint,
+        )
+
+    def write(self, manifest_path: Union[str, Path]) -> None:
+        content = {
+            "version": MANIFEST_VERSION,
+            "generator_version": self.generator_version,
+            "settings_fingerprint": self.settings_fingerprint,
+            "output": asdict(self.output),
+            "sources": [asdict(x) for x in self.sources],
+        }
+        with atomic_write(manifest_path) as f:
+            json.dump(content, f, indent=2)
+
+    @staticmethod
+    def read(manifest_path: Union[str, Path]) -> "SourceManifest":
+        with open(manifest_path, "r") as f:
+            content = json.load(f)
+        if content.get("version") != MANIFEST_VERSION:
+            raise UnsupportedManifestVersion(content.get("version"))
+        return SourceManifest(
+            output=SourceFileEntry(**content["output"]),
+            sources=tuple(SourceFileEntry(**x) for x in content["sources"]),
+            generator_version=content["generator_version"],
+            settings_fingerprint=content["settings_fingerprint"],
+        )
+
+
+def manifest_path_for(output_file: Union[str, Path]) -> str:
+    return f"{output_file}{MANIFEST_SUFFIX}"
+
+
+def check_manifest(
+    manifest_path: Union[str, Path], settings_fingerprint: Optional[str] = None
+) -> Optional[str]:
+    """Compares a manifest against the files on disk and the generator version.
+
+    :param manifest_path: Path to the manifest written next to the output.
+    :param settings_fingerprint: Fingerprint of the current pipeline settings.
+        Without it, the settings are not compared.
+
+    :returns: The reason why the output is stale, or None if it is fresh.
+    """
+    try:
+        manifest = SourceManifest.read(manifest_path)
+    except FileNotFoundError:
+        return f"{manifest_path} does not exist"
+    except (ValueError, KeyError, TypeError, UnsupportedManifestVersion) as e:
+        return f"{manifest_path} is invalid: {e}"
+    if manifest.generator_version != __version__:
+        return (
+            f"{manifest_path} was written by version {manifest.generator_version},"
+            f" not {__version__}"
+        )
+    if (
+        settings_fingerprint is not None
+        and manifest.settings_fingerprint != settings_fingerprint
+    ):
+        return f"{manifest_path} was written with other pipeline settings"
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    for entry in (manifest.output, *manifest.sources):
+        reason = entry.check(base_dir)
+        if reason:
+            return reason
+    return None
+
+
+def _relative_path(path: str, relative_to: str) -> str:
+    try:
+        return os.path.relpath(os.path.abspath(path), relative_to)
+    except ValueError:
+        return os.path.abspath(path)
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
@@ -0,0 +1,89 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from py2ts_generator.observer.observer import PipelineObserver, StageTiming
+
+
+class SpanRecorder(PipelineObserver):
+    """Records nested spans of parsing, compiling and emitting single types.
+
+    Spans cover the parse of every class by the model parser and by the class
+    parsers, the compilation of every class and enum and the rendering of every
+    declaration. As an observer, the recorder also records a span per pipeline
+    stage. Spans are exported as Chrome trace events, which chrome://tracing
+    and Perfetto show as a flame chart per thread.
+
+    Components without a recorder only check for it once per type, so
+    recording costs nothing when disabled. Declarations compiled or rendered in
+    worker processes are not recorded.
+    """
+
+    def __init__(self) -> None:
+        # Appending to a list is atomic, so spans of many threads need no lock.
+        self._events: List[Dict[str, Any]] = []
+        self._stage_starts: Dict[Tuple[int, str], float] = {}
+        self._pid = os.getpid()
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, args: Optional[Dict[str, Any]] = None
+    ) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, category, start, time.perf_counter(), args)
+
+    def stage_started(self, stage: str) -> None:
+        self._stage_starts[(threading.get_ident(), stage)] = time.perf_counter()
+
+    def stage_finished(self, stage: str, timing: StageTiming) -> None:
+        start = self._stage_starts.pop((threading.get_ident(), stage), None)
+        if start is not None:
+            self._record(stage, "stage", start, time.perf_counter(), None)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        return list(self._events)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Union[str, Path]) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def _record(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: Optional[Dict[str, Any]],
+    ) -> None:
+        # Complete events, timestamps and durations are in microseconds.
+        event: Dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+
+def span_name(cls: Any) -> str:
+    name = getattr(cls, "__qualname__", None)
+    return name if isinstance(name, str) else repr(cls)
@@ -0,0 +1,168 @@
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class EdgeKind(Enum):
+    ROOT = "root"
+    FIELD = "field"
+    GENERIC = "generic"
+    OPTIONAL = "optional"
+    CHILD = "child"
+    PARENT = "parent"
+    OVERRIDE = "override"
+
+
+@dataclass(frozen=True)
+class Discovery:
+    """How the model parser first came across a type."""
+
+    type: Any
+    # The type through which this one was discovered, None for root types.
+    source: Any
+    edge: EdgeKind
+    field_name: Optional[str] = None
+
+    def describe(self) -> str:
+        if self.edge is EdgeKind.ROOT:
+            return type_name(self.type)
+        if self.edge is EdgeKind.FIELD:
+            return f"-{self.field_name}-> {type_name(self.type)}"
+        return f"-{self.edge.value}-> {type_name(self.type)}"
+
+
+@dataclass(frozen=True)
+class TypeCost:
+    type: Any
+    # From a root type to this one, through generics and optionals.
+    path: Tuple[Discovery, ...]
+    parse_time: float
+    compile_time: float
+    emitted_size: int
+
+    @property
+    def name(self) -> str:
+        return type_name(self.type)
+
+    @property
+    def edge(self) -> EdgeKind:
+        return self.path[-1].edge
+
+    def describe_path(self) -> str:
+        return " ".join(x.describe() for x in self.path)
+
+
+@dataclass(frozen=True)
+class TypeCostReport:
+    """The discovery path and the costs of every class and enum of a model."""
+
+    types: Tuple[TypeCost, ...]
+
+    @property
+    def emitted_size(self) -> int:
+        return sum(x.emitted_size for x in self.types)
+
+    def why(self, name: str) -> Optional[str]:
+        """Describes the path through which a type got into the model."""
+        for cost in self.types:
+            if cost.name == name:
+                return cost.describe_path()
+        return None
+
+    def summary(self, top: Optional[int] = None) -> str:
+        costs = sorted(
+            self.types,
+            key=lambda x: (x.parse_time + x.compile_time, x.emitted_size),
+            reverse=True,
+        )
+        return "\n".join(
+            f"{x.name:<32} {x.parse_time * 1000:8.3f}ms parse"
+            f" {x.compile_time * 1000:8.3f}ms compile {x.emitted_size:8}B"
+            f"  {x.edge.value:<8} {x.describe_path()}"
+            for x in costs[:top]
+        )
+
+
+class TypeCostRecorder:
+    """Records why every type is part of a model and what it costs.
+
+    The model parser reports the first edge through which it discovers a type
+    and the time spent parsing every class and enum, the compiler the time
+    spent compiling them, the emitter the size of their declarations. Classes
+    parsed, compiled or rendered in worker processes or taken from the
+    declaration cache have no costs.
+    """
+
+    def __init__(self) -> None:
+        self._discoveries: Dict[Any, Discovery] = {}
+        self._parse_times: Dict[Any, float] = {}
+        self._compile_times: Dict[Any, float] = {}
+        self._emitted_sizes: Dict[Any, int] = {}
+        # Classes with the same name, e.g. from different modules, may compile
+        # to equal declarations, so declarations are told apart by identity.
+        # They are kept alive, so their ids cannot be reused.
+        self._declarations: Dict[int, Tuple[Any, Any]] = {}
+        # Classes may be compiled on many threads.
+        self._lock = threading.Lock()
+
+    def discovered(
+        self,
+        cls: Any,
+        source: Any,
+        edge: EdgeKind,
+        field_name: Optional[str] = None,
+    ) -> None:
+        try:
+            if cls in self._discoveries:
+                return
+        except TypeError:
+            # Annotations which are not hashable cannot be parsed either.
+            return
+        self._discoveries[cls] = Discovery(cls, source, edge, field_name)
+
+    def parsed(self, cls: Any, seconds: float) -> None:
+        self._parse_times[cls] = self._parse_times.get(cls, 0.0) + seconds
+
+    def compiled(self, cls: Any, declaration: Any, seconds: float) -> None:
+        with self._lock:
+            self._compile_times[cls] = self._compile_times.get(cls, 0.0) + seconds
+            self._declarations[id(declaration)] = (declaration, cls)
+
+    def emitted(self, declaration: Any, size: int) -> None:
+        compiled = self._declarations.get(id(declaration))
+        if compiled is not None:
+            self._emitted_sizes[compiled[1]] = size
+
+    def report(self) -> TypeCostReport:
+        return TypeCostReport(
+            types=tuple(
+                TypeCost(
+                    type=cls,
+                    path=self._path(cls),
+                    parse_time=self._parse_times[cls],
+                    compile_time=self._compile_times.get(cls, 0.0),
+                    emitted_size=self._emitted_sizes.get(cls, 0),
+                )
+                for cls in self._parse_times
+            )
+        )
+
+    def _path(self, cls: Any) -> Tuple[Discovery, ...]:
+        path: List[Discovery] = []
+        discovery = self._discoveries.get(cls)
+        # First discoveries form a tree, the check only guards against types
+        # reported without their source.
+        while discovery is not None and discovery not in path:
+            path.append(discovery)
+            if discovery.source is None:
+                break
+            discovery = self._discoveries.get(discovery.source)
+        return tuple(reversed(path))
+
+
+def type_name(cls: Any) -> str:
+    name = getattr(cls, "__qualname__", None)
+    if not isinstance(name, str) or getattr(cls, "__args__", None):
+        return repr(cls).replace("typing.", "")
+    return name
@@ -1,3 +1,17 @@
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, MutableMapping, Optional, Sequence, Union
+
+from ordered_set import OrderedSet
+
+from py2ts_generator.snapshot.snapshot import (
+    ts_model_from_bytes,
+    ts_model_to_bytes,
+)
+from py2ts_generator.tracing.tracing import SpanRecorder
+from py2ts_generator.type_costs.type_costs import TypeCostRecorder
+from py2ts_generator.typescript_model_compiler.ts_enum import TsEnum
 from py2ts_generator.typescript_model_compiler.ts_field import TsField
 from py2ts_generator.typescript_model_compiler.ts_model import TsModel
 from py2ts_generator.typescript_model_compiler.ts_object_type import (
@@ -7,28 +21,131 @@ from py2ts_generator.typescript_model_compiler.ts_object_type import (
 )
 
 
+# Below this number of declarations, starting worker processes and shipping the
+# declarations to them costs more than rendering them serially.
+PARALLEL_EMIT_THRESHOLD = 5000
+
+_IDENTIFIER = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*")
+
+# Every worker gets a few chunks, so the work stays balanced even though
+# declarations differ in size.
+_CHUNKS_PER_WORKER = 4
+
+
 class TypescriptEmitter:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = PARALLEL_EMIT_THRESHOLD,
+        cache: Optional[MutableMapping[TsBaseType, str]] = None,
+        span_recorder: Optional[SpanRecorder] = None,
+        type_costs: Optional[TypeCostRecorder] = None,
+    ):
+        """
+        :param max_workers: When set, models with at least parallel_threshold
+            declarations are rendered in chunks on a process pool of this size.
+            The output is identical to the one of serial emission.
+        :param parallel_threshold: Minimum number of declarations to render a
+            model in parallel.
+        :param cache: Rendered types to share with other emitters. Compiled
+            types are only shared through a compiler cache, so this is usually a
+            WeakKeyDictionary living as long as the compiler cache entries.
+        :param span_recorder: Records a span per declaration rendered in this
+            process.
+        :param type_costs: Records the size of every rendered declaration.
+        """
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self._cache = cache
+        self._span_recorder = span_recorder
+        self._type_costs = type_costs
+
     def emit(self, ts_model: TsModel) -> str:
-        typescript_str = ""
-        for ts_enum in ts_model.enums:
-            typescript_str += self._emit_enum(ts_enum)
-        for ts_type in ts_model.types:
-            typescript_str += self._emit_type(ts_type)
-        return typescript_str
+        return "".join(self.emit_declarations(ts_model))
+
+    def emit_declarations(self, ts_model: TsModel) -> List[str]:
+        declaration_count = len(ts_model.enums) + len(ts_model.types)
+        if (
+            self.max_workers
+            and self.max_workers > 1
+            and declaration_count >= self.parallel_threshold
+        ):
+            texts = self._emit_declarations_in_parallel(ts_model, self.max_workers)
+            if self._type_costs is not None:
+                declarations: List[Union[TsEnum, TsBaseType]] = [
+                    *ts_model.enums,
+                    *ts_model.types,
+                ]
+                for declaration, text in zip(declarations, texts):
+                    self._type_costs.emitted(declaration, _size(text))
+            return texts
+        return [
+            *(self.emit_enum(x) for x in ts_model.enums),
+            *(self.emit_type(x) for x in ts_model.types),
+        ]
+
+    def _emit_declarations_in_parallel(
+        self, ts_model: TsModel, max_workers: int
+    ) -> List[str]:
+        # Enums come first, so every chunk renders its enums before its types,
+        # just like the serial emitter.
+        declarations: List[Union[TsEnum, TsBaseType]] = [
+            *ts_model.enums,
+            *ts_model.types,
+        ]
+        chunk_count = min(len(declarations), max_workers * _CHUNKS_PER_WORKER)
+        chunk_size = -(-len(declarations) // chunk_count)
+        payloads = [
+            ts_model_to_bytes(
+                _chunk_model(declarations[i : i + chunk_size])  # noqa: E203
+            )
+            for i in range(0, len(declarations), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # map returns the chunks in order, which restores the model order.
+            return [
+                text
+                for chunk_texts in executor.map(_emit_chunk, payloads)
+                for text in chunk_texts
+            ]
 
-    def _emit_enum(self, ts_enum):
-        enum_template = "export enum "
-        enum_template += ts_enum.name
-        enum_template += " {\n"
+    def emit_enum(self, ts_enum: TsEnum) -> str:
+        if self._span_recorder is None:
+            text = self._emit_untraced_enum(ts_enum)
+        else:
+            with self._span_recorder.span(ts_enum.name, "emit"):
+                text = self._emit_untraced_enum(ts_enum)
+        if self._type_costs is not None:
+            self._type_costs.emitted(ts_enum, _size(text))
+        return text
 
-        for value in ts_enum.values:
-            enum_template += f"    {value.name} = {value.format_value()},\n"
+    def _emit_untraced_enum(self, ts_enum: TsEnum) -> str:
+        lines = [f"export enum {ts_enum.name} {{\n"]
+        lines.extend(
+            f"    {value.name} = {value.format_value()},\n" for value in ts_enum.values
+        )
+        lines.append("}\n")
+        return "".join(lines)
 
-        enum_template += "}\n"
+    def emit_type(self, ts_type: TsBaseType) -> str:
+        if self._span_recorder is None:
+            text = self._emit_cached_type(ts_type)
+        else:
+            with self._span_recorder.span(ts_type.name, "emit"):
+                text = self._emit_cached_type(ts_type)
+        if self._type_costs is not None:
+            self._type_costs.emitted(ts_type, _size(text))
+        return text
 
-        return enum_template
+    def _emit_cached_type(self, ts_type: TsBaseType) -> str:
+        if self._cache is None:
+            return self._emit_uncached_type(ts_type)
+        text = self._cache.get(ts_type)
+        if text is None:
+            text = self._cache.setdefault(ts_type, self._emit_uncached_type(ts_type))
+        return text
 
-    def _emit_type(self, ts_type: TsBaseType) -> str:
+    def _emit_uncached_type(self, ts_type: TsBaseType) -> str:
         if isinstance(ts_type, TsObjectType):
             return self._compile_object_type(ts_type)
         if isinstance(ts_type, TsUnionType):
@@ -36,21 +153,25 @@ class TypescriptEmitter:
         raise NotImplementedError()
 
     def _compile_object_type(self, ts_type: TsObjectType) -> str:
-        type_template = "export interface "
-        type_template += ts_type.name
-        type_template += " {\n"
+        # Lines are joined once, repeated concatenation is quadratic in the
+        # number of fields where strings cannot be extended in place.
+        lines = [f"export interface {ts_type.name} {{\n"]
         for field in ts_type.fields:
             field_optional_specifier = self._emit_field_optional_specifier(field)
             field_type = self._emit_field_type(field)
-            type_template += (
-                f"    {field.name}{field_optional_specifier}: {field_type}\n"
-            )
+            field_name = self._emit_property_name(field.name)
+            lines.append(f"    {field_name}{field_optional_specifier}: {field_type}\n")
         if ts_type.discriminator:
-            type_template += (
-                f'    {ts_type.discriminator.name}: "{ts_type.discriminator.value}"\n'
-            )
-        type_template += "}\n"
-        return type_template
+            discriminator_name = self._emit_property_name(ts_type.discriminator.name)
+            lines.append(f'    {discriminator_name}: "{ts_type.discriminator.value}"\n')
+        lines.append("}\n")
+        return "".join(lines)
+
+    def _emit_property_name(self, name: str) -> str:
+        # Names like created-at, e.g. from kebab case or aliases, are quoted.
+        if _IDENTIFIER.fullmatch(name):
+            return name
+        return json.dumps(name)
 
     def _emit_field_optional_specifier(self, field: TsField) -> str:
         if field.type.is_optional:
@@ -72,3 +193,18 @@ class TypescriptEmitter:
         type_template += " | ".join(ts_type.union_members)
         type_template += ";\n"
         return type_template
+
+
+def _chunk_model(declarations: Sequence[Union[TsEnum, TsBaseType]]) -> TsModel:
+    return TsModel(
+        types=OrderedSet(x for x in declarations if not isinstance(x, TsEnum)),
+        enums=OrderedSet(x for x in declarations if isinstance(x, TsEnum)),
+    )
+
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _emit_chunk(payload: bytes) -> List[str]:
+    return TypescriptEmitter().emit_declarations(ts_model_from_bytes(payload))
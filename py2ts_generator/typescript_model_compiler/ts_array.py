@@ -2,6 +2,8 @@ from py2ts_generator.typescript_model_compiler.ts_type import TsType
 
 
 class TsArray(TsType):
+    __slots__ = ("_wrapped_type",)
+
     def __init__(self, wrapped_type: TsType, is_optional: bool = False):
         super(TsArray, self).__init__(f"{wrapped_type.name}[]", is_optional)
         self._wrapped_type = wrapped_type
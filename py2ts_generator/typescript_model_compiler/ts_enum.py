@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Union, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TsEnumValue:
     name: str
     value: Union[int, str]
@@ -13,7 +13,10 @@ class TsEnumValue:
         return f"{self.value}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TsEnum:
     name: str
     values: Tuple[TsEnumValue, ...]
+
+    def __hash__(self) -> int:
+        return hash(self.name)
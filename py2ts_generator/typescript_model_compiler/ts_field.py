@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from py2ts_generator.typescript_model_compiler.ts_type import TsType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TsField:
     name: str
     type: TsType
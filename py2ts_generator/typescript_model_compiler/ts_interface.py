@@ -2,5 +2,7 @@ from py2ts_generator.typescript_model_compiler.ts_type import TsType
 
 
 class TsInterface(TsType):
+    __slots__ = ()
+
     def __str__(self):
         return f"TsInterface(name='{self.name}', is_optional='{self.is_optional}')"
@@ -2,6 +2,8 @@ from py2ts_generator.typescript_model_compiler.ts_type import TsType
 
 
 class TsMappedType(TsType):
+    __slots__ = ("_wrapped_type",)
+
     def __init__(self, wrapped_type: TsType, is_optional: bool = False):
         super(TsMappedType, self).__init__(
             f"{{[index: string]: {wrapped_type.name}}}", is_optional
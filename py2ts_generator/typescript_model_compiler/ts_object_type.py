@@ -4,23 +4,30 @@ from typing import Tuple, Optional
 from py2ts_generator.typescript_model_compiler.ts_field import TsField
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TsDiscriminator:
     name: str
     value: str
 
 
-@dataclass(frozen=True)
+# Rendered declarations are cached in weak mappings keyed by declaration.
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class TsBaseType:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TsObjectType(TsBaseType):
     fields: Tuple[TsField, ...]
     discriminator: Optional[TsDiscriminator] = None
 
+    def __hash__(self) -> int:
+        return hash(self.name)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TsUnionType(TsBaseType):
     union_members: Tuple[str, ...]
+
+    def __hash__(self) -> int:
+        return hash(self.name)
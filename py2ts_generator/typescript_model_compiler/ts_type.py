@@ -1,4 +1,7 @@
 class TsType:
+    # Every field has a type, slots keep large models small.
+    __slots__ = ("_name", "_is_optional")
+
     def __init__(self, name: str, is_optional: bool = False):
         self._name = name
         self._is_optional = is_optional
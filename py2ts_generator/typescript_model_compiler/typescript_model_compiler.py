@@ -1,10 +1,12 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Type, Optional, Tuple, cast, Dict
+from typing import Any, List, Type, Optional, Tuple, Dict, MutableMapping
 from uuid import UUID
 
-from caseconverter import camelcase  # type: ignore
 from ordered_set import OrderedSet
 from typing_extensions import get_args
 from typing_inspect import is_optional_type, get_origin  # type: ignore
@@ -12,6 +14,9 @@ from typing_inspect import is_optional_type, get_origin  # type: ignore
 from py2ts_generator.model.model import Model
 from py2ts_generator.model.py_class import PyClass, RootTaggedUnionInformation
 from py2ts_generator.model.py_enum import PyEnum
+from py2ts_generator.naming.naming import CaseFormat, convert_name
+from py2ts_generator.tracing.tracing import SpanRecorder
+from py2ts_generator.type_costs.type_costs import TypeCostRecorder
 from py2ts_generator.typescript_model_compiler.ts_array import TsArray
 from py2ts_generator.typescript_model_compiler.ts_enum import (
     TsEnum,
@@ -36,6 +41,16 @@ from py2ts_generator.typescript_model_compiler.well_known_types import (
 )
 
 
+# Every thread gets a few contiguous chunks of classes, which keeps the
+# scheduling overhead low while the work stays balanced.
+_CHUNKS_PER_WORKER = 4
+
+
+def is_gil_enabled() -> bool:
+    # Interpreters before 3.13 do not report it, and always have a GIL.
+    return bool(getattr(sys, "_is_gil_enabled", lambda: True)())
+
+
 class UnsupportedGenericParameterCount(RuntimeError):
     def __init__(self, message: str) -> None:
         super().__init__(message)
@@ -55,33 +70,139 @@ class UnsupportedEnumValue(RuntimeError):
         )
 
 
-class CaseFormat(Enum):
-    KEEP_CASING = "KEEP_CASING"
-    CAMEL_CASE = "CAMEL_CASE"
-
-
 @dataclass
 class TypescriptModelCompilerSettings:
     field_case_format: CaseFormat = CaseFormat.KEEP_CASING
     type_mapping_overrides: Dict[Type, Type] = field(default_factory=dict)
 
 
+@dataclass
+class TypescriptModelCompilerCache:
+    """Compiled classes and types, which can be shared between compilers.
+
+    The entries depend on the compiler settings, so compilers sharing a cache
+    must use equal settings. Without a dict for classes, compiled classes are
+    not kept.
+    """
+
+    classes: Optional[MutableMapping[PyClass, TsBaseType]] = field(default_factory=dict)
+    types: MutableMapping[Tuple[Any, bool], TsType] = field(default_factory=dict)
+
+
 class TypescriptModelCompiler:
-    def __init__(self, typescript_compiler_settings: TypescriptModelCompilerSettings):
+    def __init__(
+        self,
+        typescript_compiler_settings: TypescriptModelCompilerSettings,
+        max_workers: Optional[int] = None,
+        cache: Optional[TypescriptModelCompilerCache] = None,
+        span_recorder: Optional[SpanRecorder] = None,
+        type_costs: Optional[TypeCostRecorder] = None,
+        force_threads: bool = False,
+    ):
+        """
+        :param typescript_compiler_settings: Settings influencing the output.
+        :param max_workers: When set, classes are compiled on a thread pool of
+            this size on free-threaded interpreters. With the GIL, threads only
+            slow compilation down, so classes are compiled serially. The output
+            is identical to the one of serial compilation.
+        :param cache: Cache to share with other compilers using equal settings.
+        :param span_recorder: Records a span per compiled class and enum.
+        :param type_costs: Records the compile time of every class and enum.
+        :param force_threads: Uses the thread pool of max_workers even while
+            the GIL is enabled, for tests and benchmarks.
+        """
         self.typescript_compiler_settings = typescript_compiler_settings
+        self.max_workers = max_workers
+        self.force_threads = force_threads
+        # The caches are shared between threads. Entries are immutable and only
+        # ever published with setdefault, so readers never need a lock: two
+        # threads racing on the same key compute equal values and the first
+        # one wins.
+        # A compiler of its own never sees a class twice, so it does not keep
+        # compiled classes.
+        cache = cache or TypescriptModelCompilerCache(classes=None)
+        self._class_cache = cache.classes
+        self._type_cache = cache.types
+        # Classes taken from the cache, counted under a lock since classes may
+        # be compiled on many threads.
+        self.cache_hits = 0
+        self._cache_hits_lock = threading.Lock()
+        self._span_recorder = span_recorder
+        self._type_costs = type_costs
 
     def compile(self, model: Model) -> TsModel:
-        types: OrderedSet[TsBaseType] = OrderedSet()
-        for py_class in model.classes:
-            types.append(self._compile_class(py_class))
+        types: OrderedSet[TsBaseType]
+        # With the GIL, compiling on threads measured about 0.8x the serial
+        # speed, the threads only contend for the interpreter.
+        if (
+            self.max_workers
+            and len(model.classes) > 1
+            and (self.force_threads or not is_gil_enabled())
+        ):
+            types = OrderedSet(
+                self._compile_classes_in_threads(list(model.classes), self.max_workers)
+            )
+        else:
+            types = OrderedSet()
+            for py_class in model.classes:
+                types.append(self.compile_class(py_class))
 
         enums: OrderedSet[TsEnum] = OrderedSet()
         for py_enum in model.enums:
-            enums.append(self._compile_enum(py_enum))
+            enums.append(self.compile_enum(py_enum))
 
         return TsModel(types=types, enums=enums)
 
-    def _compile_class(self, py_class: PyClass) -> TsBaseType:
+    def _compile_classes_in_threads(
+        self, py_classes: List[PyClass], max_workers: int
+    ) -> List[TsBaseType]:
+        chunk_count = min(len(py_classes), max_workers * _CHUNKS_PER_WORKER)
+        chunk_size = -(-len(py_classes) // chunk_count)
+        chunks = [
+            py_classes[i : i + chunk_size]  # noqa: E203
+            for i in range(0, len(py_classes), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map returns the chunks in order, so the model is the same as the
+            # serially compiled one.
+            return [
+                ts_type
+                for compiled_chunk in executor.map(self._compile_classes, chunks)
+                for ts_type in compiled_chunk
+            ]
+
+    def _compile_classes(self, py_classes: List[PyClass]) -> List[TsBaseType]:
+        return [self.compile_class(x) for x in py_classes]
+
+    def compile_class(self, py_class: PyClass) -> TsBaseType:
+        if self._span_recorder is None and self._type_costs is None:
+            return self._compile_cached_class(py_class)
+        start = time.perf_counter()
+        if self._span_recorder is None:
+            ts_type = self._compile_cached_class(py_class)
+        else:
+            with self._span_recorder.span(py_class.name, "compile"):
+                ts_type = self._compile_cached_class(py_class)
+        if self._type_costs is not None:
+            self._type_costs.compiled(
+                py_class.type, ts_type, time.perf_counter() - start
+            )
+        return ts_type
+
+    def _compile_cached_class(self, py_class: PyClass) -> TsBaseType:
+        if self._class_cache is None:
+            return self._compile_uncached_class(py_class)
+        ts_type = self._class_cache.get(py_class)
+        if ts_type is None:
+            ts_type = self._class_cache.setdefault(
+                py_class, self._compile_uncached_class(py_class)
+            )
+        else:
+            with self._cache_hits_lock:
+                self.cache_hits += 1
+        return ts_type
+
+    def _compile_uncached_class(self, py_class: PyClass) -> TsBaseType:
         if py_class.tagged_union_information and isinstance(
             py_class.tagged_union_information, RootTaggedUnionInformation
         ):
@@ -95,7 +216,7 @@ class TypescriptModelCompiler:
         for py_field in py_class.fields:
             fields.append(
                 TsField(
-                    name=self._adjust_casing(py_field.name),
+                    name=py_field.alias or self._adjust_casing(py_field.name),
                     type=self._compile_type(py_field.type),
                 )
             )
@@ -113,6 +234,19 @@ class TypescriptModelCompiler:
         )
 
     def _compile_type(self, cls: Type, optional: bool = False) -> TsType:
+        key = (cls, optional)
+        try:
+            return self._type_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable annotations are compiled without caching.
+            return self._compile_uncached_type(cls, optional)
+        return self._type_cache.setdefault(
+            key, self._compile_uncached_type(cls, optional)
+        )
+
+    def _compile_uncached_type(self, cls: Type, optional: bool) -> TsType:
         type_override = self.typescript_compiler_settings.type_mapping_overrides.get(
             cls
         )
@@ -174,7 +308,20 @@ class TypescriptModelCompiler:
 
         raise ValueError("not supported")
 
-    def _compile_enum(self, enum: PyEnum) -> TsEnum:
+    def compile_enum(self, enum: PyEnum) -> TsEnum:
+        if self._span_recorder is None and self._type_costs is None:
+            return self._compile_untraced_enum(enum)
+        start = time.perf_counter()
+        if self._span_recorder is None:
+            ts_enum = self._compile_untraced_enum(enum)
+        else:
+            with self._span_recorder.span(enum.name, "compile"):
+                ts_enum = self._compile_untraced_enum(enum)
+        if self._type_costs is not None:
+            self._type_costs.compiled(enum.type, ts_enum, time.perf_counter() - start)
+        return ts_enum
+
+    def _compile_untraced_enum(self, enum: PyEnum) -> TsEnum:
         for py_enum_value in enum.values:
             if type(py_enum_value.value) not in {int, str}:
                 raise UnsupportedEnumValue(type(py_enum_value.value))
@@ -182,6 +329,4 @@ class TypescriptModelCompiler:
         return TsEnum(name=enum.name, values=tuple(values))
 
     def _adjust_casing(self, name: str) -> str:
-        if self.typescript_compiler_settings.field_case_format == CaseFormat.CAMEL_CASE:
-            return cast(str, camelcase(name))
-        return name
+        return convert_name(name, self.typescript_compiler_settings.field_case_format)
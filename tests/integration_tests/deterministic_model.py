@@ -0,0 +1,68 @@
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional
+
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+
+
+class Color(Enum):
+    RED = "RED"
+    GREEN = "GREEN"
+    BLUE = "BLUE"
+
+
+@dataclass
+class Shape:
+    __json_type_info_attribute__ = "kind"
+    color: Color
+
+
+@dataclass
+class Circle(Shape):
+    kind = "CIRCLE"
+    radius: float
+
+
+@dataclass
+class Square(Shape):
+    kind = "SQUARE"
+    side: float
+
+
+@dataclass
+class Triangle(Shape):
+    kind = "TRIANGLE"
+    base: float
+    height: float
+
+
+@dataclass
+class Hexagon(Shape):
+    kind = "HEXAGON"
+    side: float
+
+
+@dataclass
+class Pentagon(Shape):
+    kind = "PENTAGON"
+    side: float
+
+
+@dataclass
+class Canvas:
+    shapes: List[Shape]
+    favourite: Optional[Circle]
+    named: Dict[str, Triangle]
+
+
+def generate(output_file: str) -> None:
+    TypeGenerationPipelineBuilder().for_types(
+        [Canvas, Hexagon]
+    ).convert_field_names_to_camel_case().to_file(output_file).build().run()
+
+
+if __name__ == "__main__":
+    generate(sys.argv[1])
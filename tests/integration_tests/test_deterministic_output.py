@@ -0,0 +1,41 @@
+import hashlib
+import os
+import subprocess
+import sys
+
+
+def _generate_in_subprocess(output_file, hash_seed: str) -> str:
+    env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tests.integration_tests.deterministic_model",
+            str(output_file),
+        ],
+        check=True,
+        env=env,
+    )
+    with open(output_file, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def test_output_is_byte_stable_across_processes(tmp_path):
+    hashes = {
+        _generate_in_subprocess(tmp_path / f"types_{seed}.ts", seed)
+        for seed in ["0", "1", "2", "3"]
+    }
+
+    assert len(hashes) == 1
+
+
+def test_union_members_are_in_definition_order(tmp_path):
+    output_file = tmp_path / "types.ts"
+    _generate_in_subprocess(output_file, "0")
+
+    with open(output_file, "r") as f:
+        content = f.read()
+    assert (
+        "export type Shape = Circle | Square | Triangle | Hexagon | Pentagon;\n"
+        in content
+    )
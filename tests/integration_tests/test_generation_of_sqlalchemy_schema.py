@@ -0,0 +1,37 @@
+from benchmarks.sqlalchemy_schema import SchemaSpec, build_schema
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.model_parser.class_parsers.sqlalchemy_parser import (
+    SQLAlchemyParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.output_size.output_size import INTERFACE, OutputSizeReport
+
+
+def test_should_generate_every_class_of_a_realistic_schema():
+    schema = build_schema(SchemaSpec(domain_count=2, entities_per_domain=10))
+
+    output = (
+        TypeGenerationPipelineBuilder()
+        .for_types(schema.classes)
+        .build_in_memory()
+        .generate()
+    )
+
+    report = OutputSizeReport.of_text(output.text)
+    assert sorted(x.name for x in report.declarations if x.kind == INTERFACE) == (
+        sorted(x.__name__ for x in schema.classes)
+    )
+
+
+def test_should_parse_every_column_of_a_realistic_schema_once():
+    schema = build_schema(SchemaSpec(domain_count=1, entities_per_domain=10))
+
+    model = ModelParser(
+        schema.classes, [SQLAlchemyParser()], ModelParserSettings()
+    ).parse()
+
+    for py_class in model.classes:
+        names = [x.name for x in py_class.fields]
+        assert len(names) == len(set(names)), py_class.name
@@ -1,6 +1,9 @@
 from ordered_set import OrderedSet
-from sqlalchemy import String
+from sqlalchemy import ForeignKey, String
 
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
 from py2ts_generator.model.model import Model
 from py2ts_generator.model.py_class import PyClass
 from py2ts_generator.model.py_field import PyField
@@ -20,12 +23,19 @@ class Base(DeclarativeBase):
 
 
 class MySimpleModel(Base):
-    __tablename__ = 'my_simple_model'
+    __tablename__ = "my_simple_model"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     text: Mapped[str] = mapped_column(String(length=100), nullable=False)
 
 
+class MyAliasedModel(Base):
+    __tablename__ = "my_aliased_model"
+
+    id: Mapped[int] = mapped_column(primary_key=True, key="identifier")
+    text: Mapped[str] = mapped_column(info={"py2ts_name": "Text"})
+
+
 def test_should_parse_simple_model_correctly():
     model_parser = ModelParser(
         [MySimpleModel], [SQLAlchemyParser()], ModelParserSettings()
@@ -46,4 +56,101 @@ def test_should_parse_simple_model_correctly():
                 )
             ]
         )
-    )
\ No newline at end of file
+    )
+
+
+def test_should_parse_column_keys_as_names_and_info_as_aliases():
+    model_parser = ModelParser(
+        [MyAliasedModel], [SQLAlchemyParser()], ModelParserSettings()
+    )
+
+    model = model_parser.parse()
+
+    assert model.classes[0].fields == (
+        PyField(name="identifier", type=int),
+        PyField(name="text", type=str, alias="Text"),
+    )
+
+
+class MyParentModel(Base):
+    __tablename__ = "my_parent_model"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column()
+
+    __mapper_args__ = {"polymorphic_on": "kind", "polymorphic_identity": "parent"}
+
+
+class MyJoinedChildModel(MyParentModel):
+    __tablename__ = "my_joined_child_model"
+
+    id: Mapped[int] = mapped_column(ForeignKey("my_parent_model.id"), primary_key=True)
+    text: Mapped[str] = mapped_column()
+
+    __mapper_args__ = {"polymorphic_identity": "child"}
+
+
+def test_should_parse_joined_table_inheritance_primary_key_once():
+    model_parser = ModelParser(
+        [MyJoinedChildModel], [SQLAlchemyParser()], ModelParserSettings()
+    )
+
+    model = model_parser.parse()
+
+    assert [x.name for x in model.classes[0].fields] == ["id", "kind", "text"]
+
+
+class MyNamedParentModel(Base):
+    __tablename__ = "my_named_parent_model"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column()
+    name: Mapped[str] = mapped_column()
+
+    __mapper_args__ = {"polymorphic_on": "kind", "polymorphic_identity": "parent"}
+
+
+class MyNamedChildModel(MyNamedParentModel):
+    __tablename__ = "my_named_child_model"
+
+    id: Mapped[int] = mapped_column(
+        ForeignKey("my_named_parent_model.id"), primary_key=True
+    )
+    child_name: Mapped[str] = mapped_column("name")
+
+    __mapper_args__ = {"polymorphic_identity": "child"}
+
+
+def test_should_parse_joined_table_inheritance_columns_sharing_a_name():
+    model_parser = ModelParser(
+        [MyNamedChildModel], [SQLAlchemyParser()], ModelParserSettings()
+    )
+
+    model = model_parser.parse()
+
+    assert model.classes[0].fields == (
+        PyField(name="id", type=int),
+        PyField(name="kind", type=str),
+        PyField(name="name", type=str),
+        PyField(name="child_name", type=str),
+    )
+
+
+class MyKeyedModel(Base):
+    __tablename__ = "my_keyed_model"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    display_name: Mapped[str] = mapped_column("full_name", key="display_name")
+    last_name: Mapped[str] = mapped_column()
+
+
+def test_should_convert_the_case_of_column_keys():
+    output = (
+        TypeGenerationPipelineBuilder()
+        .for_types([MyKeyedModel])
+        .convert_field_names_to_camel_case()
+        .build_in_memory()
+        .generate()
+    )
+
+    assert "    displayName: string\n    lastName: string\n" in output.text
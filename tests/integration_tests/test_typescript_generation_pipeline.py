@@ -1,8 +1,21 @@
+import asyncio
+import hashlib
+import os
+import threading
 from dataclasses import dataclass
+from unittest import mock
+
+import pytest
 
 from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    NoOutputFileDefined,
     TypeGenerationPipelineBuilder,
 )
+from py2ts_generator.source_manifest.source_manifest import (
+    SourceManifest,
+    check_manifest,
+    manifest_path_for,
+)
 
 
 def test_build_pipeline(tmp_path):
@@ -26,8 +39,10 @@ def test_build_pipeline(tmp_path):
     ).build().run()
 
     with open(output_file, "r") as f:
+        header = f.readline()
         content = f.read()
 
+    assert header.startswith("// py2ts-generator fingerprint: ")
     assert (
         content
         == """export interface MyExampleClass {
@@ -39,3 +54,520 @@ export interface TaggedUnionChild {
 export type TaggedUnionRoot = TaggedUnionChild;
 """
     )
+
+
+@dataclass
+class FingerprintedClass:
+    value: int
+
+
+def _build_fingerprint_pipeline(output_file):
+    return (
+        TypeGenerationPipelineBuilder()
+        .for_types([FingerprintedClass])
+        .to_file(output_file)
+    )
+
+
+def test_unchanged_model_skips_compile_emit_and_write(tmp_path):
+    output_file = tmp_path / "test.ts"
+    _build_fingerprint_pipeline(output_file).build().run()
+    first_mtime = os.stat(output_file).st_mtime_ns
+
+    pipeline = _build_fingerprint_pipeline(output_file).build()
+    with mock.patch.object(pipeline, "_compile_model") as compile_model:
+        pipeline.run()
+
+    compile_model.assert_not_called()
+    assert os.stat(output_file).st_mtime_ns == first_mtime
+
+
+def test_changed_settings_regenerate_output(tmp_path):
+    output_file = tmp_path / "test.ts"
+    _build_fingerprint_pipeline(output_file).build().run()
+    with open(output_file, "r") as f:
+        first_header = f.readline()
+
+    _build_fingerprint_pipeline(output_file).with_type_overrides(
+        {int: str}
+    ).build().run()
+
+    with open(output_file, "r") as f:
+        second_header = f.readline()
+        content = f.read()
+    assert first_header != second_header
+    assert (
+        content
+        == """export interface FingerprintedClass {
+    value: string
+}
+"""
+    )
+
+
+def test_pipeline_writes_source_manifest(tmp_path):
+    output_file = tmp_path / "test.ts"
+    _build_fingerprint_pipeline(output_file).build().run()
+
+    manifest_path = manifest_path_for(output_file)
+    manifest = SourceManifest.read(manifest_path)
+    assert [os.path.basename(x.path) for x in manifest.sources] == [
+        os.path.basename(__file__)
+    ]
+    assert check_manifest(manifest_path) is None
+
+    output_file.write_text("changed")
+    assert check_manifest(manifest_path) is not None
+
+
+def test_check_output_compares_pipeline_settings(tmp_path):
+    output_file = tmp_path / "test.ts"
+    _build_fingerprint_pipeline(output_file).build().run()
+
+    assert _build_fingerprint_pipeline(output_file).build().check_output() is None
+    assert "other pipeline settings" in (
+        _build_fingerprint_pipeline(output_file)
+        .with_type_overrides({int: str})
+        .build()
+        .check_output()
+    )
+
+
+def test_manifest_lists_modules_of_base_classes(tmp_path, monkeypatch):
+    (tmp_path / "manifest_base.py").write_text(
+        "from dataclasses import dataclass\n"
+        "@dataclass\n"
+        "class Base:\n"
+        "    value: int\n"
+    )
+    (tmp_path / "manifest_child.py").write_text(
+        "from dataclasses import dataclass\n"
+        "from manifest_base import Base\n"
+        "@dataclass\n"
+        "class Child(Base):\n"
+        "    name: str\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from manifest_child import Child  # type: ignore
+
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_types([Child]).to_file(
+        output_file
+    ).build().run()
+
+    manifest_path = manifest_path_for(output_file)
+    assert [x.path for x in SourceManifest.read(manifest_path).sources] == [
+        "manifest_base.py",
+        "manifest_child.py",
+    ]
+    with open(tmp_path / "manifest_base.py", "a") as f:
+        f.write("    other_value: int = 0\n")
+    assert "manifest_base.py" in check_manifest(manifest_path)
+
+
+def test_parallel_components_produce_same_output_as_serial(tmp_path):
+    from tests.integration_tests.deterministic_model import (
+        Canvas,
+        Color,
+        Hexagon,
+    )
+
+    @dataclass
+    class Unrelated:
+        name: str
+
+    def generate(output_file, builder):
+        builder.for_types([Unrelated, Canvas, Hexagon, Color]).to_file(
+            output_file
+        ).build().run()
+        with open(output_file, "r") as f:
+            return f.read()
+
+    serial = generate(tmp_path / "serial.ts", TypeGenerationPipelineBuilder())
+    parallel = generate(
+        tmp_path / "parallel.ts",
+        TypeGenerationPipelineBuilder().compile_components_in_parallel(max_workers=2),
+    )
+
+    assert parallel == serial
+
+
+def test_run_async_generates_same_output_as_run(tmp_path):
+    sync_output, async_output = tmp_path / "sync.ts", tmp_path / "async.ts"
+    _build_fingerprint_pipeline(sync_output).build().run()
+
+    report = asyncio.run(_build_fingerprint_pipeline(async_output).build().run_async())
+
+    assert report.written
+    assert list(report.stages) == [
+        "parse",
+        "fingerprint",
+        "compile",
+        "emit",
+        "write",
+        "manifest",
+    ]
+    assert report.counters["bytes_written"] == os.path.getsize(async_output)
+    assert async_output.read_text() == sync_output.read_text()
+
+
+def test_concurrent_run_async_calls_share_one_run(tmp_path):
+    output_file = tmp_path / "test.ts"
+    first = _build_fingerprint_pipeline(output_file).build()
+    second = _build_fingerprint_pipeline(output_file).build()
+
+    async def run_both():
+        return await asyncio.gather(first.run_async(), second.run_async())
+
+    with mock.patch.object(
+        second, "_parse_model", side_effect=second._parse_model
+    ) as parse_model:
+        first_report, second_report = asyncio.run(run_both())
+
+    assert first_report.written
+    assert second_report is first_report
+
+    parse_model.assert_not_called()
+
+
+def test_runs_of_one_pipeline_on_two_loops_report_separately(tmp_path):
+    output_file = tmp_path / "test.ts"
+    pipeline = _build_fingerprint_pipeline(output_file).build()
+    # Both runs find the output stale and then write it at the same time.
+    both_writing = threading.Barrier(2, timeout=5)
+    write_model = pipeline._write_model
+
+    def concurrent_write_model(observer, emitted_model):
+        both_writing.wait()
+        return write_model(observer, emitted_model)
+
+    def run_on_own_loop(reports):
+        reports.append(asyncio.run(pipeline.run_async()))
+
+    reports = []
+    with mock.patch.object(
+        pipeline, "_write_model", side_effect=concurrent_write_model
+    ):
+        threads = [
+            threading.Thread(target=run_on_own_loop, args=(reports,)) for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(reports) == 2
+    for report in reports:
+        assert list(report.stages) == [
+            "parse",
+            "fingerprint",
+            "compile",
+            "emit",
+            "write",
+            "manifest",
+        ]
+        assert report.counters["classes"] == 1
+        assert report.counters["bytes_written"] == os.path.getsize(output_file)
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        ["test.ts", os.path.basename(manifest_path_for(output_file))]
+    )
+
+
+def test_cancelled_run_async_does_not_write_output(tmp_path):
+    output_file = tmp_path / "test.ts"
+    pipeline = _build_fingerprint_pipeline(output_file).build()
+    parsing = threading.Event()
+    release = threading.Event()
+    parse_model = pipeline._parse_model
+
+    def slow_parse_model(observer):
+        parsing.set()
+        release.wait(5)
+        return parse_model(observer)
+
+    async def run_and_cancel():
+        task = asyncio.create_task(pipeline.run_async())
+        await asyncio.get_running_loop().run_in_executor(None, parsing.wait, 5)
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with mock.patch.object(pipeline, "_parse_model", side_effect=slow_parse_model):
+        asyncio.run(run_and_cancel())
+
+    assert not output_file.exists()
+
+
+def test_generate_returns_output_in_memory(tmp_path):
+    output_file = tmp_path / "test.ts"
+    _build_fingerprint_pipeline(output_file).build().run()
+
+    output = _build_fingerprint_pipeline(output_file).build_in_memory().generate()
+
+    assert output.data == output_file.read_bytes()
+    assert output.text == output_file.read_text()
+    assert output.content_hash == hashlib.sha256(output.data).hexdigest()
+
+
+def test_in_memory_pipeline_cannot_run():
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .for_types([FingerprintedClass])
+        .build_in_memory()
+    )
+
+    with pytest.raises(NoOutputFileDefined):
+        pipeline.run()
+
+
+def test_streaming_produces_same_output_as_serial(tmp_path):
+    from tests.integration_tests.deterministic_model import (
+        Canvas,
+        Color,
+        Hexagon,
+    )
+
+    def generate(output_file, builder):
+        builder.for_types([Canvas, Hexagon, Color]).to_file(
+            output_file
+        ).convert_field_names_to_camel_case().build().run()
+        return output_file.read_text()
+
+    serial = generate(tmp_path / "serial.ts", TypeGenerationPipelineBuilder())
+    streamed = generate(
+        tmp_path / "streamed.ts", TypeGenerationPipelineBuilder().stream_output()
+    )
+
+    assert streamed == serial
+
+
+def test_streaming_skips_unchanged_output(tmp_path):
+    output_file = tmp_path / "test.ts"
+    assert _build_fingerprint_pipeline(output_file).build().run()
+    first_mtime = os.stat(output_file).st_mtime_ns
+
+    written = _build_fingerprint_pipeline(output_file).stream_output().build().run()
+
+    assert not written
+    assert os.stat(output_file).st_mtime_ns == first_mtime
+    assert list(written.stages) == ["parse", "manifest"]
+
+
+def test_declaration_cache_reuses_declarations_across_runs(tmp_path):
+    from tests.integration_tests.deterministic_model import (
+        Canvas,
+        Color,
+        Hexagon,
+    )
+    from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+        TypescriptModelCompiler,
+    )
+
+    def generate(builder):
+        return (
+            builder.for_types([Canvas, Hexagon, Color])
+            .convert_field_names_to_camel_case()
+            .build_in_memory()
+            .generate()
+            .text
+        )
+
+    cache_path = tmp_path / "cache" / "declarations.sqlite"
+    serial = generate(TypeGenerationPipelineBuilder())
+    first = generate(TypeGenerationPipelineBuilder().cache_declarations(cache_path))
+    with mock.patch.object(TypescriptModelCompiler, "compile_class") as compile_class:
+        second = generate(
+            TypeGenerationPipelineBuilder().cache_declarations(cache_path)
+        )
+
+    assert first == second == serial
+    compile_class.assert_not_called()
+
+
+def test_output_store_restores_previous_outputs(tmp_path):
+    output_file = tmp_path / "test.ts"
+    store_directory = tmp_path / "store"
+    _build_fingerprint_pipeline(output_file).store_outputs(
+        store_directory
+    ).build().run()
+    original = output_file.read_text()
+    _build_fingerprint_pipeline(output_file).with_type_overrides(
+        {int: str}
+    ).store_outputs(store_directory).build().run()
+
+    pipeline = (
+        _build_fingerprint_pipeline(output_file).store_outputs(store_directory).build()
+    )
+    with mock.patch.object(pipeline, "_compile_model") as compile_model:
+        written = pipeline.run()
+
+    compile_model.assert_not_called()
+    assert written
+    assert output_file.read_text() == original
+    assert check_manifest(manifest_path_for(output_file)) is None
+
+
+def test_output_store_can_restore_outputs_by_copy(tmp_path):
+    output_file = tmp_path / "test.ts"
+    store_directory = tmp_path / "store"
+    _build_fingerprint_pipeline(output_file).store_outputs(
+        store_directory, link=False
+    ).build().run()
+    output_file.unlink()
+    os.remove(manifest_path_for(output_file))
+
+    pipeline = (
+        _build_fingerprint_pipeline(output_file)
+        .store_outputs(store_directory, link=False)
+        .build()
+    )
+    with mock.patch.object(pipeline, "_compile_model") as compile_model:
+        pipeline.run()
+
+    compile_model.assert_not_called()
+    assert os.stat(output_file).st_nlink == 1
+
+
+def test_run_reports_stages_and_counters(tmp_path):
+    from py2ts_generator.observer.observer import PipelineObserver
+
+    class StageRecorder(PipelineObserver):
+        def __init__(self):
+            self.stages = []
+
+        def stage_finished(self, stage, timing):
+            self.stages.append(stage)
+
+    recorder = StageRecorder()
+    output_file = tmp_path / "test.ts"
+    report = (
+        _build_fingerprint_pipeline(output_file).with_observer(recorder).build().run()
+    )
+
+    assert report.written
+    assert recorder.stages == [
+        "parse",
+        "fingerprint",
+        "compile",
+        "emit",
+        "write",
+        "manifest",
+    ]
+    assert list(report.stages) == recorder.stages
+    assert report.counters == {
+        "classes": 1,
+        "enums": 0,
+        "fields": 1,
+        "parser_dispatches": 1,
+        "parser_cache_hits": 0,
+        "compiler_cache_hits": 0,
+        "bytes_written": os.path.getsize(output_file),
+    }
+
+    report = _build_fingerprint_pipeline(output_file).build().run()
+
+    assert not report
+    assert list(report.stages) == ["parse", "fingerprint", "manifest"]
+
+
+def test_streaming_run_reports_stages_and_counters(tmp_path):
+    output_file = tmp_path / "test.ts"
+
+    report = _build_fingerprint_pipeline(output_file).stream_output().build().run()
+
+    assert report.written
+    assert list(report.stages) == ["parse", "stream", "manifest"]
+    assert report.counters["classes"] == 1
+    assert report.counters["bytes_written"] == os.path.getsize(output_file)
+
+
+def test_profile_writes_traces_next_to_the_output(tmp_path):
+    output_file = tmp_path / "test.ts"
+
+    _build_fingerprint_pipeline(output_file).profile(memory=True).build().run()
+
+    for stage in ["parse", "fingerprint", "compile", "emit", "write", "manifest"]:
+        assert (tmp_path / f"test.ts.{stage}.pstats").exists()
+        assert (tmp_path / f"test.ts.{stage}.allocations.txt").exists()
+
+
+def test_profile_parallel_components_fallback(tmp_path):
+    output_file = tmp_path / "test.ts"
+
+    # A single component is compiled and emitted in this process.
+    _build_fingerprint_pipeline(output_file).compile_components_in_parallel(
+        max_workers=2
+    ).profile().build().run()
+
+    for stage in ["parse", "fingerprint", "compile_and_emit", "write", "manifest"]:
+        assert (tmp_path / f"test.ts.{stage}.pstats").exists()
+    assert not (tmp_path / "test.ts.compile.pstats").exists()
+
+
+def test_parallel_components_fallback_reports_flat_stages(tmp_path):
+    report = (
+        _build_fingerprint_pipeline(tmp_path / "test.ts")
+        .compile_components_in_parallel(max_workers=2)
+        .build()
+        .run()
+    )
+
+    assert list(report.stages) == [
+        "parse",
+        "fingerprint",
+        "compile_and_emit",
+        "write",
+        "manifest",
+    ]
+
+
+def test_record_spans_of_stages_and_declarations(tmp_path):
+    from py2ts_generator.tracing.tracing import SpanRecorder
+
+    recorder = SpanRecorder()
+    _build_fingerprint_pipeline(tmp_path / "test.ts").record_spans(
+        recorder
+    ).build().run()
+
+    spans = {(x["cat"], x["name"]) for x in recorder.events}
+    assert {
+        ("stage", "parse"),
+        ("stage", "compile"),
+        ("stage", "emit"),
+        ("parse", "FingerprintedClass"),
+        ("parse", "DataclassParser.parse"),
+        ("compile", "FingerprintedClass"),
+        ("emit", "FingerprintedClass"),
+    } <= spans
+
+
+def test_record_type_costs(tmp_path):
+    from py2ts_generator.type_costs.type_costs import TypeCostRecorder
+
+    type_costs = TypeCostRecorder()
+    _build_fingerprint_pipeline(tmp_path / "test.ts").record_type_costs(
+        type_costs
+    ).build().run()
+
+    (cost,) = type_costs.report().types
+    assert cost.name == "FingerprintedClass"
+    assert cost.emitted_size > 0
+
+
+def test_limit_output_size(tmp_path):
+    from py2ts_generator.output_size.output_size import OutputSizeBudgetExceeded
+
+    output_file = tmp_path / "test.ts"
+
+    report = _build_fingerprint_pipeline(output_file).limit_output_size().build().run()
+
+    assert report.output_size.total_size == os.path.getsize(output_file)
+    assert [x.name for x in report.output_size.declarations] == ["FingerprintedClass"]
+    assert "size" in report.stages
+
+    # Outputs which are up-to-date are checked as well.
+    with pytest.raises(OutputSizeBudgetExceeded):
+        _build_fingerprint_pipeline(output_file).limit_output_size(
+            max_fields=0, fail=True
+        ).build().run()
@@ -0,0 +1,53 @@
+import gc
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+
+def retained_size(function: Callable[[], Any]) -> Tuple[Any, int]:
+    """Calls a function and returns its result and the bytes it keeps alive.
+
+    Run the function once before, so caches filled on first use, e.g. of
+    typing generics, are not counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def peak_size(function: Callable[[], Any]) -> int:
+    """Calls a function and returns the peak of the bytes it allocated.
+
+    Like retained_size, run the function once before.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def per_class_and_field(
+    size: Callable[[int], int], classes: int, fields: Tuple[int, int]
+) -> Tuple[float, float]:
+    """Splits the size of a model into a size per class and a size per field.
+
+    :param size: Size of a model of the given number of classes for a number
+        of fields per class.
+    """
+    few, many = fields
+    size_of_few = size(few)
+    per_field = (size(many) - size_of_few) / ((many - few) * classes)
+    per_class = size_of_few / classes - few * per_field
+    return per_class, per_field
@@ -0,0 +1,66 @@
+import gc
+import math
+import time
+from typing import Any, Callable, List, Sequence
+
+# Stages declared linear may grow a little faster on real machines, e.g. with
+# dict resizes and cache misses, but never close to quadratic.
+LINEAR = 1.0
+TOLERANCE = 0.35
+
+# Prepares the input of a stage for a size and returns the timed call.
+Workload = Callable[[int], Callable[[], Any]]
+
+
+def measure(call: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of a call, without garbage collection pauses."""
+    best = math.inf
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            call()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def growth_exponent(sizes: Sequence[int], timings: Sequence[float]) -> float:
+    """Least squares slope of log(time) over log(size)."""
+    xs = [math.log(x) for x in sizes]
+    ys = [math.log(x) for x in timings]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum(
+        (x - x_mean) ** 2 for x in xs
+    )
+
+
+def assert_scales(
+    workload: Workload,
+    sizes: Sequence[int],
+    exponent: float = LINEAR,
+    repeat: int = 3,
+) -> None:
+    """Fails if a stage grows faster than its declared complexity.
+
+    Only the ratios of the timings matter, so the check does not depend on the
+    speed of the machine. A fit above the limit is measured once more with
+    more repetitions, since a single slow run skews the fit.
+    """
+    calls = [workload(x) for x in sizes]
+    timings = [measure(x, repeat) for x in calls]
+    fitted = growth_exponent(sizes, timings)
+    if fitted > exponent + TOLERANCE:
+        timings = [min(t, measure(x, repeat * 2)) for t, x in zip(timings, calls)]
+        fitted = growth_exponent(sizes, timings)
+    assert fitted <= exponent + TOLERANCE, (
+        f"grows with exponent {fitted:.2f}, declared {exponent:.2f}:"
+        f" {_describe(sizes, timings)}"
+    )
+
+
+def _describe(sizes: Sequence[int], timings: List[float]) -> str:
+    return ", ".join(f"{x}: {t * 1000:.1f}ms" for x, t in zip(sizes, timings))
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.import_time import measure_import
+
+BUILDER = "py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder"
+
+# Warm import times in seconds, a few times the usual ones, so only an
+# import of a heavy dependency or a slow module initialisation fails.
+IMPORT_TIME_BUDGETS = {
+    "py2ts_generator": 0.05,
+    "py2ts_generator.cli.cli": 0.08,
+    BUILDER: 0.4,
+}
+
+
+@pytest.mark.parametrize("module, budget", IMPORT_TIME_BUDGETS.items())
+def test_import_time_stays_within_budget(module, budget):
+    warm = measure_import(module, repeat=3)["warm"]
+
+    assert warm <= budget, f"importing {module} took {warm * 1000:.0f}ms"
+
+
+@pytest.mark.parametrize("dependency", ["sqlalchemy", "asyncio"])
+def test_building_a_pipeline_does_not_import(dependency):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; "
+            "from py2ts_generator import TypeGenerationPipelineBuilder; "
+            "TypeGenerationPipelineBuilder().for_types([]).build_in_memory(); "
+            f"assert {dependency!r} not in sys.modules",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
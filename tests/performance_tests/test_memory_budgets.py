@@ -0,0 +1,63 @@
+import pytest
+
+from benchmarks.synthetic_model import ModelSpec, build_model
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.typescript_emitter.typescript_emitter import TypescriptEmitter
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+from tests.performance_tests.memory import per_class_and_field, retained_size
+
+CLASSES = 1000
+
+FIELDS = (4, 12)
+
+SETTINGS = TypescriptModelCompilerSettings()
+
+
+def _parse(roots):
+    return ModelParser(roots, [DataclassParser()], ModelParserSettings()).parse()
+
+
+def _roots(fields):
+    return build_model(
+        ModelSpec(
+            class_count=CLASSES, fields_per_class=fields, nesting_depth=1, enum_count=0
+        )
+    ).roots
+
+
+def _model_size(fields):
+    roots = _roots(fields)
+    _parse(roots)
+    return retained_size(lambda: _parse(roots))[1]
+
+
+def _ts_model_size(fields):
+    model = _parse(_roots(fields))
+    TypescriptModelCompiler(SETTINGS).compile(model)
+    return retained_size(lambda: TypescriptModelCompiler(SETTINGS).compile(model))[1]
+
+
+def _output_size(fields):
+    ts_model = TypescriptModelCompiler(SETTINGS).compile(_parse(_roots(fields)))
+    return retained_size(lambda: TypescriptEmitter().emit(ts_model))[1]
+
+
+@pytest.mark.parametrize(
+    "size, max_per_class, max_per_field",
+    [
+        pytest.param(_model_size, 240, 80, id="model"),
+        pytest.param(_ts_model_size, 240, 72, id="ts_model"),
+        pytest.param(_output_size, 64, 32, id="output"),
+    ],
+)
+def test_memory_stays_within_budget(size, max_per_class, max_per_field):
+    per_class, per_field = per_class_and_field(size, CLASSES, FIELDS)
+
+    assert per_field <= max_per_field, f"{per_field:.0f} bytes per field"
+    assert per_class <= max_per_class, f"{per_class:.0f} bytes per class"
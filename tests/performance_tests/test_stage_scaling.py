@@ -0,0 +1,157 @@
+import enum
+from dataclasses import make_dataclass
+from typing import List
+
+import pytest
+
+from benchmarks.synthetic_model import ModelSpec, build_model
+from py2ts_generator.fingerprint.fingerprint import compute_model_fingerprint
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.output_size.output_size import OutputSizeReport
+from py2ts_generator.snapshot.snapshot import ts_model_from_bytes, ts_model_to_bytes
+from py2ts_generator.typescript_emitter.typescript_emitter import TypescriptEmitter
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+from tests.performance_tests.scaling import assert_scales
+
+SIZES = [500, 1000, 2000, 4000]
+
+SETTINGS = TypescriptModelCompilerSettings()
+
+
+@pytest.fixture(scope="module")
+def roots() -> List[type]:
+    # Models of every size are the first classes of the largest one.
+    return build_model(
+        ModelSpec(class_count=max(SIZES), nesting_depth=1, tagged_union_count=0)
+    ).roots
+
+
+def _parse(types):
+    return ModelParser(types, [DataclassParser()], ModelParserSettings()).parse()
+
+
+def test_parse_scales_linearly(roots):
+    assert_scales(lambda n: lambda: _parse(roots[:n]), SIZES)
+
+
+def test_streaming_parse_scales_linearly(roots):
+    def workload(n):
+        parser = ModelParser(roots[:n], [DataclassParser()], ModelParserSettings())
+        return lambda: list(parser.iter_parse())
+
+    assert_scales(workload, SIZES)
+
+
+def test_fingerprint_scales_linearly(roots):
+    def workload(n):
+        model = _parse(roots[:n])
+        return lambda: compute_model_fingerprint(model, {})
+
+    assert_scales(workload, SIZES)
+
+
+def test_compile_scales_linearly(roots):
+    def workload(n):
+        model = _parse(roots[:n])
+        return lambda: TypescriptModelCompiler(SETTINGS).compile(model)
+
+    assert_scales(workload, SIZES)
+
+
+def test_emit_scales_linearly(roots):
+    def workload(n):
+        ts_model = TypescriptModelCompiler(SETTINGS).compile(_parse(roots[:n]))
+        return lambda: TypescriptEmitter().emit(ts_model)
+
+    assert_scales(workload, SIZES)
+
+
+def test_snapshot_scales_linearly(roots):
+    def workload(n):
+        ts_model = TypescriptModelCompiler(SETTINGS).compile(_parse(roots[:n]))
+        return lambda: ts_model_from_bytes(ts_model_to_bytes(ts_model))
+
+    assert_scales(workload, SIZES)
+
+
+def test_output_size_report_scales_linearly(roots):
+    def workload(n):
+        ts_model = TypescriptModelCompiler(SETTINGS).compile(_parse(roots[:n]))
+        text = TypescriptEmitter().emit(ts_model)
+        return lambda: OutputSizeReport.of_text(text)
+
+    assert_scales(workload, SIZES)
+
+
+def test_generation_scales_linearly(roots):
+    def workload(n):
+        builder = TypeGenerationPipelineBuilder().for_types(roots[:n])
+        # A new pipeline per call, so the output is never reused.
+        return lambda: builder.build_in_memory().generate()
+
+    assert_scales(workload, SIZES)
+
+
+def test_wide_class_scales_linearly():
+    def workload(n):
+        cls = make_dataclass(
+            f"WideClass{n}", [(f"field_{i}", int) for i in range(n)], init=False
+        )
+
+        def generate():
+            ts_model = TypescriptModelCompiler(SETTINGS).compile(_parse([cls]))
+            return TypescriptEmitter().emit(ts_model)
+
+        return generate
+
+    assert_scales(workload, [x * 2 for x in SIZES])
+
+
+def test_large_enum_scales_linearly():
+    def workload(n):
+        cls = make_dataclass(
+            f"ClassWithLargeEnum{n}",
+            [("value", enum.Enum(f"LargeEnum{n}", [f"V{i}" for i in range(n)]))],
+            init=False,
+        )
+
+        def generate():
+            ts_model = TypescriptModelCompiler(SETTINGS).compile(_parse([cls]))
+            return TypescriptEmitter().emit(ts_model)
+
+        return generate
+
+    assert_scales(workload, [x * 2 for x in SIZES])
+
+
+def test_tagged_union_fanout_scales_linearly():
+    def workload(n):
+        root = make_dataclass(
+            f"UnionRoot{n}",
+            [],
+            namespace={"__json_type_info_attribute__": "kind"},
+            init=False,
+        )
+        children = [
+            make_dataclass(
+                f"UnionRoot{n}Child{i}",
+                [],
+                bases=(root,),
+                namespace={"kind": f"child_{i}"},
+                init=False,
+            )
+            for i in range(n)
+        ]
+        assert children
+        return lambda: _parse([root])
+
+    assert_scales(workload, SIZES)
@@ -0,0 +1,54 @@
+import os
+
+from benchmarks.synthetic_model import ModelSpec, build_model
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from tests.performance_tests.memory import peak_size, per_class_and_field
+
+CLASSES = 1000
+
+FIELDS = (4, 12)
+
+
+def _peak_size(output_file, streaming):
+    def size(fields):
+        roots = build_model(
+            ModelSpec(
+                class_count=CLASSES,
+                fields_per_class=fields,
+                nesting_depth=1,
+                enum_count=0,
+            )
+        ).roots
+        builder = TypeGenerationPipelineBuilder().for_types(roots).to_file(output_file)
+        if streaming:
+            builder = builder.stream_output()
+
+        def run():
+            # A stale output is compiled and emitted.
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            builder.build().run()
+
+        run()
+        return peak_size(run)
+
+    return size
+
+
+def test_streaming_peak_memory_does_not_grow_with_the_fields(tmp_path):
+    output_file = tmp_path / "types.ts"
+
+    per_class, per_field = per_class_and_field(
+        _peak_size(output_file, streaming=True), CLASSES, FIELDS
+    )
+    _, serial_per_field = per_class_and_field(
+        _peak_size(output_file, streaming=False), CLASSES, FIELDS
+    )
+
+    # Neither the parsed model nor the output are held, the peak only grows
+    # by the bookkeeping of parsed types and emitted declarations.
+    assert per_field <= 32, f"{per_field:.0f} bytes per field"
+    assert per_class <= 768, f"{per_class:.0f} bytes per class"
+    assert per_field * 4 < serial_per_field
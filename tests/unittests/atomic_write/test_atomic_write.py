@@ -0,0 +1,67 @@
+import os
+import stat
+
+import pytest
+
+from py2ts_generator.atomic_write.atomic_write import atomic_write, temporary_path
+
+
+def test_replaces_the_file(tmp_path):
+    path = tmp_path / "out.ts"
+    path.write_text("old")
+
+    with atomic_write(path) as f:
+        f.write("new")
+        assert path.read_text() == "old"
+
+    assert path.read_text() == "new"
+    assert os.listdir(tmp_path) == ["out.ts"]
+
+
+def test_keeps_the_file_if_the_block_raises(tmp_path):
+    path = tmp_path / "out.ts"
+    path.write_text("old")
+
+    with pytest.raises(KeyboardInterrupt):
+        with atomic_write(path) as f:
+            f.write("new")
+            raise KeyboardInterrupt()
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["out.ts"]
+
+
+def test_concurrent_writers_do_not_share_a_temporary_file(tmp_path):
+    path = tmp_path / "out.ts"
+
+    with atomic_write(path) as first:
+        first.write("first")
+        with atomic_write(path) as second:
+            assert second.name != first.name
+            second.write("second")
+        assert path.read_text() == "second"
+
+    # The last writer to finish wins, with its complete text.
+    assert path.read_text() == "first"
+    assert os.listdir(tmp_path) == ["out.ts"]
+
+
+def test_gives_the_permissions_of_a_plain_open(tmp_path):
+    plain = tmp_path / "plain.ts"
+    plain.write_text("")
+
+    with atomic_write(tmp_path / "out.ts") as f:
+        f.write("")
+
+    mode = stat.S_IMODE(os.stat(tmp_path / "out.ts").st_mode)
+    assert mode == stat.S_IMODE(os.stat(plain).st_mode)
+
+
+def test_temporary_paths_are_unique_and_free(tmp_path):
+    path = tmp_path / "out.ts"
+
+    first, second = temporary_path(path), temporary_path(path)
+
+    assert first != second
+    assert os.path.dirname(first) == str(tmp_path)
+    assert not os.path.exists(first) and not os.path.exists(second)
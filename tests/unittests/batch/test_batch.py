@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from unittest import mock
+
+from py2ts_generator.batch.batch import run_batch
+from py2ts_generator.generation_pipeline.pipeline_caches import PipelineCaches
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.profiling.profiling import ProfileOptions
+
+
+@dataclass
+class SharedClass:
+    value: int
+
+
+@dataclass
+class FirstService:
+    shared: SharedClass
+
+
+@dataclass
+class SecondService:
+    shared: SharedClass
+
+
+def _builder(cls, output_file):
+    return TypeGenerationPipelineBuilder().for_types([cls]).to_file(output_file)
+
+
+def first_service(output_dir):
+    return _builder(FirstService, f"{output_dir}/first.ts")
+
+
+def second_service(output_dir):
+    return _builder(SecondService, f"{output_dir}/second.ts")
+
+
+def test_runs_all_pipelines_and_reports_results(tmp_path):
+    result = run_batch(
+        [first_service(tmp_path), second_service(tmp_path)],
+    )
+
+    assert [x.status for x in result.results] == ["generated", "generated"]
+    assert (tmp_path / "first.ts").exists()
+    assert (tmp_path / "second.ts").exists()
+
+    result = run_batch([first_service(tmp_path)])
+
+    assert [x.status for x in result.results] == ["unchanged"]
+
+
+def test_pipelines_share_parsed_classes(tmp_path):
+    with mock.patch.object(
+        DataclassParser, "parse", autospec=True, side_effect=DataclassParser.parse
+    ) as parse:
+        run_batch([first_service(tmp_path), second_service(tmp_path)])
+
+    parsed_classes = [x.args[1] for x in parse.call_args_list]
+    assert parsed_classes == [FirstService, SharedClass, SecondService]
+
+
+def test_failing_pipeline_does_not_stop_others(tmp_path):
+    result = run_batch(
+        [
+            "tests.unittests.batch.test_batch:does_not_exist",
+            second_service(tmp_path),
+        ]
+    )
+
+    assert [x.status for x in result.results] == ["failed", "generated"]
+    assert "does_not_exist not found" in result.results[0].error
+    assert len(result.failed) == 1
+
+
+def test_runs_pipelines_in_worker_pool(tmp_path):
+    result = run_batch(
+        [first_service(tmp_path), second_service(tmp_path)], max_workers=2
+    )
+
+    assert [x.name for x in result.results] == [
+        f"{tmp_path}/first.ts",
+        f"{tmp_path}/second.ts",
+    ]
+    assert [x.status for x in result.results] == ["generated", "generated"]
+
+
+def test_keeps_caches_and_observers_of_pipelines(tmp_path):
+    caches = PipelineCaches()
+    pipeline = first_service(tmp_path).build()
+    pipeline.caches = caches
+    observers = pipeline.observers
+
+    for _ in range(2):
+        result = run_batch([pipeline], profile=ProfileOptions())
+        assert result.failed == []
+
+    assert pipeline.caches is caches
+    assert pipeline.observers is observers
+    assert observers == []
+    assert (tmp_path / "first.ts.parse.pstats").exists()
+
+
+def test_batch_caches_only_apply_to_the_batch_run(tmp_path):
+    pipeline = first_service(tmp_path).build()
+
+    run_batch([pipeline])
+
+    assert pipeline.caches is None
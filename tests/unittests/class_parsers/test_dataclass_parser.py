@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict
 
 import pytest
@@ -122,3 +122,15 @@ def test_parse_dataclass_with_nested_generics():
             PyField(name="the_dict", type=Dict[str, List[Dict[str, CustomClass]]]),
         ),
     )
+
+
+def test_parse_dataclass_with_aliased_field():
+    @dataclass
+    class MyDataClass:
+        created_at: str = field(metadata={"py2ts_name": "creationDate"})
+
+    py_class = DataclassParser().parse(MyDataClass)
+
+    assert py_class.fields == (
+        PyField(name="created_at", type=str, alias="creationDate"),
+    )
@@ -0,0 +1,93 @@
+import subprocess
+import sys
+
+from py2ts_generator.cli.cli import main
+from py2ts_generator.source_manifest.source_manifest import (
+    SourceManifest,
+    manifest_path_for,
+)
+
+
+def _write_manifest(tmp_path):
+    output_file = tmp_path / "types.ts"
+    output_file.write_text("export interface A {\n}\n")
+    manifest_path = manifest_path_for(output_file)
+    SourceManifest.of_files(output_file, [], manifest_path, "settings").write(
+        manifest_path
+    )
+    return output_file, manifest_path
+
+
+def test_check_fresh_manifest(tmp_path, capsys):
+    _, manifest_path = _write_manifest(tmp_path)
+
+    assert main(["check", manifest_path]) == 0
+    assert capsys.readouterr().out.startswith("fresh: ")
+
+
+def test_check_stale_manifest(tmp_path, capsys):
+    output_file, manifest_path = _write_manifest(tmp_path)
+    output_file.unlink()
+
+    assert main(["check", manifest_path]) == 1
+    assert capsys.readouterr().out.startswith("stale: ")
+
+
+def test_check_does_not_import_pipeline(tmp_path):
+    _, manifest_path = _write_manifest(tmp_path)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from py2ts_generator.cli.cli import main; main(['check', sys.argv[1]]); "
+            "assert 'py2ts_generator.generation_pipeline.typescript_generation_pipeline' not in sys.modules; "
+            "assert 'sqlalchemy' not in sys.modules",
+            manifest_path,
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_batch_runs_referenced_pipelines(tmp_path, monkeypatch, capsys):
+    (tmp_path / "batch_pipelines.py").write_text(
+        "from dataclasses import dataclass\n"
+        "from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder"
+        " import TypeGenerationPipelineBuilder\n"
+        "@dataclass\n"
+        "class A:\n"
+        "    value: int\n"
+        "pipeline = TypeGenerationPipelineBuilder().for_types([A]).to_file('a.ts')\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    assert main(["batch", "batch_pipelines:pipeline", "batch_pipelines:missing"]) == 1
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("generated")
+    assert lines[1].startswith("failed")
+    assert lines[2].startswith("2 pipelines, 1 failed")
+    assert (tmp_path / "a.ts").exists()
+
+
+def test_batch_profiles_pipelines(tmp_path, monkeypatch, capsys):
+    (tmp_path / "profiled_pipelines.py").write_text(
+        "from dataclasses import dataclass\n"
+        "from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder"
+        " import TypeGenerationPipelineBuilder\n"
+        "@dataclass\n"
+        "class A:\n"
+        "    value: int\n"
+        "pipeline = TypeGenerationPipelineBuilder().for_types([A]).to_file('a.ts')\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    assert main(["batch", "profiled_pipelines:pipeline", "--profile"]) == 0
+
+    assert (tmp_path / "a.ts.parse.pstats").exists()
+    assert not (tmp_path / "a.ts.parse.allocations.txt").exists()
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from py2ts_generator.declaration_cache.declaration_cache import (
+    CachedDeclaration,
+    DeclarationCache,
+)
+from py2ts_generator.typescript_model_compiler.ts_enum import TsEnum, TsEnumValue
+from py2ts_generator.typescript_model_compiler.ts_field import TsField
+from py2ts_generator.typescript_model_compiler.ts_object_type import TsObjectType
+from py2ts_generator.typescript_model_compiler.ts_type import TsType
+
+
+def _entry(key, size=0):
+    return CachedDeclaration(
+        key=key,
+        declaration=TsObjectType(
+            name=key, fields=(TsField(name="value", type=TsType("number")),)
+        ),
+        text="x" * size,
+    )
+
+
+def test_stores_compiled_and_rendered_declarations(tmp_path):
+    cache = DeclarationCache(tmp_path / "cache.sqlite")
+    ts_enum = TsEnum(name="Color", values=(TsEnumValue(name="RED", value="red"),))
+    cache.put_many(
+        [_entry("type"), CachedDeclaration("enum", ts_enum, "export enum Color")]
+    )
+
+    reopened = DeclarationCache(tmp_path / "cache.sqlite")
+
+    assert reopened.get_texts(["type", "enum", "missing"]) == {
+        "type": "",
+        "enum": "export enum Color",
+    }
+    assert reopened.get("type") == _entry("type")
+    assert reopened.get("enum") == CachedDeclaration(
+        "enum", ts_enum, "export enum Color"
+    )
+    assert reopened.get("missing") is None
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache = DeclarationCache(tmp_path / "cache.sqlite", max_size=5000)
+    cache.put_many([_entry("first", 2000)])
+    cache.put_many([_entry("second", 2000)])
+    cache.get_texts(["first"])
+
+    cache.put_many([_entry("third", 2000)])
+
+    assert cache.get_texts(["first", "second", "third"]).keys() == {
+        "first",
+        "third",
+    }
+    assert cache.size() <= 5000
+
+
+def test_concurrent_writers(tmp_path):
+    def write(i):
+        cache = DeclarationCache(tmp_path / "cache.sqlite")
+        cache.put_many([_entry(f"{i}-{j}") for j in range(20)])
+        return len(cache.get_texts([f"{i}-{j}" for j in range(20)]))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(write, range(16))) == [20] * 16
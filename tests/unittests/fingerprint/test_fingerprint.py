@@ -0,0 +1,110 @@
+from enum import Enum
+from typing import List
+
+from ordered_set import OrderedSet
+
+from py2ts_generator.fingerprint.fingerprint import (
+    compute_model_fingerprint,
+    describe_type,
+    format_fingerprint_header,
+    read_fingerprint_header,
+)
+from py2ts_generator.model.model import Model
+from py2ts_generator.model.py_class import PyClass
+from py2ts_generator.model.py_enum import PyEnum, PyEnumValue
+from py2ts_generator.model.py_field import PyField
+from tests.unittests.fixture_classes import (
+    EmptyClass,
+    PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_MULTIPLE_CHILDREN,
+)
+
+
+class MyEnum(Enum):
+    FIRST = "FIRST"
+
+
+def _py_class(field_type) -> PyClass:
+    return PyClass(
+        name="EmptyClass",
+        type=EmptyClass,
+        fields=(PyField(name="value", type=field_type),),
+    )
+
+
+def test_describe_type_uses_qualified_name_for_classes():
+    assert describe_type(EmptyClass) == "tests.unittests.fixture_classes.EmptyClass"
+
+
+def test_describe_type_describes_generics_structurally():
+    assert describe_type(List[int]) == "builtins.list[builtins.int]"
+    assert describe_type(list[int]) == "builtins.list[builtins.int]"
+
+
+def test_same_model_and_settings_produce_same_fingerprint():
+    model = Model.of_classes([_py_class(int)])
+
+    assert compute_model_fingerprint(
+        model, {"case_format": "KEEP_CASING"}
+    ) == compute_model_fingerprint(model, {"case_format": "KEEP_CASING"})
+
+
+def test_changed_annotation_changes_fingerprint():
+    assert compute_model_fingerprint(
+        Model.of_classes([_py_class(int)]), {}
+    ) != compute_model_fingerprint(Model.of_classes([_py_class(str)]), {})
+
+
+def test_changed_settings_change_fingerprint():
+    model = Model.of_classes([_py_class(int)])
+
+    assert compute_model_fingerprint(
+        model, {"case_format": "KEEP_CASING"}
+    ) != compute_model_fingerprint(model, {"case_format": "CAMEL_CASE"})
+
+
+def test_changed_tagged_union_information_changes_fingerprint():
+    root = PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_MULTIPLE_CHILDREN
+
+    assert compute_model_fingerprint(
+        Model.of_classes([root]), {}
+    ) != compute_model_fingerprint(
+        Model.of_classes([root.with_tagged_union_information(None)]),  # type: ignore
+        {},
+    )
+
+
+def test_changed_enum_value_changes_fingerprint():
+    def _model(value: str) -> Model:
+        return Model(
+            enums=OrderedSet(
+                [
+                    PyEnum(
+                        name="MyEnum",
+                        type=MyEnum,
+                        values=(PyEnumValue(name="FIRST", value=value),),
+                    )
+                ]
+            )
+        )
+
+    assert compute_model_fingerprint(_model("FIRST"), {}) != compute_model_fingerprint(
+        _model("OTHER"), {}
+    )
+
+
+def test_read_fingerprint_header(tmp_path):
+    output_file = tmp_path / "test.ts"
+    output_file.write_text(format_fingerprint_header("abc") + "export enum A {\n}\n")
+
+    assert read_fingerprint_header(output_file) == "abc"
+
+
+def test_read_fingerprint_header_without_header(tmp_path):
+    output_file = tmp_path / "test.ts"
+    output_file.write_text("export enum A {\n}\n")
+
+    assert read_fingerprint_header(output_file) is None
+
+
+def test_read_fingerprint_header_missing_file(tmp_path):
+    assert read_fingerprint_header(tmp_path / "missing.ts") is None
@@ -522,8 +522,8 @@ PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_BUT_NO_CHILDREN = PyClass(
     tagged_union_information=RootTaggedUnionInformation(
         discriminant_attribute="type",
         discriminant_literal="TEST",
-        discriminant_literals=frozenset({"TEST"}),
-        child_types=frozenset(),
+        discriminant_literals=("TEST",),
+        child_types=(),
     ),
 )
 
@@ -534,8 +534,8 @@ PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_NO_DISCRIMINANT_FOR_ROOT = PyC
     tagged_union_information=RootTaggedUnionInformation(
         discriminant_attribute="type",
         discriminant_literal="",
-        discriminant_literals=frozenset(),
-        child_types=frozenset(),
+        discriminant_literals=(),
+        child_types=(),
     ),
 )
 PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_SINGLE_CHILD = PyClass(
@@ -545,8 +545,8 @@ PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_SINGLE_CHILD = PyClass(
     tagged_union_information=RootTaggedUnionInformation(
         discriminant_attribute="my_type",
         discriminant_literal="BASE",
-        discriminant_literals=frozenset({"BASE", "CHILD"}),
-        child_types=frozenset({ClassWithTaggedUnionDiscriminantSingleChildChild}),
+        discriminant_literals=("BASE", "CHILD"),
+        child_types=(ClassWithTaggedUnionDiscriminantSingleChildChild,),
     ),
 )
 PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_SINGLE_CHILD_CHILD = PyClass(
@@ -566,12 +566,10 @@ PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_MULTIPLE_CHILDREN = PyClass(
     tagged_union_information=RootTaggedUnionInformation(
         discriminant_attribute="type",
         discriminant_literal="BASE",
-        discriminant_literals=frozenset({"BASE", "CHILD_1", "CHILD_2"}),
-        child_types=frozenset(
-            {
-                ClassWithTaggedUnionDiscriminantMultipleChildrenChild1,
-                ClassWithTaggedUnionDiscriminantMultipleChildrenChild2,
-            }
+        discriminant_literals=("BASE", "CHILD_1", "CHILD_2"),
+        child_types=(
+            ClassWithTaggedUnionDiscriminantMultipleChildrenChild1,
+            ClassWithTaggedUnionDiscriminantMultipleChildrenChild2,
         ),
     ),
 )
@@ -604,12 +602,8 @@ PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_ENUM_DISCRIMINATOR = PyClass(
     tagged_union_information=RootTaggedUnionInformation(
         discriminant_attribute="type",
         discriminant_literal="BASE",
-        discriminant_literals=frozenset({"BASE", "CHILD"}),
-        child_types=frozenset(
-            {
-                ClassWithTaggedUnionDiscriminantEnumDiscriminatorChild,
-            }
-        ),
+        discriminant_literals=("BASE", "CHILD"),
+        child_types=(ClassWithTaggedUnionDiscriminantEnumDiscriminatorChild,),
     ),
 )
 PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_ENUM_DISCRIMINATOR_CHILD = PyClass(
@@ -2,8 +2,10 @@ import pytest
 
 from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
     TypeGenerationPipelineBuilder,
+    IncompatiblePipelineOptions,
     NoOutputFileDefined,
 )
+from py2ts_generator.tracing.tracing import SpanRecorder
 from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
     CaseFormat,
 )
@@ -37,3 +39,20 @@ def test_provided_options_builds_correctly():
     assert pipeline.type_overrides == {int: str}
     assert pipeline.case_format == CaseFormat.CAMEL_CASE
     assert pipeline.output_file == "test.ts"
+
+
+@pytest.mark.parametrize(
+    "configure",
+    [
+        lambda x, path: x.cache_declarations(path).compile_components_in_parallel(),
+        lambda x, path: x.cache_declarations(path).emit_in_parallel(2),
+        lambda x, path: x.stream_output().compile_with_threads(2),
+        lambda x, path: x.compile_components_in_parallel().emit_in_parallel(2),
+        lambda x, path: x.compile_components_in_parallel().record_spans(SpanRecorder()),
+    ],
+)
+def test_build_fails_for_options_which_cannot_be_combined(configure, tmp_path):
+    builder = configure(TypeGenerationPipelineBuilder(), tmp_path / "cache.db")
+
+    with pytest.raises(IncompatiblePipelineOptions):
+        builder.to_file("test.ts").build()
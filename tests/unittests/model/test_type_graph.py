@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional
+
+from py2ts_generator.model.type_graph import connected_components
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+
+
+class Status(Enum):
+    OPEN = "OPEN"
+
+
+class Unused(Enum):
+    VALUE = "VALUE"
+
+
+@dataclass
+class Leaf:
+    value: int
+
+
+@dataclass
+class Node:
+    children: Dict[str, List[Optional[Leaf]]]
+    status: Status
+
+
+@dataclass
+class Standalone:
+    name: str
+
+
+@dataclass
+class Root:
+    __json_type_info_attribute__ = "type"
+
+
+@dataclass
+class Child(Root):
+    type = "CHILD"
+
+
+def _components(types):
+    model = ModelParser(types, [DataclassParser()], ModelParserSettings()).parse()
+    return [
+        ([x.type for x in component.classes], [x.type for x in component.enums])
+        for component in connected_components(model)
+    ]
+
+
+def test_generic_arguments_and_enums_connect_classes():
+    assert _components([Node, Standalone]) == [
+        ([Node, Leaf], [Status]),
+        ([Standalone], []),
+    ]
+
+
+def test_tagged_union_children_connect_to_root():
+    assert _components([Standalone, Root]) == [
+        ([Standalone], []),
+        ([Child, Root], []),
+    ]
+
+
+def test_unreferenced_enums_form_own_component():
+    model = ModelParser(
+        [Standalone, Unused], [DataclassParser()], ModelParserSettings()
+    ).parse()
+
+    components = connected_components(model)
+
+    assert [[x.type for x in c.enums] for c in components] == [[], [Unused]]
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     Type,
@@ -9,6 +10,7 @@ from typing import (
     FrozenSet,
     DefaultDict,
 )
+from unittest import mock
 from uuid import UUID
 
 import pytest
@@ -20,12 +22,16 @@ from py2ts_generator.model.py_field import PyField
 from py2ts_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
 from py2ts_generator.model_parser.model_parser import (
     ModelParser,
     NoParserForClassFoundException,
     IsNotAClassException,
     ModelParserSettings,
 )
+from tests.integration_tests.deterministic_model import Canvas, Hexagon, Shape
 from tests.unittests.demo_parser_fixture import DemoParser
 from tests.unittests.fixture_classes import (
     ClassFixture,
@@ -583,3 +589,44 @@ class TestParseDiscriminantUnionClasses:
                 ]
             )
         )
+
+
+class TestIterParse:
+    @staticmethod
+    def _parse_both(classes):
+        model_parser = ModelParser(classes, [DataclassParser()], ModelParserSettings())
+        return model_parser.parse(), list(model_parser.iter_parse())
+
+    def test_yields_declarations_in_model_order(self):
+        model, declarations = self._parse_both([Canvas, Hexagon])
+
+        assert [x for x in declarations if isinstance(x, PyClass)] == list(
+            model.classes
+        )
+        assert [x for x in declarations if not isinstance(x, PyClass)] == list(
+            model.enums
+        )
+
+    def test_yields_tagged_union_root_after_its_children(self):
+        _, declarations = self._parse_both([Shape])
+
+        assert declarations[-1].type is Shape
+        assert declarations[-1].tagged_union_information.child_types
+
+    def test_yields_before_the_whole_model_is_parsed(self):
+        @dataclass
+        class First:
+            pass
+
+        @dataclass
+        class Second:
+            pass
+
+        parser = DataclassParser()
+        model_parser = ModelParser([First, Second], [parser], ModelParserSettings())
+        declarations = model_parser.iter_parse()
+
+        with mock.patch.object(parser, "parse", side_effect=parser.parse) as parse:
+            assert next(declarations).type is First
+
+        assert [x.args for x in parse.call_args_list] == [(First,)]
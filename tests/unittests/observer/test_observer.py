@@ -0,0 +1,66 @@
+import pytest
+
+from py2ts_generator.observer.observer import (
+    ObserverGroup,
+    PipelineObserver,
+    ReportCollector,
+    StageTiming,
+)
+
+
+class RecordingObserver(PipelineObserver):
+    def __init__(self):
+        self.events = []
+
+    def stage_started(self, stage):
+        self.events.append(("started", stage))
+
+    def stage_finished(self, stage, timing):
+        self.events.append(("finished", stage))
+
+    def counted(self, counter, value):
+        self.events.append(("counted", counter, value))
+
+
+def test_observer_group_notifies_all_observers():
+    first, second = RecordingObserver(), RecordingObserver()
+    group = ObserverGroup([first, second])
+
+    with group.stage("parse"):
+        group.count("classes", 3)
+
+    assert (
+        first.events
+        == second.events
+        == [
+            ("started", "parse"),
+            ("counted", "classes", 3),
+            ("finished", "parse"),
+        ]
+    )
+
+
+def test_stage_finishes_when_it_fails():
+    observer = RecordingObserver()
+
+    with pytest.raises(ValueError):
+        with ObserverGroup([observer]).stage("compile"):
+            raise ValueError()
+
+    assert observer.events == [("started", "compile"), ("finished", "compile")]
+
+
+def test_collector_sums_repeated_stages_and_counters():
+    collector = ReportCollector()
+    collector.stage_finished("emit", StageTiming(wall_time=1.0, cpu_time=0.5))
+    collector.stage_finished("emit", StageTiming(wall_time=2.0, cpu_time=1.0))
+    collector.counted("classes", 2)
+    collector.counted("classes", 3)
+
+    report = collector.report(written=False)
+
+    assert not report
+    assert report.stages == {"emit": StageTiming(wall_time=3.0, cpu_time=1.5)}
+    assert report.counters == {"classes": 5}
+    assert report.wall_time == 3.0
+    assert "classes" in report.summary()
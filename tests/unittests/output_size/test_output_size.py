@@ -0,0 +1,68 @@
+import logging
+
+import pytest
+
+from py2ts_generator.output_size.output_size import (
+    ENUM,
+    INTERFACE,
+    UNION,
+    DeclarationSize,
+    OutputSizeBudget,
+    OutputSizeBudgetExceeded,
+    OutputSizeReport,
+)
+
+OUTPUT = (
+    "// py2ts-fingerprint: 0123\n"
+    "export enum Color {\n"
+    '    RED = "red",\n'
+    '    GREEN = "green",\n'
+    "}\n"
+    "export interface Leaf {\n"
+    "    color: Color\n"
+    '    "created-at": string\n'
+    '    type: "leaf"\n'
+    "}\n"
+    "export type Node = Leaf | Branch;\n"
+    "export type Empty = {};\n"
+)
+
+
+def test_measures_declarations():
+    report = OutputSizeReport.of_text(OUTPUT)
+
+    assert report.total_size == len(OUTPUT)
+    assert report.declarations == (
+        DeclarationSize("Color", ENUM, 60, 2),
+        DeclarationSize("Leaf", INTERFACE, 85, 3),
+        DeclarationSize("Node", UNION, 34, 2),
+        DeclarationSize("Empty", UNION, 24, 0),
+    )
+    assert [x.name for x in report.largest(2)] == ["Leaf", "Color"]
+    assert [x.name for x in report.largest(kind=UNION)] == ["Node", "Empty"]
+    assert report.summary().startswith("230 bytes, 4 declarations, 7 fields")
+
+
+def test_budget_violations():
+    report = OutputSizeReport.of_text(OUTPUT)
+
+    assert OutputSizeBudget().violations(report) == []
+    assert OutputSizeBudget(
+        max_total_size=100, max_declaration_size=60, max_fields=2
+    ).violations(report) == [
+        "230 bytes exceed 100 bytes",
+        "Leaf has 85 bytes, more than 60 bytes",
+        "Leaf has 3 fields, more than 2 fields",
+    ]
+
+
+def test_budget_warns_or_fails(caplog):
+    report = OutputSizeReport.of_text(OUTPUT)
+
+    with caplog.at_level(logging.WARNING):
+        OutputSizeBudget(max_fields=2).check(report, "types.ts")
+    assert "Leaf has 3 fields" in caplog.text
+
+    with pytest.raises(OutputSizeBudgetExceeded) as e:
+        OutputSizeBudget(max_fields=2, fail=True).check(report, "types.ts")
+    assert e.value.violations == ["Leaf has 3 fields, more than 2 fields"]
@@ -0,0 +1,91 @@
+import os
+
+from py2ts_generator.fingerprint.fingerprint import format_fingerprint_header
+from py2ts_generator.output_store.output_store import OutputStore, _used_path
+
+
+def _write_output(path, fingerprint, content="export type A = string;\n"):
+    # Like the pipeline, outputs are replaced rather than changed in place.
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(format_fingerprint_header(fingerprint) + content)
+    os.replace(tmp_path, path)
+
+
+def test_restores_stored_output_by_hardlink(tmp_path):
+    store = OutputStore(tmp_path / "store")
+    output_file = tmp_path / "types.ts"
+    _write_output(output_file, "aaaa")
+    store.store("aaaa", output_file)
+    _write_output(output_file, "bbbb")
+
+    assert store.restore("aaaa", output_file)
+    assert output_file.read_text().startswith(format_fingerprint_header("aaaa"))
+    assert os.stat(output_file).st_nlink == 2
+
+
+def test_restoring_keeps_the_modification_time_of_the_output(tmp_path):
+    store = OutputStore(tmp_path / "store")
+    output_file = tmp_path / "types.ts"
+    _write_output(output_file, "aaaa")
+    store.store("aaaa", output_file)
+    os.utime(store._object_path("aaaa"), ns=(1, 1))
+    _write_output(output_file, "bbbb")
+
+    assert store.restore("aaaa", output_file)
+    assert store.restore("aaaa", output_file)
+    assert os.stat(output_file).st_mtime_ns == 1
+    assert os.stat(_used_path(store._object_path("aaaa"))).st_mtime_ns > 1
+
+
+def test_restores_stored_output_by_copy(tmp_path):
+    store = OutputStore(tmp_path / "store", link=False)
+    output_file = tmp_path / "types.ts"
+    _write_output(output_file, "aaaa")
+    store.store("aaaa", output_file)
+    output_file.unlink()
+
+    assert store.restore("aaaa", output_file)
+    assert output_file.read_text().startswith(format_fingerprint_header("aaaa"))
+    assert os.stat(output_file).st_nlink == 1
+
+
+def test_does_not_restore_unknown_or_corrupt_outputs(tmp_path):
+    store = OutputStore(tmp_path / "store")
+    output_file = tmp_path / "types.ts"
+    _write_output(output_file, "aaaa")
+    store.store("aaaa", output_file)
+    (tmp_path / "store" / "aa" / "aa.ts").write_text("truncated")
+
+    assert not store.restore("aaaa", output_file)
+    assert not store.restore("cccc", output_file)
+
+
+def test_evicts_least_recently_used_outputs(tmp_path):
+    store = OutputStore(tmp_path / "store", max_entries=2)
+    output_file = tmp_path / "types.ts"
+    for i, fingerprint in enumerate(["aaaa", "bbbb", "cccc"]):
+        _write_output(output_file, fingerprint)
+        store.store(fingerprint, output_file)
+        os.utime(_used_path(store._object_path(fingerprint)), ns=(i, i))
+        if fingerprint == "bbbb":
+            # Restoring aaaa makes bbbb the least recently used output.
+            store.restore("aaaa", output_file)
+            os.utime(_used_path(store._object_path("aaaa")), ns=(10, 10))
+    store.evict()
+
+    assert store.restore("aaaa", output_file)
+    assert not store.restore("bbbb", output_file)
+    assert store.restore("cccc", output_file)
+
+
+def test_evicts_outputs_exceeding_the_size(tmp_path):
+    store = OutputStore(tmp_path / "store", max_size=150)
+    output_file = tmp_path / "types.ts"
+    _write_output(output_file, "aaaa", "x" * 100)
+    store.store("aaaa", output_file)
+    _write_output(output_file, "bbbb", "y" * 100)
+    store.store("bbbb", output_file)
+
+    assert not store.restore("aaaa", output_file)
+    assert not os.path.exists(_used_path(store._object_path("aaaa")))
+    assert store.restore("bbbb", output_file)
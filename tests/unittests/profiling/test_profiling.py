@@ -0,0 +1,73 @@
+import pstats
+import tracemalloc
+
+from py2ts_generator.observer.observer import ObserverGroup
+from py2ts_generator.profiling.profiling import ProfileOptions, ProfilingObserver
+
+
+def _allocate():
+    return [str(x) for x in range(1000)]
+
+
+def test_writes_a_trace_per_stage(tmp_path):
+    observer = ProfilingObserver(tmp_path / "out" / "types.ts")
+
+    with ObserverGroup([observer]).stage("parse"):
+        _allocate()
+
+    stats = pstats.Stats(str(tmp_path / "out" / "types.ts.parse.pstats"))
+    assert any(x[2] == "_allocate" for x in stats.stats)
+    assert not (tmp_path / "out" / "types.ts.parse.allocations.txt").exists()
+
+
+def _allocate_more():
+    return [str(x) for x in range(10)]
+
+
+def test_pauses_the_outer_stage_while_a_nested_stage_runs(tmp_path):
+    observer = ProfilingObserver(tmp_path / "types.ts")
+    group = ObserverGroup([observer])
+
+    with group.stage("compile_and_emit"):
+        with group.stage("compile"):
+            _allocate()
+        _allocate_more()
+
+    outer = pstats.Stats(str(tmp_path / "types.ts.compile_and_emit.pstats"))
+    inner = pstats.Stats(str(tmp_path / "types.ts.compile.pstats"))
+    assert any(x[2] == "_allocate_more" for x in outer.stats)
+    assert not any(x[2] == "_allocate" for x in outer.stats)
+    assert any(x[2] == "_allocate" for x in inner.stats)
+
+
+def test_writes_top_allocation_sites(tmp_path):
+    observer = ProfilingObserver(
+        tmp_path / "types.ts", ProfileOptions(memory=True, top=3)
+    )
+
+    with ObserverGroup([observer]).stage("emit"):
+        kept = _allocate()
+
+    lines = (tmp_path / "types.ts.emit.allocations.txt").read_text().splitlines()
+    assert lines[0].startswith("stage emit: ")
+    assert lines[1] == "top 3 allocation sites:"
+    assert 1 <= len(lines[2:]) <= 3
+    assert "test_profiling.py" in lines[2]
+    assert not tracemalloc.is_tracing()
+    assert kept
+
+
+def test_keeps_tracing_started_by_others(tmp_path):
+    observer = ProfilingObserver(tmp_path / "types.ts", ProfileOptions(memory=True))
+    tracemalloc.start()
+    try:
+        with ObserverGroup([observer]).stage("emit"):
+            kept = _allocate()
+
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert "test_profiling.py" in (
+        (tmp_path / "types.ts.emit.allocations.txt").read_text()
+    )
+    assert kept
@@ -0,0 +1,112 @@
+import asyncio
+import gzip
+from dataclasses import dataclass
+from unittest import mock
+
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.serving.serving import (
+    AsgiTypesHandler,
+    GeneratedTypesResource,
+    WsgiTypesHandler,
+)
+
+
+@dataclass
+class ServedClass:
+    value: int
+
+
+def _pipeline():
+    return TypeGenerationPipelineBuilder().for_types([ServedClass]).build_in_memory()
+
+
+def test_serves_generated_output_with_etag():
+    pipeline = _pipeline()
+    status, headers, body = GeneratedTypesResource(pipeline).respond("GET", {})
+
+    assert status == 200
+    assert body == pipeline.generate().data
+    assert dict(headers)["ETag"] == f'"{pipeline.generate().content_hash}"'
+
+
+def test_matching_if_none_match_returns_not_modified():
+    resource = GeneratedTypesResource(_pipeline())
+    _, headers, _ = resource.respond("GET", {})
+
+    status, _, body = resource.respond(
+        "GET", {"if-none-match": f'"other", W/{dict(headers)["ETag"]}'}
+    )
+
+    assert status == 304
+    assert body == b""
+
+
+def test_serves_precomputed_gzip():
+    pipeline = _pipeline()
+    resource = GeneratedTypesResource(pipeline)
+
+    with mock.patch("gzip.compress", side_effect=gzip.compress) as compress:
+        for _ in range(3):
+            status, headers, body = resource.respond(
+                "GET", {"accept-encoding": "br;q=1.0, gzip;q=0.8"}
+            )
+
+    assert status == 200
+    assert dict(headers)["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == pipeline.generate().data
+    assert compress.call_count == 1
+
+
+def test_output_is_only_regenerated_when_fingerprint_changes():
+    pipeline = _pipeline()
+    resource = GeneratedTypesResource(pipeline)
+    resource.respond("GET", {})
+
+    with mock.patch.object(pipeline, "_compile_model") as compile_model:
+        resource.respond("GET", {})
+
+    compile_model.assert_not_called()
+
+
+def test_rejects_other_methods():
+    status, headers, _ = GeneratedTypesResource(_pipeline()).respond("POST", {})
+
+    assert status == 405
+    assert headers == [("Allow", "GET, HEAD")]
+
+
+def test_wsgi_handler():
+    start_response = mock.Mock()
+
+    body = WsgiTypesHandler(_pipeline())(
+        {"REQUEST_METHOD": "GET", "HTTP_ACCEPT_ENCODING": "gzip"}, start_response
+    )
+
+    status, headers = start_response.call_args.args
+    assert status == "200 OK"
+    assert ("Content-Encoding", "gzip") in headers
+    assert gzip.decompress(b"".join(body)).startswith(b"// py2ts-generator")
+
+
+def test_asgi_handler():
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(
+        AsgiTypesHandler(_pipeline())(
+            {"type": "http", "method": "GET", "headers": []}, receive, send
+        )
+    )
+
+    assert messages[0]["status"] == 200
+    assert (b"content-type", b"application/typescript; charset=utf-8") in messages[0][
+        "headers"
+    ]
+    assert b"export interface ServedClass" in messages[1]["body"]
@@ -0,0 +1,129 @@
+import gc
+import weakref
+from dataclasses import dataclass, make_dataclass
+from typing import List, Optional
+from unittest import mock
+
+import pytest
+
+from py2ts_generator.generation_pipeline.typescript_generation_pipeline_builder import (
+    TypeGenerationPipelineBuilder,
+)
+from py2ts_generator.model.py_class import PyClass
+from py2ts_generator.model.py_field import PyField
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.session.session import GenerationSession
+from py2ts_generator.typescript_model_compiler.ts_field import TsField
+from py2ts_generator.typescript_model_compiler.ts_object_type import TsObjectType
+
+
+@dataclass
+class Address:
+    street: str
+    number: Optional[int]
+
+
+@dataclass
+class Customer:
+    name: str
+    addresses: List[Address]
+
+
+def _generate(types, session=None):
+    builder = TypeGenerationPipelineBuilder().for_types(types)
+    if session:
+        builder.with_session(session)
+    return builder.build_in_memory().generate().text
+
+
+def _parsed_classes(parse):
+    return [x.args[1] for x in parse.call_args_list]
+
+
+@pytest.fixture
+def parse():
+    with mock.patch.object(
+        DataclassParser, "parse", autospec=True, side_effect=DataclassParser.parse
+    ) as parse:
+        yield parse
+
+
+def test_pipelines_reuse_the_session_caches(parse):
+    session = GenerationSession()
+
+    first = _generate([Customer], session)
+    second = _generate([Customer], session)
+
+    assert _parsed_classes(parse).count(Customer) == 1
+    assert _parsed_classes(parse).count(Address) == 1
+    assert first == second == _generate([Customer])
+
+
+def test_classes_are_collected_with_their_entries():
+    session = GenerationSession()
+    cls = make_dataclass("Temporary", [("value", int), ("child", Address)])
+    _generate([cls], session)
+    assert len(session.model_parser.parsed_classes) == 2
+    cls_ref = weakref.ref(cls)
+
+    del cls
+    gc.collect()
+
+    assert cls_ref() is None
+    assert len(session.model_parser.parsed_classes) == 1
+
+
+def test_invalidate_module_drops_entries_of_the_module(parse):
+    session = GenerationSession()
+    cls = make_dataclass("Reloaded", [("address", Address)])
+    cls.__module__ = "reloaded_module"
+    _generate([cls], session)
+
+    session.invalidate_module("reloaded_module")
+    _generate([cls], session)
+
+    assert _parsed_classes(parse).count(cls) == 2
+    assert _parsed_classes(parse).count(Address) == 1
+
+
+def test_invalidate_type_and_clear(parse):
+    session = GenerationSession()
+    _generate([Customer], session)
+
+    session.invalidate_type(Customer)
+    _generate([Customer], session)
+    session.clear()
+    _generate([Customer], session)
+
+    assert _parsed_classes(parse).count(Customer) == 3
+    assert _parsed_classes(parse).count(Address) == 2
+
+
+def test_compiled_classes_only_hit_for_equal_parsed_classes():
+    classes = GenerationSession().compiler_cache("settings").classes
+    py_class = PyClass(name="Address", type=Address, fields=())
+    ts_type = TsObjectType(name="Address", fields=())
+    classes[py_class] = ts_type
+
+    changed_class = PyClass(
+        name="Address", type=Address, fields=(PyField(name="street", type=str),)
+    )
+    assert classes.get(py_class) == ts_type
+    assert classes.get(changed_class) is None
+
+
+def test_does_not_cache_types_which_cannot_be_referenced_weakly():
+    session = GenerationSession()
+    types = session.compiler_cache("settings").types
+    classes = session.compiler_cache("settings").classes
+    py_class = PyClass(
+        name="Address", type=Address, fields=(PyField(name="number", type=int | None),)
+    )
+
+    types[(int | None, False)] = TsField(name="unused", type=None)  # type: ignore
+    classes[py_class] = TsObjectType(name="Address", fields=())
+
+    assert (int | None, False) not in types
+    assert classes.get(py_class) is None
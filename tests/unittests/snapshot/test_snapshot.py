@@ -0,0 +1,238 @@
+import json
+from typing import Literal
+
+import pytest
+from ordered_set import OrderedSet
+
+from py2ts_generator.fingerprint.fingerprint import compute_model_fingerprint
+from py2ts_generator.model.model import Model
+from py2ts_generator.model.py_class import PyClass
+from py2ts_generator.model.py_enum import PyEnum, PyEnumValue
+from py2ts_generator.model.py_field import PyField
+from py2ts_generator.snapshot.snapshot import (
+    SnapshotValue,
+    SymbolicType,
+    UnsupportedSnapshot,
+    UnsupportedSnapshotType,
+    model_from_bytes,
+    model_from_json,
+    model_to_bytes,
+    model_to_json,
+    ts_model_from_bytes,
+    ts_model_from_json,
+    ts_model_to_bytes,
+    ts_model_to_json,
+)
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+from tests.unittests.fixture_classes import (
+    ClassWithEmptyClass,
+    EmptyClass,
+    SimpleIntEnum,
+    PY_CLASS_FOR_CLASS_WITH_DEEP_NESTED_GENERICS,
+    PY_CLASS_FOR_CLASS_WITH_EMPTY_CLASS,
+    PY_CLASS_FOR_CLASS_WITH_GENERIC_MEMBER,
+    PY_CLASS_FOR_CLASS_WITH_LIST_OF_OPTIONAL_EMPTY_CLASS,
+    PY_CLASS_FOR_CLASS_WITH_OPTIONAL_INT,
+    PY_CLASS_FOR_CLASS_WITH_STR_STR_DICT,
+    PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_MULTIPLE_CHILDREN,
+    PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_MULTIPLE_CHILDREN_CHILD_1,
+    PY_ENUM_FOR_SIMPLE_INT_ENUM,
+    PY_ENUM_FOR_SIMPLE_STR_ENUM,
+)
+
+MODEL = Model(
+    classes=OrderedSet(
+        [
+            PY_CLASS_FOR_CLASS_WITH_EMPTY_CLASS,
+            PY_CLASS_FOR_CLASS_WITH_DEEP_NESTED_GENERICS,
+            PY_CLASS_FOR_CLASS_WITH_GENERIC_MEMBER,
+            PY_CLASS_FOR_CLASS_WITH_LIST_OF_OPTIONAL_EMPTY_CLASS,
+            PY_CLASS_FOR_CLASS_WITH_OPTIONAL_INT,
+            PY_CLASS_FOR_CLASS_WITH_STR_STR_DICT,
+            PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_MULTIPLE_CHILDREN,
+            PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_MULTIPLE_CHILDREN_CHILD_1,
+        ]
+    ),
+    enums=OrderedSet([PY_ENUM_FOR_SIMPLE_INT_ENUM, PY_ENUM_FOR_SIMPLE_STR_ENUM]),
+)
+
+
+def _compile(model, type_overrides=None):
+    return TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(type_mapping_overrides=type_overrides or {})
+    ).compile(model)
+
+
+@pytest.mark.parametrize(
+    "dump,load", [(model_to_json, model_from_json), (model_to_bytes, model_from_bytes)]
+)
+class TestModelSnapshot:
+    def test_loads_user_classes_as_symbolic_types(self, dump, load):
+        snapshot = load(dump(MODEL))
+
+        py_class = snapshot.model.classes[0]
+        assert py_class.type == SymbolicType(
+            "tests.unittests.fixture_classes", "ClassWithEmptyClass"
+        )
+        assert py_class.fields[0].type.__name__ == "EmptyClass"
+
+    def test_loaded_model_compiles_to_same_ts_model(self, dump, load):
+        snapshot = load(dump(MODEL))
+
+        assert _compile(snapshot.model) == _compile(MODEL)
+
+    def test_loaded_model_has_same_fingerprint(self, dump, load):
+        snapshot = load(dump(MODEL))
+
+        assert compute_model_fingerprint(
+            snapshot.model, {}
+        ) == compute_model_fingerprint(MODEL, {})
+
+    def test_resolve_types_imports_classes(self, dump, load):
+        snapshot = load(dump(MODEL), resolve_types=True)
+
+        assert snapshot.model.classes[0].type is ClassWithEmptyClass
+        assert snapshot.model.classes[0].fields[0].type is EmptyClass
+        assert snapshot.model.enums[0].type is SimpleIntEnum
+
+    def test_type_overrides_are_kept(self, dump, load):
+        type_overrides = {int: str, EmptyClass: int}
+
+        snapshot = load(dump(MODEL, type_overrides))
+
+        assert _compile(snapshot.model, snapshot.type_overrides) == _compile(
+            MODEL, type_overrides
+        )
+
+    def test_enum_values_which_are_not_scalars_are_kept_as_repr(self, dump, load):
+        model = Model(
+            enums=OrderedSet(
+                [
+                    PyEnum(
+                        name="MyEnum",
+                        type=EmptyClass,
+                        values=(PyEnumValue(name="A", value=(1, 2)),),
+                    )
+                ]
+            )
+        )
+
+        snapshot = load(dump(model))
+
+        assert snapshot.model.enums[0].values[0].value == SnapshotValue("(1, 2)")
+
+    def test_field_aliases_are_kept(self, dump, load):
+        py_class = PyClass(
+            name="Aliased",
+            type=EmptyClass,
+            fields=(
+                PyField(name="created_at", type=str, alias="creationDate"),
+                PyField(name="updated_at", type=str),
+            ),
+        )
+
+        snapshot = load(dump(Model.of_classes([py_class])))
+
+        assert [x.alias for x in snapshot.model.classes[0].fields] == [
+            "creationDate",
+            None,
+        ]
+
+
+@pytest.mark.parametrize(
+    "dump,load",
+    [(ts_model_to_json, ts_model_from_json), (ts_model_to_bytes, ts_model_from_bytes)],
+)
+def test_ts_model_round_trip(dump, load):
+    ts_model = _compile(MODEL)
+
+    assert load(dump(ts_model)) == ts_model
+
+
+def test_unsupported_type_raises():
+    model = Model.of_classes(
+        [
+            PyClass(
+                name="EmptyClass",
+                type=EmptyClass,
+                fields=(PyField(name="value", type=Literal["a"]),),  # type: ignore
+            )
+        ]
+    )
+
+    with pytest.raises(UnsupportedSnapshotType):
+        model_to_json(model)
+
+
+def test_loading_other_version_raises():
+    text = model_to_json(MODEL).replace('"version":4', '"version":999')
+
+    with pytest.raises(UnsupportedSnapshot):
+        model_from_json(text)
+
+
+def test_loads_version_2_snapshots_with_inline_fields():
+    text = json.dumps(
+        {
+            "format": "py2ts-snapshot",
+            "version": 2,
+            "kind": "model",
+            "types": [
+                ["c", "tests.unittests.fixture_classes", "EmptyClass"],
+                ["c", "builtins", "int"],
+            ],
+            "classes": [
+                ["First", 0, [["id", 1], ["value", 1, "theValue"]], None],
+                ["Second", 0, [["id", 1]], None],
+            ],
+            "enums": [],
+            "type_overrides": [],
+        }
+    )
+
+    snapshot = model_from_json(text)
+
+    first, second = snapshot.model.classes
+    assert first.fields == (
+        PyField(name="id", type=int),
+        PyField(name="value", type=int, alias="theValue"),
+    )
+    assert second.fields[0] is first.fields[0]
+
+
+def test_loads_version_3_ts_model_snapshots_with_inline_fields():
+    text = json.dumps(
+        {
+            "format": "py2ts-snapshot",
+            "version": 3,
+            "kind": "ts_model",
+            "types": [["t", "number", False]],
+            "declarations": [
+                ["o", "First", [["id", 0], ["value", 0]], None],
+                ["u", "Union", ["First", "Second"]],
+                ["o", "Second", [["id", 0]], ["type", "second"]],
+            ],
+            "enums": [],
+        }
+    )
+
+    ts_model = ts_model_from_json(text)
+
+    first, union, second = ts_model.types
+    assert [x.name for x in first.fields] == ["id", "value"]
+    assert union.union_members == ("First", "Second")
+    assert second.fields[0] is first.fields[0]
+    assert second.discriminator.value == "second"
+
+
+def test_loading_ts_model_snapshot_as_model_raises():
+    with pytest.raises(UnsupportedSnapshot):
+        model_from_json(ts_model_to_json(_compile(MODEL)))
+
+
+def test_loading_invalid_bytes_raises():
+    with pytest.raises(UnsupportedSnapshot):
+        model_from_bytes(b"not a snapshot")
@@ -0,0 +1,109 @@
+import json
+import os
+
+from py2ts_generator import __version__
+from py2ts_generator.source_manifest.source_manifest import (
+    SourceManifest,
+    check_manifest,
+    manifest_path_for,
+)
+
+
+def _write_manifest(tmp_path):
+    source_file = tmp_path / "models.py"
+    source_file.write_text("class A:\n    pass\n")
+    output_file = tmp_path / "out" / "types.ts"
+    output_file.parent.mkdir()
+    output_file.write_text("export interface A {\n}\n")
+    manifest_path = manifest_path_for(output_file)
+    SourceManifest.of_files(
+        output_file, [str(source_file)], manifest_path, "settings"
+    ).write(manifest_path)
+    return source_file, output_file, manifest_path
+
+
+def test_manifest_path_is_next_to_output_file():
+    assert manifest_path_for("out/types.ts") == "out/types.ts.manifest.json"
+
+
+def test_manifest_records_paths_relative_to_manifest(tmp_path):
+    _, _, manifest_path = _write_manifest(tmp_path)
+
+    manifest = SourceManifest.read(manifest_path)
+
+    assert manifest.output.path == "types.ts"
+    assert [x.path for x in manifest.sources] == [os.path.join("..", "models.py")]
+
+
+def test_unchanged_files_are_fresh(tmp_path):
+    _, _, manifest_path = _write_manifest(tmp_path)
+
+    assert check_manifest(manifest_path) is None
+
+
+def test_touched_but_unchanged_file_is_fresh(tmp_path):
+    source_file, _, manifest_path = _write_manifest(tmp_path)
+    os.utime(source_file, ns=(0, 0))
+
+    assert check_manifest(manifest_path) is None
+
+
+def test_changed_source_file_is_stale(tmp_path):
+    source_file, _, manifest_path = _write_manifest(tmp_path)
+    source_file.write_text("class B:\n    pass\n")
+    os.utime(source_file, ns=(0, 0))
+
+    assert "changed in content" in check_manifest(manifest_path)
+
+
+def test_resized_source_file_is_stale(tmp_path):
+    source_file, _, manifest_path = _write_manifest(tmp_path)
+    source_file.write_text("class MyClass:\n    pass\n")
+
+    assert "changed in size" in check_manifest(manifest_path)
+
+
+def test_deleted_output_file_is_stale(tmp_path):
+    _, output_file, manifest_path = _write_manifest(tmp_path)
+    output_file.unlink()
+
+    assert "does not exist" in check_manifest(manifest_path)
+
+
+def test_missing_manifest_is_stale(tmp_path):
+    assert "does not exist" in check_manifest(tmp_path / "missing.manifest.json")
+
+
+def test_manifest_records_generator_version_and_settings(tmp_path):
+    _, _, manifest_path = _write_manifest(tmp_path)
+
+    manifest = SourceManifest.read(manifest_path)
+
+    assert manifest.generator_version == __version__
+    assert manifest.settings_fingerprint == "settings"
+
+
+def test_manifest_of_other_generator_version_is_stale(tmp_path):
+    _, _, manifest_path = _write_manifest(tmp_path)
+    with open(manifest_path) as f:
+        content = json.load(f)
+    content["generator_version"] = "0.0.1"
+    with open(manifest_path, "w") as f:
+        json.dump(content, f)
+
+    assert "written by version 0.0.1" in check_manifest(manifest_path)
+
+
+def test_manifest_of_other_settings_is_stale(tmp_path):
+    _, _, manifest_path = _write_manifest(tmp_path)
+
+    assert check_manifest(manifest_path, "settings") is None
+    assert "other pipeline settings" in check_manifest(manifest_path, "other")
+
+
+def test_manifest_with_unknown_version_is_stale(tmp_path):
+    _, _, manifest_path = _write_manifest(tmp_path)
+    with open(manifest_path, "w") as f:
+        json.dump({"version": 999}, f)
+
+    assert "invalid" in check_manifest(manifest_path)
@@ -0,0 +1,116 @@
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional
+
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.observer.observer import ObserverGroup
+from py2ts_generator.tracing.tracing import SpanRecorder
+from py2ts_generator.typescript_emitter.typescript_emitter import TypescriptEmitter
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Leaf:
+    color: Color
+
+
+@dataclass
+class Root:
+    leaves: List[Leaf]
+    first: Optional[Leaf]
+
+
+def _spans(recorder, category):
+    return [x for x in recorder.events if x["cat"] == category]
+
+
+def _contains(outer, inner):
+    return (
+        outer["tid"] == inner["tid"]
+        and outer["ts"] <= inner["ts"]
+        and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    )
+
+
+def test_records_nested_spans():
+    recorder = SpanRecorder()
+
+    with recorder.span("outer", "test"):
+        with recorder.span("inner", "test", {"size": 1}):
+            pass
+
+    inner, outer = recorder.events
+    assert (outer["name"], inner["name"]) == ("outer", "inner")
+    assert outer["ph"] == inner["ph"] == "X"
+    assert inner["args"] == {"size": 1}
+    assert "args" not in outer
+    assert _contains(outer, inner)
+
+
+def test_records_stages():
+    recorder = SpanRecorder()
+
+    with ObserverGroup([recorder]).stage("parse"):
+        pass
+
+    (span,) = recorder.events
+    assert (span["name"], span["cat"]) == ("parse", "stage")
+
+
+def test_parser_spans_nest_discovered_classes():
+    recorder = SpanRecorder()
+
+    ModelParser(
+        [Root], [DataclassParser()], ModelParserSettings(), span_recorder=recorder
+    ).parse()
+
+    parse_spans = {x["name"]: x for x in _spans(recorder, "parse")}
+    assert {"Root", "Leaf", "Color", "DataclassParser.parse"} <= set(parse_spans)
+    assert _contains(parse_spans["Root"], parse_spans["Leaf"])
+    assert _contains(parse_spans["Leaf"], parse_spans["Color"])
+    dispatches = [x for x in _spans(recorder, "parse") if x["name"].endswith(".parse")]
+    assert sorted(x["args"]["class"] for x in dispatches) == ["Leaf", "Root"]
+
+
+def test_compiler_and_emitter_record_a_span_per_declaration():
+    recorder = SpanRecorder()
+    model = ModelParser([Root], [DataclassParser()], ModelParserSettings()).parse()
+
+    ts_model = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(), span_recorder=recorder
+    ).compile(model)
+    TypescriptEmitter(span_recorder=recorder).emit(ts_model)
+
+    assert sorted(x["name"] for x in _spans(recorder, "compile")) == [
+        "Color",
+        "Leaf",
+        "Root",
+    ]
+    assert sorted(x["name"] for x in _spans(recorder, "emit")) == [
+        "Color",
+        "Leaf",
+        "Root",
+    ]
+
+
+def test_writes_chrome_trace(tmp_path):
+    recorder = SpanRecorder()
+    with recorder.span("outer", "test"):
+        pass
+
+    recorder.write(tmp_path / "trace.json")
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    assert [x["name"] for x in trace["traceEvents"]] == ["outer"]
@@ -0,0 +1,125 @@
+from dataclasses import dataclass, make_dataclass
+from enum import Enum
+from typing import List, Optional
+
+from py2ts_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py2ts_generator.model_parser.model_parser import ModelParser, ModelParserSettings
+from py2ts_generator.type_costs.type_costs import (
+    Discovery,
+    EdgeKind,
+    TypeCostRecorder,
+)
+from py2ts_generator.typescript_emitter.typescript_emitter import TypescriptEmitter
+from py2ts_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Leaf:
+    color: Color
+
+
+@dataclass
+class Branch:
+    leaves: List[Leaf]
+
+
+@dataclass
+class Root:
+    branch: Optional[Branch]
+
+
+@dataclass
+class TaggedUnionRoot:
+    __json_type_info_attribute__ = "type"
+
+
+@dataclass
+class TaggedUnionChild(TaggedUnionRoot):
+    type = "child"
+
+
+def _item_class(**fields):
+    # Classes of the same name, like in different modules.
+    return make_dataclass("Item", list(fields.items()))
+
+
+FirstItem = _item_class(value=int)
+SecondItem = _item_class(value=str, count=int)
+
+
+@dataclass
+class Pair:
+    first: FirstItem  # type: ignore
+    second: SecondItem  # type: ignore
+
+
+def _report(types):
+    type_costs = TypeCostRecorder()
+    model = ModelParser(
+        types, [DataclassParser()], ModelParserSettings(), type_costs=type_costs
+    ).parse()
+    ts_model = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(), type_costs=type_costs
+    ).compile(model)
+    output = TypescriptEmitter(type_costs=type_costs).emit(ts_model)
+    return type_costs.report(), output
+
+
+def test_records_discovery_paths():
+    report, _ = _report([Root])
+    costs = {x.name: x for x in report.types}
+
+    assert set(costs) == {"Root", "Branch", "Leaf", "Color"}
+    assert costs["Root"].edge is EdgeKind.ROOT
+    assert [(x.edge, x.field_name) for x in costs["Leaf"].path] == [
+        (EdgeKind.ROOT, None),
+        (EdgeKind.FIELD, "branch"),
+        (EdgeKind.OPTIONAL, None),
+        (EdgeKind.FIELD, "leaves"),
+        (EdgeKind.GENERIC, None),
+    ]
+    assert costs["Color"].path[-1] == Discovery(Color, Leaf, EdgeKind.FIELD, "color")
+    assert report.why("Color").startswith("Root -branch-> Optional[")
+    assert report.why("Color").endswith("-generic-> Leaf -color-> Color")
+    assert report.why("Missing") is None
+
+
+def test_records_tagged_union_edges():
+    report, _ = _report([TaggedUnionChild])
+    costs = {x.name: x for x in report.types}
+
+    assert costs["TaggedUnionRoot"].edge is EdgeKind.PARENT
+    assert report.why("TaggedUnionRoot") == (
+        "TaggedUnionChild -parent-> TaggedUnionRoot"
+    )
+
+
+def test_records_costs_per_type():
+    report, output = _report([Root])
+
+    for cost in report.types:
+        assert cost.parse_time >= 0
+        assert cost.compile_time > 0
+        assert cost.emitted_size > 0
+    assert report.emitted_size == len(output.encode("utf-8"))
+    lines = report.summary(top=2).splitlines()
+    assert len(lines) == 2
+    assert "ms parse" in lines[0]
+
+
+def test_records_costs_of_classes_with_the_same_name_separately():
+    report, output = _report([Pair])
+    costs = {x.type: x for x in report.types}
+
+    assert costs[FirstItem].emitted_size > 0
+    assert costs[SecondItem].emitted_size > costs[FirstItem].emitted_size
+    assert report.emitted_size == len(output.encode("utf-8"))
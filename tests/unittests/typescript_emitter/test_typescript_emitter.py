@@ -1,14 +1,20 @@
 from typing import List
 
+from ordered_set import OrderedSet
+
 from py2ts_generator.typescript_emitter.typescript_emitter import (
     TypescriptEmitter,
 )
 from py2ts_generator.typescript_model_compiler.ts_enum import TsEnum
+from py2ts_generator.typescript_model_compiler.ts_field import TsField
 from py2ts_generator.typescript_model_compiler.ts_model import TsModel
 from py2ts_generator.typescript_model_compiler.ts_object_type import (
+    TsDiscriminator,
     TsObjectType,
     TsBaseType,
+    TsUnionType,
 )
+from py2ts_generator.typescript_model_compiler.well_known_types import TS_STRING
 from tests.unittests.fixture_classes import ClassFixture, EnumFixture
 
 
@@ -90,6 +96,27 @@ def test_emit_class_with_optional_int(class_with_optional_int: ClassFixture) ->
     )
 
 
+def test_emit_quotes_names_which_are_not_identifiers() -> None:
+    ts_object_type = TsObjectType(
+        name="Event",
+        fields=(
+            TsField(name="created-at", type=TS_STRING),
+            TsField(name="$id", type=TS_STRING.with_is_optional(True)),
+        ),
+        discriminator=TsDiscriminator(name="event-type", value="CREATED"),
+    )
+
+    assert (
+        _emit_object(ts_object_type)
+        == """export interface Event {
+    "created-at": string
+    $id?: string
+    "event-type": "CREATED"
+}
+"""
+    )
+
+
 def test_emit_class_with_optional_empty_class(
     class_with_optional_empty_class: ClassFixture,
 ) -> None:
@@ -197,3 +224,29 @@ class TestEmitDiscriminantUnion:
 }
 """
         )
+
+
+def test_parallel_emit_matches_serial_emit(
+    class_with_str_list: ClassFixture,
+    simple_str_enum: EnumFixture,
+) -> None:
+    ts_model = TsModel(
+        types=OrderedSet(
+            [
+                *(
+                    TsObjectType(
+                        name=f"Class{i}",
+                        fields=class_with_str_list.ts_object_type.fields,
+                    )
+                    for i in range(20)
+                ),
+                TsUnionType(name="Union", union_members=("Class0", "Class1")),
+            ]
+        ),
+        enums=OrderedSet([simple_str_enum.ts_enum]),
+    )
+
+    serial = TypescriptEmitter().emit(ts_model)
+    parallel = TypescriptEmitter(max_workers=2, parallel_threshold=0).emit(ts_model)
+
+    assert parallel == serial
@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pytest
 from ordered_set import OrderedSet
@@ -8,6 +9,7 @@ from py2ts_generator.model.model import Model
 from py2ts_generator.model.py_class import PyClass
 from py2ts_generator.model.py_enum import PyEnum, PyEnumValue
 from py2ts_generator.model.py_field import PyField
+from py2ts_generator.typescript_model_compiler import typescript_model_compiler
 from py2ts_generator.typescript_model_compiler.ts_field import TsField
 from py2ts_generator.typescript_model_compiler.ts_model import TsModel
 from py2ts_generator.typescript_model_compiler.ts_object_type import (
@@ -234,6 +236,39 @@ def test_should_convert_casing_to_camel_case(class_with_empty_class):
     )
 
 
+@pytest.mark.parametrize(
+    "case_format, name",
+    [
+        (CaseFormat.KEEP_CASING, "created_at"),
+        (CaseFormat.CAMEL_CASE, "createdAt"),
+        (CaseFormat.PASCAL_CASE, "CreatedAt"),
+        (CaseFormat.KEBAB_CASE, "created-at"),
+    ],
+)
+def test_should_convert_casing_to_case_format(case_format, name):
+    py_class = PyClass(
+        name="Entity",
+        type=object,
+        fields=(
+            PyField(name="created_at", type=str),
+            PyField(name="updated_at", type=str, alias="lastUpdate"),
+        ),
+    )
+    compiler = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(field_case_format=case_format)
+    )
+
+    ts_type = compiler.compile_class(py_class)
+
+    assert ts_type == TsObjectType(
+        name="Entity",
+        fields=(
+            TsField(name=name, type=TS_STRING),
+            TsField(name="lastUpdate", type=TS_STRING),
+        ),
+    )
+
+
 def test_type_with_override_should_compile_to_overriden_type(
     class_with_empty_class: ClassFixture, empty_class: ClassFixture
 ) -> None:
@@ -290,3 +325,79 @@ class TestCompileTaggedUnion:
                 )
             ]
         )
+
+
+def _classes_with_fields(count):
+    return [
+        PyClass(
+            name=f"Class{i}",
+            type=type(f"Class{i}", (), {}),
+            fields=(
+                PyField(name="some_value", type=Dict[str, int]),
+                PyField(name=f"field_{i}", type=Optional[List[str]]),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _spy_on_thread_pools(monkeypatch):
+    chunk_sizes = []
+
+    class SpyingThreadPoolExecutor(ThreadPoolExecutor):
+        def map(self, fn, *iterables, **kwargs):
+            chunks = list(iterables[0])
+            chunk_sizes.extend(len(x) for x in chunks)
+            return super().map(fn, chunks, **kwargs)
+
+    monkeypatch.setattr(
+        typescript_model_compiler, "ThreadPoolExecutor", SpyingThreadPoolExecutor
+    )
+    return chunk_sizes
+
+
+@pytest.mark.parametrize("class_count", [2, 7, 50, 101])
+def test_threaded_compile_matches_serial_compile(monkeypatch, class_count):
+    chunk_sizes = _spy_on_thread_pools(monkeypatch)
+    model = Model.of_classes(_classes_with_fields(class_count))
+    settings = TypescriptModelCompilerSettings(field_case_format=CaseFormat.CAMEL_CASE)
+
+    serial = TypescriptModelCompiler(settings).compile(model)
+    threaded = TypescriptModelCompiler(
+        settings, max_workers=4, force_threads=True
+    ).compile(model)
+
+    # The classes were compiled in chunks on the pool, every class exactly once.
+    assert len(chunk_sizes) > 1
+    assert sum(chunk_sizes) == class_count
+    assert threaded == serial
+    assert [x.name for x in threaded.types] == [x.name for x in serial.types]
+
+
+def test_compile_uses_threads_without_the_gil(monkeypatch):
+    monkeypatch.setattr(typescript_model_compiler, "is_gil_enabled", lambda: False)
+    chunk_sizes = _spy_on_thread_pools(monkeypatch)
+    model = Model.of_classes(_classes_with_fields(10))
+    settings = TypescriptModelCompilerSettings()
+
+    threaded = TypescriptModelCompiler(settings, max_workers=2).compile(model)
+
+    assert sum(chunk_sizes) == 10
+    assert threaded == TypescriptModelCompiler(settings).compile(model)
+
+
+def test_compile_is_serial_with_the_gil(monkeypatch):
+    monkeypatch.setattr(typescript_model_compiler, "is_gil_enabled", lambda: True)
+    monkeypatch.setattr(typescript_model_compiler, "ThreadPoolExecutor", None)
+    model = Model.of_classes(
+        [
+            PyClass(name=f"Class{i}", type=type(f"Class{i}", (), {}), fields=())
+            for i in range(3)
+        ]
+    )
+
+    ts_model = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(), max_workers=4
+    ).compile(model)
+
+    assert [x.name for x in ts_model.types] == ["Class0", "Class1", "Class2"]